@@ -0,0 +1,112 @@
+from typing import Callable, Dict
+
+import numpy as np
+
+from linen.path.circular_arc import (
+    circular_arc_orientation_path,
+    circular_arc_path,
+    circular_arc_position_path,
+    circular_arc_position_trajectory,
+    circular_arc_trajectory,
+)
+from linen.path.combine import combine_orientation_and_position_paths
+from linen.path.constant import constant_trajectory
+from linen.path.linear import (
+    linear_constant_orientation_trajectory,
+    linear_path,
+    linear_slerp_trajectory,
+    linear_trajectory,
+)
+from linen.path.path import Path
+from linen.path.polynomial.bezier import cubic_bezier_path, quadratic_bezier_path
+from linen.path.polynomial.bspline import bspline_path
+from linen.path.polynomial.cardinal import cardinal_path
+from linen.path.polynomial.catmull_rom import catmull_rom_path
+from linen.path.polynomial.hermite import hermite_path
+from linen.path.pose_interpolation import pose_interpolation_trajectory
+from linen.path.reparametrization.minimum_jerk import minimum_jerk_path
+from linen.path.reparametrization.profiled import profiled_path
+from linen.path.reparametrization.s_curve import s_position_path
+from linen.path.reparametrization.speed import scale_speed
+from linen.path.reparametrization.trapezoidal import trapezoidal_position_path, trapezoidal_profile_path
+from linen.path.slerp import slerp_trajectory
+from linen.path.split import split_pose_path
+
+# Scalar evaluation is timed over SCALAR_SAMPLES calls of path(t), batch evaluation with one path.sample() call of
+# BATCH_SAMPLES times, so the per-sample cost of both can be compared.
+SCALAR_SAMPLES = 100
+BATCH_SAMPLES = 1000
+
+POINTS = [np.array(point, dtype=np.float64) for point in [[0, 0, 0], [0.3, 0.1, 0.2], [0.5, -0.2, 0.1], [0.8, 0, 0.4]]]
+ORIENTATION = np.eye(3)
+ROTATED_ORIENTATION = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+POSE = np.identity(4)
+ROTATED_POSE = np.identity(4)
+ROTATED_POSE[:3, :3] = ROTATED_ORIENTATION
+ROTATED_POSE[:3, 3] = POINTS[3]
+CENTER = np.array([0.0, 0.2, 0.0])
+AXIS = np.array([1.0, 0.0, 0.0])
+
+
+def pose_trajectory() -> Path:
+    return linear_slerp_trajectory(POSE, ROTATED_POSE, speed=0.2)
+
+
+BUILDERS: Dict[str, Callable[[], Path]] = {
+    "linear_path": lambda: linear_path(POINTS[0], POINTS[1]),
+    "linear_trajectory": lambda: linear_trajectory(POINTS[0], POINTS[1], speed=0.2),
+    "linear_constant_orientation_trajectory": lambda: linear_constant_orientation_trajectory(
+        POINTS[0], POINTS[1], ORIENTATION, speed=0.2
+    ),
+    "linear_slerp_trajectory": pose_trajectory,
+    "constant_trajectory": lambda: constant_trajectory(POSE, duration=1.0),
+    "slerp_trajectory": lambda: slerp_trajectory([0.0, 1.0], [ORIENTATION, ROTATED_ORIENTATION]),
+    "circular_arc_position_path": lambda: circular_arc_position_path(POINTS[0], CENTER, AXIS, np.pi),
+    "circular_arc_orientation_path": lambda: circular_arc_orientation_path(ORIENTATION, AXIS, np.pi),
+    "circular_arc_path": lambda: circular_arc_path(POSE, CENTER, AXIS, np.pi),
+    "circular_arc_position_trajectory": lambda: circular_arc_position_trajectory(POINTS[0], CENTER, AXIS, np.pi, 0.2),
+    "circular_arc_trajectory": lambda: circular_arc_trajectory(POSE, CENTER, AXIS, np.pi, 0.2),
+    "combine_orientation_and_position_paths": lambda: combine_orientation_and_position_paths(
+        slerp_trajectory([0.0, 1.0], [ORIENTATION, ROTATED_ORIENTATION]), linear_path(POINTS[0], POINTS[1])
+    ),
+    "pose_interpolation_trajectory": lambda: pose_interpolation_trajectory(
+        [0.0, 1.0, 2.0], [POSE, ROTATED_POSE, POSE], mode="screw"
+    ),
+    "split_pose_path": lambda: split_pose_path(pose_trajectory())[1],
+    "quadratic_bezier_path": lambda: quadratic_bezier_path(*POINTS[:3]),
+    "cubic_bezier_path": lambda: cubic_bezier_path(*POINTS),
+    "hermite_path": lambda: hermite_path(*POINTS),
+    "bspline_path": lambda: bspline_path(*POINTS),
+    "catmull_rom_path": lambda: catmull_rom_path(POINTS),
+    "cardinal_path": lambda: cardinal_path(POINTS, scale=0.3),
+    "minimum_jerk_path": minimum_jerk_path,
+    "trapezoidal_position_path": trapezoidal_position_path,
+    "trapezoidal_profile_path": lambda: trapezoidal_profile_path(1.0, max_velocity=0.5, max_acceleration=1.0),
+    "s_position_path": s_position_path,
+    "profiled_path": lambda: profiled_path(
+        circular_arc_position_path(POINTS[0], CENTER, AXIS, np.pi), minimum_jerk_path()
+    ),
+    "scale_speed": lambda: scale_speed(linear_trajectory(POINTS[0], POINTS[1], speed=0.2), 2.0),
+}
+
+
+class Builders:
+    """Building and evaluating every builder in linen.path, with both scalar and batch evaluation."""
+
+    params = sorted(BUILDERS)
+    param_names = ["builder"]
+
+    def setup(self, builder: str) -> None:
+        self.path = BUILDERS[builder]()
+        self.times = np.linspace(self.path.start_time, self.path.end_time, BATCH_SAMPLES)
+        self.scalar_times = np.linspace(self.path.start_time, self.path.end_time, SCALAR_SAMPLES).tolist()
+
+    def time_build(self, builder: str) -> None:
+        BUILDERS[builder]()
+
+    def time_scalar(self, builder: str) -> None:
+        for t in self.scalar_times:
+            self.path(t)
+
+    def time_batch(self, builder: str) -> None:
+        self.path.sample(self.times)
@@ -0,0 +1,84 @@
+import numpy as np
+
+from linen.path.concatenate import concatenate_trajectories
+from linen.path.linear import linear_trajectory
+from linen.path.polynomial.catmull_rom import catmull_rom_path
+from linen.path.reparametrization.arc_length import arc_length_parametrize
+from linen.path.reparametrization.minimum_jerk import minimum_jerk_path
+from linen.path.transformation.differentation import differentiated
+from linen.path.transformation.integration import integrated
+
+
+def random_points(amount: int) -> np.ndarray:
+    return np.random.default_rng(0).uniform(-1.0, 1.0, (amount, 3))
+
+
+class ConcatenateTrajectories:
+    """Building and evaluating concatenations of linear segments, to catch costs that grow with the segment count."""
+
+    params = [10, 100, 1000, 10000]
+    param_names = ["segments"]
+
+    def setup(self, segments: int) -> None:
+        points = random_points(segments + 1)
+        self.segments = [linear_trajectory(p0, p1, speed=0.5) for p0, p1 in zip(points[:-1], points[1:])]
+        self.trajectory = concatenate_trajectories(self.segments)
+        self.times = np.linspace(0.0, self.trajectory.duration, 1000)
+        self.scalar_times = self.times[::10].tolist()
+
+    def time_build(self, segments: int) -> None:
+        concatenate_trajectories(self.segments)
+
+    def time_scalar(self, segments: int) -> None:
+        for t in self.scalar_times:
+            self.trajectory(t)
+
+    def time_batch(self, segments: int) -> None:
+        self.trajectory.sample(self.times)
+
+
+class ArcLengthParametrize:
+    params = [10, 200]
+    param_names = ["waypoints"]
+
+    def setup(self, waypoints: int) -> None:
+        self.path = catmull_rom_path(list(random_points(waypoints)))
+        self.parametrized = arc_length_parametrize(self.path)
+        self.arc_lengths = np.linspace(0.0, self.parametrized.end_time, 1000)
+
+    def time_build(self, waypoints: int) -> None:
+        arc_length_parametrize(self.path)
+
+    def time_batch(self, waypoints: int) -> None:
+        self.parametrized.sample(self.arc_lengths)
+
+
+class Differentiated:
+    """Exact derivatives of a spline versus finite differences of an opaque path with the same values."""
+
+    params = ["exact", "finite_difference"]
+    param_names = ["method"]
+
+    def setup(self, method: str) -> None:
+        path = catmull_rom_path(list(random_points(10)))
+        if method == "finite_difference":
+            path = type(path)(path.function, path.start_time, path.end_time, batch_function=path.batch_function)
+        self.path = path
+        self.derivative = differentiated(path, 1)
+        self.times = np.linspace(path.start_time, path.end_time, 1000)
+
+    def time_build(self, method: str) -> None:
+        differentiated(self.path, 1)
+
+    def time_batch(self, method: str) -> None:
+        self.derivative.sample(self.times)
+
+
+class Integrated:
+    def setup(self) -> None:
+        self.integral = integrated(minimum_jerk_path())
+        self.times = np.linspace(0.0, 1.0, 100).tolist()
+
+    def time_scalar(self) -> None:
+        for t in self.times:
+            self.integral(t)
@@ -0,0 +1,59 @@
+import numpy as np
+
+from linen.folding.fold_lines.towel import towel_fold_line
+from linen.folding.trajectories.circular_fold import circular_fold_trajectory
+from linen.grasping.slide_grasp import slide_grasp_trajectory
+from linen.grasping.towel.towel_grasps import towel_aligned_grasps
+from linen.path.polynomial.catmull_rom import catmull_rom_path
+from linen.path.reparametrization.time_optimal import CartesianLimits, time_optimal_parametrization
+
+# A 60 x 40 cm towel lying flat on the table, its keypoints ordered counterclockwise.
+TOWEL_KEYPOINTS = [
+    np.array(point) for point in [[-0.3, -0.2, 0.0], [0.3, -0.2, 0.0], [0.3, 0.2, 0.0], [-0.3, 0.2, 0.0]]
+]
+
+# Twenty random waypoints in a cube of 1 m, like a planned path through a cluttered workspace.
+WAYPOINTS = list(np.random.default_rng(0).uniform(-0.5, 0.5, (20, 3)))
+
+
+def fold_trajectory():
+    grasp_location, approach_direction = towel_aligned_grasps(TOWEL_KEYPOINTS)[0]
+    return circular_fold_trajectory(grasp_location, approach_direction, towel_fold_line(TOWEL_KEYPOINTS))
+
+
+def grasp_trajectory():
+    grasp_location = np.array([0.3, -0.2, 0.0])
+    return slide_grasp_trajectory(grasp_location, np.array([0.0, 1.0, 0.0]))
+
+
+class Planners:
+    """End-to-end planning: building the trajectory from keypoints, then sampling it at a 500 Hz control rate."""
+
+    params = ["circular_fold_trajectory", "slide_grasp_trajectory"]
+    param_names = ["planner"]
+
+    def setup(self, planner: str) -> None:
+        self.planner = fold_trajectory if planner == "circular_fold_trajectory" else grasp_trajectory
+        self.trajectory = self.planner()
+        self.times = np.arange(0.0, self.trajectory.duration, 1 / 500)
+
+    def time_plan(self, planner: str) -> None:
+        self.planner()
+
+    def time_plan_and_sample(self, planner: str) -> None:
+        self.planner().sample(self.times)
+
+
+class TimeOptimal:
+    """Time-optimal parametrization of a Catmull-Rom path through 20 waypoints. The phase-plane passes are sequential
+    Python loops over the grid, so their cost grows linearly with the amount of grid points."""
+
+    params = [100, 1000]
+    param_names = ["num_points"]
+
+    def setup(self, num_points: int) -> None:
+        self.path = catmull_rom_path(WAYPOINTS)
+        self.limits = CartesianLimits(linear_velocity=0.5, linear_acceleration=1.0)
+
+    def time_parametrization(self, num_points: int) -> None:
+        time_optimal_parametrization(self.path, self.limits, num_points)
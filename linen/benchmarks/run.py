@@ -0,0 +1,140 @@
+"""Run the benchmark suite and print the timings, optionally writing them to a JSON baseline and comparing them
+against an older baseline.
+
+The benchmarks follow the conventions of asv (airspeed velocity): classes in bench_*.py modules with optional params,
+param_names and setup, whose time_* methods are timed. So they can also be run with asv, while this runner only
+needs numpy. From the directory that contains the benchmarks folder:
+
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --output new.json --compare baseline.json
+
+The comparison exits with status 1 when a benchmark became more than --threshold times slower. Running pytest on the
+benchmarks folder executes every benchmark once, which checks that they still run without timing them.
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import pkgutil
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import scipy
+
+BASELINE_VERSION = 1
+
+
+def benchmark_classes() -> Iterator[Tuple[str, type]]:
+    """All benchmark classes in the bench_*.py modules of this package, with their module name."""
+    package = importlib.import_module(__package__ or "benchmarks")
+    for module_info in sorted(pkgutil.iter_modules(package.__path__), key=lambda info: info.name):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__ and any(attribute.startswith("time_") for attribute in dir(cls)):
+                yield module_info.name, cls
+
+
+def parameter_combinations(cls: type) -> List[Tuple[Any, ...]]:
+    params = getattr(cls, "params", [])
+    if len(params) == 0:
+        return [()]
+    # Like asv, a single list of params is one parameter, a list of lists is a product of parameters.
+    if not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def benchmark_cases() -> Iterator[Tuple[str, Callable[[], Any], Callable[[], None]]]:
+    """Every benchmark case as (name, setup, timed function), e.g. bench_builders.Builders.time_batch(linear_path)."""
+    for module_name, cls in benchmark_classes():
+        methods = sorted(name for name in dir(cls) if name.startswith("time_"))
+        for parameters in parameter_combinations(cls):
+            for method in methods:
+                instance = cls()
+                arguments = ", ".join(str(parameter) for parameter in parameters)
+                name = f"{module_name}.{cls.__name__}.{method}({arguments})"
+
+                def setup(instance: Any = instance, parameters: Tuple[Any, ...] = parameters) -> None:
+                    if hasattr(instance, "setup"):
+                        instance.setup(*parameters)
+
+                timed = getattr(instance, method)
+                yield name, setup, (lambda timed=timed, parameters=parameters: timed(*parameters))
+
+
+def time_case(function: Callable[[], None], repeat: int, min_duration: float) -> Dict[str, float]:
+    """Time a function like timeit: calls per measurement are chosen to last at least min_duration seconds."""
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_duration or number >= 1_000_000:
+            break
+        number *= 10
+    durations = np.array(timer.repeat(repeat=repeat, number=number)) / number
+    return {"min": float(np.min(durations)), "median": float(np.median(durations)), "number": number}
+
+
+def run(pattern: Optional[str] = None, repeat: int = 5, min_duration: float = 0.05) -> Dict[str, Any]:
+    """Run all benchmarks whose name contains pattern and return the baseline as a JSON-serializable dict."""
+    results = {}
+    for name, setup, function in benchmark_cases():
+        if pattern is not None and pattern not in name:
+            continue
+        setup()
+        results[name] = time_case(function, repeat, min_duration)
+        print(f"{name:<90} {results[name]['median'] * 1e6:12.1f} us", flush=True)
+
+    environment = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+    }
+    return {"version": BASELINE_VERSION, "environment": environment, "results": results}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """The names of the benchmarks whose median time grew by more than the threshold factor."""
+    regressions = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        ratio = result["median"] / baseline["results"][name]["median"]
+        if ratio > threshold:
+            regressions.append(name)
+            print(f"REGRESSION {name}: {ratio:.2f}x slower", flush=True)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="JSON file to write the timings to, nothing is written without it.")
+    parser.add_argument("--compare", help="JSON baseline of an earlier run to compare against.")
+    parser.add_argument("--threshold", type=float, default=1.5, help="Slowdown factor reported as a regression.")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this string.")
+    parser.add_argument("--repeat", type=int, default=5, help="Amount of measurements per benchmark.")
+    arguments = parser.parse_args()
+
+    current = run(arguments.filter, arguments.repeat)
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(current, file, indent=2)
+
+    if arguments.compare is not None:
+        with open(arguments.compare) as file:
+            baseline = json.load(file)
+        if compare(baseline, current, arguments.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+import pytest
+from benchmarks.run import benchmark_cases
+
+CASES = list(benchmark_cases())
+
+
+@pytest.mark.parametrize("name, setup, function", CASES, ids=[name for name, _, _ in CASES])
+def test_benchmark_runs(name, setup, function):
+    setup()
+    function()
@@ -24,7 +24,7 @@ def add_path(path: Path, points_per_second: int = 10, endpoint=True, radius=0.00
         The object from which all spheres are instanced.
     """
     n = max(2, int(points_per_second * path.duration))
-    points = [path(t) for t in np.linspace(path.start_time, path.end_time, n, endpoint=endpoint)]
+    points = path.sample(np.linspace(path.start_time, path.end_time, n, endpoint=endpoint))
     point_template = add_points(points, radius, color)
     return point_template
 
@@ -42,7 +42,7 @@ def add_pose_path(path: Path, num_poses: int = 2, endpoint=True, size=0.1) -> bp
         The object from which all frames are instanced.
     """
     times = np.linspace(path.start_time, path.end_time, num_poses, endpoint=endpoint)
-    poses = [path(t) for t in times]
+    poses = path.sample(times)
     frame_template = add_frames(poses, size)
     return frame_template
 
@@ -80,7 +80,7 @@ def add_growing_path(path, radius=0.005, color=None):
     frame_interval = 1 / fps
     num_frames = int(np.ceil(path.duration / frame_interval))
 
-    curve_points = [path(t) for t in np.linspace(path.start_time, path.end_time, num_frames)]
+    curve_points = path.sample(np.linspace(path.start_time, path.end_time, num_frames))
     curve_mesh = add_discrete_curve_mesh(curve_points)
 
     if color is not None:
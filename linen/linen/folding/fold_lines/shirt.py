@@ -24,25 +24,24 @@ def shirt_sleeve_and_side_fold_line(
 
 
 
+    The keypoints and the other arguments broadcast over leading batch dimensions, e.g. keypoints with shape (B, 3)
+    give the fold lines of B shirts.
+
     Args:
-        keypoints: The keypoints of the shirt.
-        left: Whether to fold the left or right side.
-        offset_from_armpit_fraction: The fraction of the distance between the two armpits to offset the fold line
+        keypoints: The keypoints of the shirt, each with shape (..., 3).
+        left: Whether to fold the left or right side, shape (...).
+        offset_from_armpit_fraction: The fraction of the distance between the two armpits to offset the fold line,
+            shape (...).
 
     Returns:
-        The fold line as a tuple of a point and a direction vector.
+        The fold line as a tuple of a point and a direction vector, each with shape (..., 3).
 
     """
 
-    neck_left = keypoints["neck_left"]
-    shoulder_left = keypoints["shoulder_left"]
-    armpit_left = keypoints["armpit_left"]
-    waist_left = keypoints["waist_left"]
-
-    neck_right = keypoints["neck_right"]
-    shoulder_right = keypoints["shoulder_right"]
-    armpit_right = keypoints["armpit_right"]
-    waist_right = keypoints["waist_right"]
+    neck_left, neck_right = np.asarray(keypoints["neck_left"]), np.asarray(keypoints["neck_right"])
+    shoulder_left, shoulder_right = np.asarray(keypoints["shoulder_left"]), np.asarray(keypoints["shoulder_right"])
+    armpit_left, armpit_right = np.asarray(keypoints["armpit_left"]), np.asarray(keypoints["armpit_right"])
+    waist_left, waist_right = np.asarray(keypoints["waist_left"]), np.asarray(keypoints["waist_right"])
 
     top_left = (armpit_left + shoulder_left + neck_left) / 3
     top_right = (armpit_right + shoulder_right + neck_right) / 3
@@ -50,14 +49,16 @@ def shirt_sleeve_and_side_fold_line(
     bottom_center = (waist_left + waist_right) / 2
 
     bottom_to_top = top_center - bottom_center
-    bottom_to_top /= np.linalg.norm(bottom_to_top)
-
-    if left:
-        fold_line_point = armpit_left + offset_from_armpit_fraction * (armpit_right - armpit_left)
-        fold_line_direction = bottom_to_top
-    else:
-        fold_line_point = armpit_right + offset_from_armpit_fraction * (armpit_left - armpit_right)
-        fold_line_direction = -bottom_to_top
+    bottom_to_top = bottom_to_top / np.linalg.norm(bottom_to_top, axis=-1, keepdims=True)
+
+    # The fold line of the right side mirrors that of the left side.
+    left = np.asarray(left)[..., np.newaxis]
+    armpit_near = np.where(left, armpit_left, armpit_right)
+    armpit_far = np.where(left, armpit_right, armpit_left)
+    fold_line_point = armpit_near + np.asarray(offset_from_armpit_fraction)[..., np.newaxis] * (
+        armpit_far - armpit_near
+    )
+    fold_line_direction = np.where(left, bottom_to_top, -bottom_to_top)
 
     return fold_line_point, fold_line_direction
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 
@@ -25,29 +25,40 @@ def towel_fold_line(ordered_keypoints: List[np.ndarray], grasped_edge: int = 0):
         The fold line as a tuple of a point on the line and a direction vector.
     """
 
-    edges = [(0, 1), (1, 2), (2, 3), (3, 0)]  # edge 0, 1, 2, 3
+    points, directions = towel_fold_line_batch(np.array(ordered_keypoints)[np.newaxis], grasped_edge)
+    return points[0], directions[0]
 
-    towel_center = np.mean(ordered_keypoints, axis=0)
 
-    edge_directions = []
-    for edge in edges:
-        start, end = edge
-        edge_direction = ordered_keypoints[end] - ordered_keypoints[start]
-        edge_direction /= np.linalg.norm(edge_direction)
-        edge_directions.append(edge_direction)
+def towel_fold_line_batch(
+    ordered_keypoints: np.ndarray, grasped_edges: np.ndarray = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The fold lines of towel_fold_line for B towels at once.
+
+    Args:
+        ordered_keypoints: The keypoints of the towels ordered counterclockwise, shape (B, 4, 3).
+        grasped_edges: The edges that are grasped (must be between 0 and 3), a scalar or shape (B,).
+
+    Returns:
+        The points on the fold lines with shape (B, 3) and their directions with shape (B, 3).
+    """
+    ordered_keypoints = np.asarray(ordered_keypoints, dtype=np.float64)
+    towel_centers = np.mean(ordered_keypoints, axis=1)
+
+    # Edge i goes from keypoint i to keypoint i + 1.
+    edge_directions = np.roll(ordered_keypoints, -1, axis=1) - ordered_keypoints
+    edge_directions /= np.linalg.norm(edge_directions, axis=-1, keepdims=True)
 
     # Here we average the direction of the two edges parallel to the grasped edge.
     # Not that we need to flip some sign to make the sure the directions don't cancel out,
     # and such that the direction of rotation is correct.
-    if grasped_edge == 0:
-        fold_line_direction = (-edge_directions[0] + edge_directions[2]) / 2
-    elif grasped_edge == 1:
-        fold_line_direction = (-edge_directions[1] + edge_directions[3]) / 2
-    elif grasped_edge == 2:
-        fold_line_direction = (edge_directions[0] - edge_directions[2]) / 2
-    elif grasped_edge == 3:
-        fold_line_direction = (edge_directions[1] - edge_directions[3]) / 2
-
-    fold_line_direction /= np.linalg.norm(fold_line_direction)
-
-    return towel_center, fold_line_direction
+    towels = np.arange(len(ordered_keypoints))
+    grasped_edges = np.broadcast_to(grasped_edges, towels.shape)
+    parallel_edges = grasped_edges % 2
+    signs = np.where(grasped_edges < 2, -1.0, 1.0)[:, np.newaxis]
+    fold_line_directions = (
+        signs * (edge_directions[towels, parallel_edges] - edge_directions[towels, parallel_edges + 2]) / 2
+    )
+    fold_line_directions /= np.linalg.norm(fold_line_directions, axis=-1, keepdims=True)
+
+    return towel_centers, fold_line_directions
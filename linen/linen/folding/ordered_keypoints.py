@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 from airo_typing import Vector3DType
@@ -36,10 +36,25 @@ def get_counterclockwise_ordered_keypoints(keypoints: List[Vector3DType]) -> Lis
         The keypoints ordered counterclockwise.
 
     """
-    keypoints = np.array(keypoints)
-    center = np.mean(keypoints, axis=0)
-    x_axis = np.array([1, 0])
-    angles = [angle_2D(x_axis, keypoint - center) for keypoint in keypoints]
-    angles = [angle % (2 * np.pi) for angle in angles]  # make angles positive from 0 to 2*pi
-    keypoints_sorted = keypoints[np.argsort(angles)]
-    return list(keypoints_sorted)
+    ordered_keypoints, _ = get_counterclockwise_ordered_keypoints_batch(np.array(keypoints)[np.newaxis])
+    return list(ordered_keypoints[0])
+
+
+def get_counterclockwise_ordered_keypoints_batch(keypoints: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Orders B sets of K keypoints counterclockwise at once, see get_counterclockwise_ordered_keypoints.
+
+    Args:
+        keypoints: The keypoints to order, shape (B, K, 3).
+
+    Returns:
+        The ordered keypoints with shape (B, K, 3), and the permutations with shape (B, K) such that ordered[b, i] is
+        keypoints[b, permutations[b, i]].
+    """
+    keypoints = np.asarray(keypoints)
+    offsets = keypoints - np.mean(keypoints, axis=1, keepdims=True)
+    # The angle between the x-axis and the offset, made positive from 0 to 2*pi.
+    angles = np.arctan2(offsets[..., 1], offsets[..., 0]) % (2 * np.pi)
+    permutations = np.argsort(angles, axis=1)
+    ordered_keypoints = np.take_along_axis(keypoints, permutations[..., np.newaxis], axis=1)
+    return ordered_keypoints, permutations
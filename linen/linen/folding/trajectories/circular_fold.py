@@ -7,7 +7,7 @@ from linen.geometry.orientation import flat_orientation, pitch_gripper_orientati
 from linen.geometry.project import project_point_on_line
 from linen.path.circular_arc import circular_arc_orientation_path, circular_arc_position_trajectory
 from linen.path.combine import combine_orientation_and_position_paths
-from linen.path.path import Path
+from linen.path.path import Path, named_builder
 from linen.path.slerp import slerp_trajectory
 
 
@@ -27,6 +27,7 @@ def circular_fold_end_orientation(approach_direction: Vector3DType, fold_line_di
     return end_orientation
 
 
+@named_builder
 def circular_fold_trajectory(
     grasp_location: Vector3DType,
     approach_direction: Vector3DType,
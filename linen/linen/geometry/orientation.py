@@ -1,49 +1,59 @@
 import numpy as np
 from airo_typing import Vector3DType
-from scipy.spatial.transform import Rotation
+
+from linen.geometry.rotate import rotate_vector
+
+# The functions here accept a single direction (3,) or a batch of directions (..., 3), and then return a batch of
+# orientations (..., 3, 3), whose columns are the X, Y and Z axes of the gripper.
 
 
 def flat_orientation(gripper_forward_direction: Vector3DType) -> np.ndarray:
     """Creates an orientation matrix where the gripper opens in the global up direction.
 
     Args:
-        gripper_forward_direction: The direction the gripper should point, (expected to lie in the xy-plane).
+        gripper_forward_direction: The direction the gripper should point, (expected to lie in the xy-plane),
+            shape (..., 3).
 
     Returns:
-        A 3x3 rotation matrix.
+        A 3x3 rotation matrix, shape (..., 3, 3).
     """
-    Z = gripper_forward_direction / np.linalg.norm(gripper_forward_direction)
-    X = np.array([0, 0, 1])
+    gripper_forward_direction = np.asarray(gripper_forward_direction)
+    Z = gripper_forward_direction / np.linalg.norm(gripper_forward_direction, axis=-1, keepdims=True)
+    X = np.broadcast_to(np.array([0, 0, 1]), Z.shape)
     Y = np.cross(Z, X)
-    return np.column_stack([X, Y, Z])
+    return np.stack([X, Y, Z], axis=-1)
 
 
 def top_down_orientation(gripper_open_direction: Vector3DType) -> np.ndarray:
     """Creates an orientation matrix where the gripper points downwards.
 
     Args:
-        gripper_open_direction: The direction the gripper should open, (expected to lie in the xy-plane).
+        gripper_open_direction: The direction the gripper should open, (expected to lie in the xy-plane),
+            shape (..., 3).
 
     Returns:
-        A 3x3 rotation matrix.
+        A 3x3 rotation matrix, shape (..., 3, 3).
     """
-    X = gripper_open_direction / np.linalg.norm(gripper_open_direction)
-    Z = np.array([0, 0, -1])
+    gripper_open_direction = np.asarray(gripper_open_direction)
+    X = gripper_open_direction / np.linalg.norm(gripper_open_direction, axis=-1, keepdims=True)
+    Z = np.broadcast_to(np.array([0, 0, -1]), X.shape)
     Y = np.cross(Z, X)
-    return np.column_stack([X, Y, Z])
+    return np.stack([X, Y, Z], axis=-1)
 
 
 def pitch_gripper_orientation(orientation: np.ndarray, pitch_angle: float) -> np.ndarray:
     """Rotate the gripper over its local Y axis by the given angle.
 
     Args:
-        orientation: The 3x3 orientation matrix of the gripper before the rotation.
-        pitch_angle: The angle to rotate the gripper by.
+        orientation: The 3x3 orientation matrix of the gripper before the rotation, shape (..., 3, 3).
+        pitch_angle: The angle to rotate the gripper by, shape (...).
 
     Returns:
-        The 3x3 orientation matrix of the gripper after the rotation.
+        The 3x3 orientation matrix of the gripper after the rotation, shape (..., 3, 3).
     """
-    local_Y = orientation[:, 1]
-    rotation_local_Y = Rotation.from_rotvec(pitch_angle * local_Y).as_matrix()
-    orientation = rotation_local_Y @ orientation
-    return orientation
+    # The local Y axis is unchanged by the rotation, the local X and Z axes rotate around it.
+    orientation = np.asarray(orientation, dtype=np.float64)
+    local_Y = orientation[..., :, 1]
+    columns = np.swapaxes(orientation, -1, -2)
+    rotated_columns = rotate_vector(columns, local_Y[..., np.newaxis, :], np.asarray(pitch_angle)[..., np.newaxis])
+    return np.swapaxes(rotated_columns, -1, -2)
@@ -6,18 +6,19 @@ from airo_typing import Vector3DType
 
 def project_point_on_line(point: Vector3DType, line: Tuple[Vector3DType, Vector3DType]) -> Vector3DType:
     """
-    Projects a point on a line.
+    Projects a point on a line. Points and lines broadcast over leading batch dimensions.
 
     Args:
-        point: The point to project.
-        line: The line w.r.t. which the point is projected. The line is defined by a point and a direction
+        point: The point to project, shape (..., 3).
+        line: The line w.r.t. which the point is projected. The line is defined by a point and a direction, both with
+            shape (..., 3).
 
     Returns:
-        The projected point.
+        The projected point, shape (..., 3).
     """
-    point = np.array(point)
-    line = np.array(line)
-    point_on_line, line_direction = line  # TODO maybe add line as airo-typing type?
-    line_direction = line_direction / np.linalg.norm(line_direction)
-    dot = np.dot(point - point_on_line, line_direction)
+    point = np.asarray(point, dtype=np.float64)
+    point_on_line, line_direction = (np.asarray(vector, dtype=np.float64) for vector in line)
+    # TODO maybe add line as airo-typing type?
+    line_direction = line_direction / np.linalg.norm(line_direction, axis=-1, keepdims=True)
+    dot = np.sum((point - point_on_line) * line_direction, axis=-1, keepdims=True)
     return point_on_line + dot * line_direction
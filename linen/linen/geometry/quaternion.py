@@ -0,0 +1,207 @@
+from typing import Tuple
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+# Quaternions follow the scipy convention: scalar-last (x, y, z, w).
+
+
+def matrices_to_quaternions(matrices: np.ndarray) -> np.ndarray:
+    """Convert a stack of 3x3 rotation matrices to unit quaternions.
+
+    Args:
+        matrices: The rotation matrices, shape (N, 3, 3).
+
+    Returns:
+        The quaternions in (x, y, z, w) order, shape (N, 4).
+    """
+    return Rotation.from_matrix(matrices).as_quat()
+
+
+def quaternions_to_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """Convert unit quaternions to rotation matrices with the closed-form formula, without creating scipy objects.
+
+    Args:
+        quaternions: The quaternions in (x, y, z, w) order, shape (..., 4).
+
+    Returns:
+        The rotation matrices, shape (..., 3, 3).
+    """
+    x, y, z, w = np.moveaxis(quaternions, -1, 0)
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+
+    matrices = np.empty(quaternions.shape[:-1] + (3, 3))
+    matrices[..., 0, 0] = 1 - 2 * (yy + zz)
+    matrices[..., 0, 1] = 2 * (xy - wz)
+    matrices[..., 0, 2] = 2 * (xz + wy)
+    matrices[..., 1, 0] = 2 * (xy + wz)
+    matrices[..., 1, 1] = 1 - 2 * (xx + zz)
+    matrices[..., 1, 2] = 2 * (yz - wx)
+    matrices[..., 2, 0] = 2 * (xz - wy)
+    matrices[..., 2, 1] = 2 * (yz + wx)
+    matrices[..., 2, 2] = 1 - 2 * (xx + yy)
+    return matrices
+
+
+def make_quaternions_continuous(quaternions: np.ndarray) -> np.ndarray:
+    """Flip the signs of a sequence of quaternions so that consecutive quaternions lie in the same hemisphere.
+    q and -q represent the same rotation, but interpolating between opposite hemispheres takes the long way around.
+
+    Args:
+        quaternions: The sequence of quaternions, shape (N, 4).
+
+    Returns:
+        The sign-corrected quaternions, shape (N, 4).
+    """
+    dots = np.sum(quaternions[1:] * quaternions[:-1], axis=-1)
+    signs = np.concatenate([[1.0], np.cumprod(np.where(dots < 0.0, -1.0, 1.0))])
+    return quaternions * signs[:, np.newaxis]
+
+
+def slerp_angles(q0: np.ndarray, q1: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The quantities that slerp between pairs of unit quaternions needs, which only depend on the pairs and can be
+    precomputed for interpolating between the same pairs many times.
+
+    Args:
+        q0: The quaternions at fraction 0, shape (N, 4).
+        q1: The quaternions at fraction 1, shape (N, 4).
+
+    Returns:
+        The angle between each pair, half of the rotation angle, one over its sine, 1 for nearly parallel pairs, and
+        whether the pair is nearly parallel, each of shape (N,).
+    """
+    angles = np.arccos(np.clip(np.sum(q0 * q1, axis=-1), -1.0, 1.0))
+    sin_angles = np.sin(angles)
+
+    # For nearly identical quaternions slerp degenerates to lerp, which avoids dividing by sin(angle) ~ 0.
+    nearly_parallel = sin_angles < 1e-8
+    inverse_sin_angles = 1.0 / np.where(nearly_parallel, 1.0, sin_angles)
+    return angles, inverse_sin_angles, nearly_parallel
+
+
+def slerp_quaternions_with_angles(
+    q0: np.ndarray,
+    q1: np.ndarray,
+    fractions: np.ndarray,
+    angles: np.ndarray,
+    inverse_sin_angles: np.ndarray,
+    nearly_parallel: np.ndarray,
+) -> np.ndarray:
+    """Slerp between pairs of unit quaternions with the precomputed quantities of slerp_angles, vectorized.
+
+    Args:
+        q0: The quaternions at fraction 0, shape (N, 4).
+        q1: The quaternions at fraction 1, shape (N, 4).
+        fractions: The interpolation fractions in [0, 1], shape (N,).
+        angles: The angles of the pairs, shape (N,).
+        inverse_sin_angles: One over the sines of the angles, shape (N,).
+        nearly_parallel: Whether the pairs are lerped instead, shape (N,).
+
+    Returns:
+        The interpolated unit quaternions, shape (N, 4).
+    """
+    weights0 = np.where(nearly_parallel, 1.0 - fractions, np.sin((1.0 - fractions) * angles) * inverse_sin_angles)
+    weights1 = np.where(nearly_parallel, fractions, np.sin(fractions * angles) * inverse_sin_angles)
+    quaternions = weights0[:, np.newaxis] * q0 + weights1[:, np.newaxis] * q1
+    return quaternions / np.linalg.norm(quaternions, axis=-1, keepdims=True)
+
+
+def slerp_quaternions(q0: np.ndarray, q1: np.ndarray, fractions: np.ndarray) -> np.ndarray:
+    """Spherical linear interpolation between pairs of unit quaternions, vectorized over the leading dimension.
+    The pairs are expected to lie in the same hemisphere, see make_quaternions_continuous.
+
+    Args:
+        q0: The quaternions at fraction 0, shape (N, 4).
+        q1: The quaternions at fraction 1, shape (N, 4).
+        fractions: The interpolation fractions in [0, 1], shape (N,).
+
+    Returns:
+        The interpolated unit quaternions, shape (N, 4).
+    """
+    return slerp_quaternions_with_angles(q0, q1, fractions, *slerp_angles(q0, q1))
+
+
+def quaternions_to_rotation_vectors(quaternions: np.ndarray) -> np.ndarray:
+    """Convert unit quaternions to rotation vectors (axis times angle in radians) without creating scipy objects.
+
+    Args:
+        quaternions: The quaternions in (x, y, z, w) order, shape (..., 4).
+
+    Returns:
+        The rotation vectors with angles in [0, pi], shape (..., 3).
+    """
+    # q and -q are the same rotation, taking w >= 0 gives the rotation vector with the smallest angle.
+    quaternions = np.where(quaternions[..., 3:] < 0.0, -quaternions, quaternions)
+    vectors, w = quaternions[..., :3], quaternions[..., 3]
+    sin_half_angles = np.linalg.norm(vectors, axis=-1)
+    angles = 2.0 * np.arctan2(sin_half_angles, w)
+
+    # For small angles, angle / sin(angle / 2) tends to 2 / w, which avoids dividing by sin(angle / 2) ~ 0.
+    small = sin_half_angles < 1e-12
+    scales = np.where(small, 2.0 / w, angles / np.where(small, 1.0, sin_half_angles))
+    return scales[..., np.newaxis] * vectors
+
+
+def multiply_quaternions(q0: np.ndarray, q1: np.ndarray) -> np.ndarray:
+    """The Hamilton products q0 * q1 of quaternions, i.e. the rotation q1 followed by q0, vectorized.
+
+    Args:
+        q0: The left quaternions in (x, y, z, w) order, shape (..., 4).
+        q1: The right quaternions in (x, y, z, w) order, shape (..., 4).
+
+    Returns:
+        The products, shape (..., 4).
+    """
+    x0, y0, z0, w0 = np.moveaxis(q0, -1, 0)
+    x1, y1, z1, w1 = np.moveaxis(q1, -1, 0)
+    return np.stack(
+        [
+            w0 * x1 + x0 * w1 + y0 * z1 - z0 * y1,
+            w0 * y1 - x0 * z1 + y0 * w1 + z0 * x1,
+            w0 * z1 + x0 * y1 - y0 * x1 + z0 * w1,
+            w0 * w1 - x0 * x1 - y0 * y1 - z0 * z1,
+        ],
+        axis=-1,
+    )
+
+
+# The compact pose format is a (..., 7) array of (x, y, z, qx, qy, qz, qw), i.e. a position followed by a quaternion.
+# It is 28 bytes per pose in float32, versus 128 bytes for a 4x4 float64 matrix. The positions and quaternions of a
+# compact array are the views compact[..., :3] and compact[..., 3:], and the positions of 4x4 poses are the view
+# poses[..., :3, 3], so only the orientation block needs to be converted.
+
+
+def poses_to_position_quaternions(poses: np.ndarray, dtype: np.dtype = np.float64) -> np.ndarray:
+    """Convert 4x4 poses to the compact position + quaternion format.
+
+    Args:
+        poses: The poses, shape (..., 4, 4).
+        dtype: The floating point type of the result, e.g. np.float32 for storage.
+
+    Returns:
+        The compact poses, shape (..., 7).
+    """
+    position_quaternions = np.empty(poses.shape[:-2] + (7,), dtype=dtype)
+    position_quaternions[..., :3] = poses[..., :3, 3]
+    position_quaternions[..., 3:] = matrices_to_quaternions(poses[..., :3, :3])
+    return position_quaternions
+
+
+def position_quaternions_to_poses(position_quaternions: np.ndarray) -> np.ndarray:
+    """Convert compact position + quaternion poses to 4x4 float64 poses.
+
+    Args:
+        position_quaternions: The compact poses, shape (..., 7).
+
+    Returns:
+        The poses, shape (..., 4, 4).
+    """
+    position_quaternions = np.asarray(position_quaternions, dtype=np.float64)
+    poses = np.zeros(position_quaternions.shape[:-1] + (4, 4))
+    quaternions = position_quaternions[..., 3:]
+    poses[..., :3, :3] = quaternions_to_matrices(quaternions / np.linalg.norm(quaternions, axis=-1, keepdims=True))
+    poses[..., :3, 3] = position_quaternions[..., :3]
+    poses[..., 3, 3] = 1.0
+    return poses
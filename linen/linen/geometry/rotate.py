@@ -1,78 +1,181 @@
+from typing import Callable
+
 import numpy as np
 from airo_typing import Vector3DType
-from scipy.spatial.transform import Rotation
+
+# All rotations here use Rodrigues' rotation formula, R(angle) = I + sin(angle) K + (1 - cos(angle)) K^2, where K is the
+# cross product matrix of the unit axis. For values that are rotated by many angles, the products K v and K^2 v are
+# precomputed once by rotation_kernel, after which each angle only costs a sine, a cosine and two multiply-adds.
+
+
+def cross_product_matrix(axis: Vector3DType) -> np.ndarray:
+    """The 3x3 matrix K of the normalized axis, so that K @ v is the cross product of the unit axis and v.
+
+    Args:
+        axis: The axis, which will be normalized, shape (..., 3).
+
+    Returns:
+        The cross product matrix, shape (..., 3, 3).
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    x, y, z = np.moveaxis(axis / np.linalg.norm(axis, axis=-1, keepdims=True), -1, 0)
+    zeros = np.zeros_like(x)
+    return np.stack([np.stack([zeros, -z, y], -1), np.stack([z, zeros, -x], -1), np.stack([-y, x, zeros], -1)], -2)
+
+
+def rotation_kernel(value: np.ndarray, axis: Vector3DType) -> Callable[[np.ndarray], np.ndarray]:
+    """Precompute the rotation of a fixed value around a fixed axis through the origin, for evaluation at many angles.
+
+    Args:
+        value: The value to rotate, shape (3, ...), e.g. a vector (3,) or the columns of a 3x3 orientation matrix.
+        axis: The axis to rotate around, which will be normalized.
+
+    Returns:
+        A function that maps a scalar angle to the rotated value with shape (3, ...), or an array of N angles to the
+        stacked rotated values with shape (N, 3, ...).
+    """
+    value = np.asarray(value, dtype=np.float64)
+    cross_product = cross_product_matrix(axis)
+    value_cross = np.tensordot(cross_product, value, axes=1)
+    value_cross_cross = np.tensordot(cross_product, value_cross, axes=1)
+    trailing_axes = (1,) * value.ndim
+
+    def rotate(angles: np.ndarray) -> np.ndarray:
+        angles = np.reshape(angles, np.shape(angles) + trailing_axes)
+        return value + np.sin(angles) * value_cross + (1.0 - np.cos(angles)) * value_cross_cross
+
+    return rotate
+
+
+def point_rotation_kernel(
+    point: Vector3DType, center: Vector3DType, axis: Vector3DType
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Precompute the rotation of a point around an axis through a center. See rotation_kernel."""
+    rotate = rotation_kernel(np.asarray(point) - center, axis)
+    return lambda angles: center + rotate(angles)
+
+
+def pose_rotation_kernel(
+    pose: np.ndarray, center: Vector3DType, axis: Vector3DType
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Precompute the rotation of a 4x4 pose around an axis through a center. See rotation_kernel."""
+    # The top three rows of a pose are its orientation and position, which is relative to the center.
+    top_rows = np.array(pose[:3], dtype=np.float64)
+    top_rows[:, 3] -= center
+    rotate = rotation_kernel(top_rows, axis)
+    bottom_row = np.asarray(pose[3], dtype=np.float64)
+
+    def rotate_pose(angles: np.ndarray) -> np.ndarray:
+        rotated_top_rows = rotate(angles)
+        rotated_top_rows[..., 3] += center
+        bottom_rows = np.broadcast_to(bottom_row, rotated_top_rows.shape[:-2] + (1, 4))
+        return np.concatenate([rotated_top_rows, bottom_rows], axis=-2)
+
+    return rotate_pose
+
+
+def rotation_matrix_batch(axis: Vector3DType, angles: np.ndarray) -> np.ndarray:
+    """The stacked 3x3 rotation matrices around an axis for an array of N angles, shape (N, 3, 3)."""
+    return rotation_kernel(np.identity(3), axis)(angles)
+
+
+def rotate_point_batch(
+    point: Vector3DType, center: Vector3DType, axis: Vector3DType, angles: np.ndarray
+) -> np.ndarray:
+    """Rotate a point around an axis through a center by each of N angles, the result has shape (N, 3)."""
+    return point_rotation_kernel(point, center, axis)(angles)
+
+
+def rotate_orientation_batch(orientation: np.ndarray, axis: Vector3DType, angles: np.ndarray) -> np.ndarray:
+    """Rotate a 3x3 orientation matrix around an axis by each of N angles, the result has shape (N, 3, 3)."""
+    return rotation_kernel(orientation, axis)(angles)
+
+
+def rotate_pose_batch(pose: np.ndarray, center: Vector3DType, axis: Vector3DType, angles: np.ndarray) -> np.ndarray:
+    """Rotate a 4x4 pose around an axis through a center by each of N angles, the result has shape (N, 4, 4)."""
+    return pose_rotation_kernel(pose, center, axis)(angles)
 
 
 def rotate_vector(vector: Vector3DType, axis: Vector3DType, angle: float) -> Vector3DType:
     """
     Rotate a vector around an axis by a given angle.
 
+    All arguments broadcast over leading batch dimensions, e.g. N vectors (N, 3) can be rotated around one axis (3,)
+    by N angles (N,).
+
     Args:
-        vector: The vector to rotate.
-        axis: The axis to rotate around, which will be normalized.
-        angle: The angle in radians to rotate by.
+        vector: The vector to rotate, shape (..., 3).
+        axis: The axis to rotate around, which will be normalized, shape (..., 3).
+        angle: The angle in radians to rotate by, shape (...).
 
     Returns:
-        The rotated vector.
+        The rotated vector, shape (..., 3).
     """
-    unit_axis = axis / np.linalg.norm(axis)
-    rotation = Rotation.from_rotvec(angle * unit_axis)
-    return rotation.apply(vector)
+    vector = np.asarray(vector, dtype=np.float64)
+    axis = np.asarray(axis, dtype=np.float64)
+    unit_axis = axis / np.linalg.norm(axis, axis=-1, keepdims=True)
+    angle = np.asarray(angle, dtype=np.float64)[..., np.newaxis]
+    vector_cross = np.cross(unit_axis, vector)
+    vector_cross_cross = np.cross(unit_axis, vector_cross)
+    return vector + np.sin(angle) * vector_cross + (1.0 - np.cos(angle)) * vector_cross_cross
 
 
 def rotate_point(point: Vector3DType, center: Vector3DType, axis: Vector3DType, angle: float):
     """
-    Rotate a point around an axis by a given angle.
+    Rotate a point around an axis by a given angle. Broadcasts over leading batch dimensions like rotate_vector.
 
     Args:
-        point: The point to rotate.
-        center: The center of the rotation.
-        axis: The axis to rotate around, which will be normalized.
-        angle: The angle in radians to rotate by.
+        point: The point to rotate, shape (..., 3).
+        center: The center of the rotation, shape (..., 3).
+        axis: The axis to rotate around, which will be normalized, shape (..., 3).
+        angle: The angle in radians to rotate by, shape (...).
 
     Returns:
-        The rotated point.
+        The rotated point, shape (..., 3).
     """
-    unit_axis = axis / np.linalg.norm(axis)
-    rotation = Rotation.from_rotvec(angle * unit_axis)
-    return center + rotation.apply(point - center)
+    center = np.asarray(center, dtype=np.float64)
+    return center + rotate_vector(np.asarray(point) - center, axis, angle)
 
 
 def rotate_orientation(orientation: np.ndarray, axis: Vector3DType, angle: float):
     """
-    Rotate a 3x3 orientation matrix around an axis by a given angle.
+    Rotate a 3x3 orientation matrix around an axis by a given angle. Broadcasts over leading batch dimensions like
+    rotate_vector.
 
     Args:
-        orientation: The 3x3 orientation matrix to rotate.
-        axis: The axis to rotate around, which will be normalized.
-        angle: The angle in radians to rotate by.
+        orientation: The 3x3 orientation matrix to rotate, shape (..., 3, 3).
+        axis: The axis to rotate around, which will be normalized, shape (..., 3).
+        angle: The angle in radians to rotate by, shape (...).
 
     Returns:
-        The rotated orientation matrix.
+        The rotated orientation matrix, shape (..., 3, 3).
     """
-    unit_axis = axis / np.linalg.norm(axis)
-    rotation = Rotation.from_rotvec(angle * unit_axis)
-    return rotation.as_matrix() @ orientation
+    # Rotating a matrix rotates each of its columns, which are the rows of its transpose.
+    columns = np.swapaxes(np.asarray(orientation, dtype=np.float64), -1, -2)
+    axis = np.asarray(axis)[..., np.newaxis, :]
+    angle = np.asarray(angle)[..., np.newaxis]
+    return np.swapaxes(rotate_vector(columns, axis, angle), -1, -2)
 
 
 def rotate_pose(pose: np.ndarray, center: Vector3DType, axis: Vector3DType, angle: float):
     """
-    Rotate a 4x4 pose matrix around an axis by a given angle.
+    Rotate a 4x4 pose matrix around an axis by a given angle. Broadcasts over leading batch dimensions like
+    rotate_vector.
 
     Args:
-        pose: The 4x4 pose matrix to rotate.
-        center: The center of the rotation.
-        axis: The axis to rotate around, which will be normalized.
-        angle: The angle in radians to rotate by.
+        pose: The 4x4 pose matrix to rotate, shape (..., 4, 4).
+        center: The center of the rotation, shape (..., 3).
+        axis: The axis to rotate around, which will be normalized, shape (..., 3).
+        angle: The angle in radians to rotate by, shape (...).
 
     Returns:
-        The rotated pose matrix.
+        The rotated pose matrix, shape (..., 4, 4).
     """
-    center_pose = np.identity(4)
-    center_pose[:3, 3] = center
-
-    unit_axis = axis / np.linalg.norm(axis)
-    rotation = Rotation.from_rotvec(angle * unit_axis)
-    homogeneous_rotation = np.identity(4)
-    homogeneous_rotation[:3, :3] = rotation.as_matrix()
-    return center_pose @ homogeneous_rotation @ np.linalg.inv(center_pose) @ pose
+    pose = np.asarray(pose, dtype=np.float64)
+    orientation = rotate_orientation(pose[..., :3, :3], axis, angle)
+    position = rotate_point(pose[..., :3, 3], center, axis, angle)
+    rotated = np.zeros(np.broadcast_shapes(orientation.shape[:-2], position.shape[:-1]) + (4, 4))
+    rotated[..., :3, :3] = orientation
+    rotated[..., :3, 3] = position
+    rotated[..., 3, :] = pose[..., 3, :]
+    return rotated
@@ -0,0 +1,232 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from airo_typing import Vector3DType
+
+from linen.grasping.shirt.shirt_grasps import shirt_sleeve_and_waist_grasps
+from linen.grasping.towel.towel_grasps import towel_aligned_grasps_batch, towel_twisted_grasps_batch
+
+# The candidate engine enumerates every dual arm grasp the builders in linen.grasping can make for one garment, over
+# grids of their parameters, scores all candidates in one vectorized pass and keeps the best ones. This replaces
+# choosing grasped_edge, inset and grasp_depth by hand.
+
+DEFAULT_INSETS = np.linspace(0.02, 0.1, 5)
+DEFAULT_DEPTHS = np.linspace(0.02, 0.08, 4)
+DEFAULT_WAIST_INSETS = np.linspace(0.05, 0.2, 4)  # Fractions of the waist width, see shirt_sleeve_and_waist_grasps.
+
+
+@dataclass(frozen=True)
+class GraspCandidates:
+    """C dual arm grasps, each made of two grasp locations and the directions in which they are approached.
+
+    Attributes:
+        locations: The grasp locations, shape (C, 2, 3).
+        approach_directions: The approach directions, shape (C, 2, 3).
+        variants: The name of the builder variant that made each candidate, e.g. "aligned" or "twisted", shape (C,).
+        parameters: The builder arguments of each candidate, each with shape (C,). Arguments that a variant doesn't
+            have are -1 or False.
+        scores: The scores of the candidates, higher is better, set by best_grasps.
+    """
+
+    locations: np.ndarray
+    approach_directions: np.ndarray
+    variants: np.ndarray
+    parameters: Dict[str, np.ndarray] = field(default_factory=dict)
+    scores: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def select(self, indices: np.ndarray, scores: Optional[np.ndarray] = None) -> "GraspCandidates":
+        """The candidates at the given indices, in that order, optionally with new scores."""
+        parameters = {name: values[indices] for name, values in self.parameters.items()}
+        if scores is None and self.scores is not None:
+            scores = self.scores[indices]
+        return GraspCandidates(
+            self.locations[indices], self.approach_directions[indices], self.variants[indices], parameters, scores
+        )
+
+
+def concatenate_candidates(candidates: Sequence[GraspCandidates]) -> GraspCandidates:
+    """Join candidate sets, parameters that only some sets have are filled with -1."""
+    names = sorted({name for candidate_set in candidates for name in candidate_set.parameters})
+    parameters = {
+        name: np.concatenate([c.parameters.get(name, np.full(len(c), -1)) for c in candidates]) for name in names
+    }
+    return GraspCandidates(
+        np.concatenate([c.locations for c in candidates]),
+        np.concatenate([c.approach_directions for c in candidates]),
+        np.concatenate([c.variants for c in candidates]),
+        parameters,
+    )
+
+
+def parameter_grid(*values: Sequence) -> np.ndarray:
+    # All combinations of the values, one combination per row.
+    return np.stack([grid.ravel() for grid in np.meshgrid(*values, indexing="ij")], axis=-1)
+
+
+def towel_grasp_candidates(
+    ordered_keypoints: np.ndarray, insets: Sequence[float] = DEFAULT_INSETS, depths: Sequence[float] = DEFAULT_DEPTHS
+) -> GraspCandidates:
+    """Enumerate the aligned grasps on each of the four edges and both twisted grasps of a towel, for every
+    combination of inset and grasp depth.
+
+    Args:
+        ordered_keypoints: The keypoints of the towel ordered counterclockwise, shape (4, 3).
+        insets: The insets to try.
+        depths: The grasp depths to try.
+
+    Returns:
+        The candidates, 6 * len(insets) * len(depths) of them.
+    """
+    ordered_keypoints = np.asarray(ordered_keypoints, dtype=np.float64)
+
+    edges, aligned_insets, aligned_depths = parameter_grid(np.arange(4), insets, depths).T
+    keypoints = np.broadcast_to(ordered_keypoints, (len(edges), 4, 3))
+    locations, directions = towel_aligned_grasps_batch(keypoints, aligned_depths, aligned_insets, edges.astype(int))
+    aligned = GraspCandidates(
+        locations,
+        directions,
+        np.full(len(edges), "aligned"),
+        {
+            "edge": edges.astype(int),
+            "top_grasp_near0": np.zeros(len(edges), dtype=bool),
+            "inset": aligned_insets,
+            "depth": aligned_depths,
+        },
+    )
+
+    near0, twisted_insets, twisted_depths = parameter_grid([True, False], insets, depths).T
+    near0 = near0.astype(bool)
+    keypoints = np.broadcast_to(ordered_keypoints, (len(near0), 4, 3))
+    locations, directions = towel_twisted_grasps_batch(keypoints, twisted_depths, twisted_insets, near0)
+    twisted = GraspCandidates(
+        locations,
+        directions,
+        np.full(len(near0), "twisted"),
+        {"edge": np.full(len(near0), -1), "top_grasp_near0": near0, "inset": twisted_insets, "depth": twisted_depths},
+    )
+    return concatenate_candidates([aligned, twisted])
+
+
+def shirt_grasp_candidates(
+    keypoints: Dict[str, Vector3DType],
+    sleeve_insets: Sequence[float] = DEFAULT_INSETS,
+    waist_insets: Sequence[float] = DEFAULT_WAIST_INSETS,
+    depths: Sequence[float] = DEFAULT_DEPTHS,
+) -> GraspCandidates:
+    """Enumerate the sleeve and waist grasps on both sides of a shirt, for every combination of the insets and depths.
+
+    Args:
+        keypoints: The keypoints of the shirt, see shirt_sleeve_and_waist_grasps.
+        sleeve_insets: The sleeve insets to try.
+        waist_insets: The waist insets to try, as fractions of the waist width.
+        depths: The grasp depths to try.
+
+    Returns:
+        The candidates, 2 * len(sleeve_insets) * len(waist_insets) * len(depths) of them.
+    """
+    left, sleeve_inset, waist_inset, depth = parameter_grid([True, False], sleeve_insets, waist_insets, depths).T
+    left = left.astype(bool)
+    sleeve_grasp, waist_grasp = shirt_sleeve_and_waist_grasps(keypoints, sleeve_inset, waist_inset, depth, left)
+    locations = np.stack([sleeve_grasp[0], waist_grasp[0]], axis=1)
+    # The approach directions don't depend on the grid, so they have to be broadcast to the amount of candidates.
+    directions = np.stack(np.broadcast_arrays(sleeve_grasp[1], waist_grasp[1], locations[:, 0])[:2], axis=1)
+    parameters = {"left": left, "sleeve_inset": sleeve_inset, "waist_inset": waist_inset, "depth": depth}
+    return GraspCandidates(locations, directions, np.full(len(left), "sleeve_and_waist"), parameters)
+
+
+@dataclass(frozen=True)
+class GraspScoring:
+    """The criteria that score a dual arm grasp. The score is a weighted sum of the criteria, and candidates that
+    violate one of the limits are infeasible and get a score of -inf.
+
+    Attributes:
+        min_separation: The minimal distance between the two grasp locations, so that the grippers don't collide.
+        table_height: The height of the table surface.
+        min_clearance: The minimal height above the table of the grippers while they approach, which can be negative
+            for grasps that slide under the cloth.
+        approach_distance: The distance the grippers travel along their approach direction to reach the grasp.
+        separation_weight: The weight of the distance between the grasps, wider grasps hold the cloth more stably.
+        clearance_weight: The weight of the lowest height above the table during the approach.
+        conflict_weight: The weight of the penalty for grippers that approach from the side of the other grasp.
+    """
+
+    min_separation: float = 0.1
+    table_height: float = 0.0
+    min_clearance: float = -np.inf
+    approach_distance: float = 0.05
+    separation_weight: float = 1.0
+    clearance_weight: float = 0.0
+    conflict_weight: float = 1.0
+
+
+def arm_separations(candidates: GraspCandidates) -> np.ndarray:
+    """The distance between the two grasp locations of each candidate, shape (C,)."""
+    return np.linalg.norm(candidates.locations[:, 1] - candidates.locations[:, 0], axis=-1)
+
+
+def table_clearances(candidates: GraspCandidates, table_height: float, approach_distance: float) -> np.ndarray:
+    """The lowest height above the table of both grippers during their straight line approach, shape (C,)."""
+    pregrasp_locations = candidates.locations - approach_distance * candidates.approach_directions
+    lowest = np.minimum(candidates.locations[..., 2], pregrasp_locations[..., 2])
+    return np.min(lowest, axis=-1) - table_height
+
+
+def approach_conflicts(candidates: GraspCandidates) -> np.ndarray:
+    """How much the grippers come from the side of the other grasp, shape (C,).
+
+    A gripper arrives from behind its grasp location, i.e. from -approach_direction. When that side faces the other
+    grasp, the two arms have to cross or pass close to each other. The conflict is the sum over both grippers of the
+    cosine between the direction they come from and the direction to the other grasp, where only positive cosines count.
+    """
+    locations, directions = candidates.locations, candidates.approach_directions
+    between = locations[:, 1] - locations[:, 0]
+    between = between / np.maximum(np.linalg.norm(between, axis=-1, keepdims=True), np.finfo(np.float64).tiny)
+    conflict0 = np.maximum(0.0, -np.sum(directions[:, 0] * between, axis=-1))
+    conflict1 = np.maximum(0.0, np.sum(directions[:, 1] * between, axis=-1))
+    return conflict0 + conflict1
+
+
+def score_grasps(candidates: GraspCandidates, scoring: GraspScoring = GraspScoring()) -> np.ndarray:
+    """Score all candidates at once, see GraspScoring.
+
+    Args:
+        candidates: The candidates.
+        scoring: The criteria and their weights.
+
+    Returns:
+        The scores, higher is better and -inf for infeasible candidates, shape (C,).
+    """
+    separations = arm_separations(candidates)
+    clearances = table_clearances(candidates, scoring.table_height, scoring.approach_distance)
+    conflicts = approach_conflicts(candidates)
+
+    scores = (
+        scoring.separation_weight * separations
+        + scoring.clearance_weight * np.where(np.isfinite(clearances), clearances, 0.0)
+        - scoring.conflict_weight * conflicts
+    )
+    feasible = (separations >= scoring.min_separation) & (clearances >= scoring.min_clearance)
+    return np.where(feasible, scores, -np.inf)
+
+
+def best_grasps(candidates: GraspCandidates, k: int = 1, scoring: GraspScoring = GraspScoring()) -> GraspCandidates:
+    """The k best scoring feasible candidates, best first.
+
+    Args:
+        candidates: The candidates, e.g. from towel_grasp_candidates or shirt_grasp_candidates.
+        k: The maximal amount of candidates to return.
+        scoring: The criteria and their weights.
+
+    Returns:
+        The best candidates with their scores, fewer than k when not enough candidates are feasible.
+    """
+    scores = score_grasps(candidates, scoring)
+    k = min(k, len(candidates))
+    best = np.argpartition(-scores, k - 1)[:k] if k < len(candidates) else np.arange(len(candidates))
+    best = best[np.argsort(-scores[best], kind="stable")]
+    best = best[np.isfinite(scores[best])]
+    return candidates.select(best, scores[best])
@@ -16,15 +16,15 @@ def orthogonal_edge_approach_direction(edge_start: Vector3DType, edge_end: Vecto
     TODO: mention the orientation convention that follows from the cross product.
 
     Args:
-        edge_start: The first point of the edge
-        edge_end: The second point of the edge
+        edge_start: The first point of the edge, shape (..., 3).
+        edge_end: The second point of the edge, shape (..., 3).
 
     Returns:
-        The direction of the approach vector.
+        The direction of the approach vector, shape (..., 3).
 
     """
-    edge = edge_end - edge_start
-    edge_direction = edge / np.linalg.norm(edge)
+    edge = np.asarray(edge_end) - edge_start
+    edge_direction = edge / np.linalg.norm(edge, axis=-1, keepdims=True)
     up = np.array([0, 0, 1])
     approach_direction = np.cross(up, edge_direction)
 
@@ -48,26 +48,29 @@ def insetted_edge_grasps(
                | grasp_location0     grasp_location1 |
                |                                     |
 
+    All arguments broadcast over leading batch dimensions, e.g. B edges with shape (B, 3) and B insets (B,).
+
     Args:
-        edge_start: The first point of the edge.
-        edge_end: The second point of the edge.
+        edge_start: The first point of the edge, shape (..., 3).
+        edge_end: The second point of the edge, shape (..., 3).
         grasp_approach_direction: The direction of the edge will be approached. This needn't be perpendicular to the edge.
-        grasp_depth: The depth of the grasp.
-        inset: The distance along the edge to inset the grasp locations.
+        grasp_depth: The depth of the grasp, shape (...).
+        inset: The distance along the edge to inset the grasp locations, shape (...).
 
     Returns:
-        The two grasp locations.
+        The two grasp locations, each with shape (..., 3).
     """
+    edge_start, edge_end = np.asarray(edge_start, dtype=np.float64), np.asarray(edge_end, dtype=np.float64)
+    inset = np.asarray(inset)[..., np.newaxis]
+    grasp_depth = np.asarray(grasp_depth)[..., np.newaxis]
     edge = edge_end - edge_start
-    edge_direction = edge / np.linalg.norm(edge)
+    edge_direction = edge / np.linalg.norm(edge, axis=-1, keepdims=True)
 
-    grasp_location0 = edge_start.copy()
-    grasp_location0 += inset * edge_direction
-    grasp_location0 += grasp_depth * grasp_approach_direction
+    grasp_location0 = edge_start + inset * edge_direction
+    grasp_location0 = grasp_location0 + grasp_depth * grasp_approach_direction
 
-    grasp_location1 = edge_end.copy()
-    grasp_location1 -= inset * edge_direction
-    grasp_location1 += grasp_depth * grasp_approach_direction
+    grasp_location1 = edge_end - inset * edge_direction
+    grasp_location1 = grasp_location1 + grasp_depth * grasp_approach_direction
 
     return grasp_location0, grasp_location1
 
@@ -101,3 +104,25 @@ def orthogonal_insetted_edge_grasps(
         edge_start, edge_end, approach_direction, grasp_depth, inset
     )
     return (grasp_location0, approach_direction), (grasp_location1, approach_direction)
+
+
+def orthogonal_insetted_edge_grasps_batch(
+    edge_starts: np.ndarray,
+    edge_ends: np.ndarray,
+    grasp_depths: np.ndarray = 0.05,
+    insets: np.ndarray = 0.05,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """The grasps of orthogonal_insetted_edge_grasps for B edges at once.
+
+    Args:
+        edge_starts: The first points of the edges, shape (B, 3).
+        edge_ends: The second points of the edges, shape (B, 3).
+        grasp_depths: The depths of the grasps, a scalar or shape (B,).
+        insets: The distances along the edges to inset the grasp locations, a scalar or shape (B,).
+
+    Returns:
+        The grasp locations with shape (B, 2, 3), and the approach directions with shape (B, 2, 3).
+    """
+    approach_directions = orthogonal_edge_approach_direction(edge_starts, edge_ends)
+    grasp_locations = insetted_edge_grasps(edge_starts, edge_ends, approach_directions, grasp_depths, insets)
+    return np.stack(grasp_locations, axis=-2), np.stack([approach_directions, approach_directions], axis=-2)
@@ -24,29 +24,28 @@ def shirt_sleeve_and_waist_grasps(
 
 
 
+    The keypoints and the other arguments broadcast over leading batch dimensions, e.g. keypoints with shape (B, 3)
+    and B values of left give the grasps of B shirts.
+
     Args:
-        keypoints: The keypoints of the shirt.
-        sleeve_inset: How far from the end of the sleeve to grasp.
-        waist_inset: How far from the waist to grasp.
-        grasp_depth: How far to move the gripper into the shirt.
-        left: Whether to grasp the left or right side of the shirt.
+        keypoints: The keypoints of the shirt, each with shape (..., 3).
+        sleeve_inset: How far from the end of the sleeve to grasp, shape (...).
+        waist_inset: How far from the waist to grasp, shape (...).
+        grasp_depth: How far to move the gripper into the shirt, shape (...).
+        left: Whether to grasp the left or right side of the shirt, shape (...).
 
 
     Returns:
-        One grasp on the sleeve and one grasp on the waist.
+        One grasp on the sleeve and one grasp on the waist, each location and direction with shape (..., 3).
     """
 
-    neck_left = keypoints["neck_left"]
-    shoulder_left = keypoints["shoulder_left"]
-    armpit_left = keypoints["armpit_left"]
-    waist_left = keypoints["waist_left"]
-    sleeve_top_left = keypoints["sleeve_left_top"]
-
-    neck_right = keypoints["neck_right"]
-    shoulder_right = keypoints["shoulder_right"]
-    armpit_right = keypoints["armpit_right"]
-    waist_right = keypoints["waist_right"]
-    sleeve_top_right = keypoints["sleeve_right_top"]
+    neck_left, neck_right = np.asarray(keypoints["neck_left"]), np.asarray(keypoints["neck_right"])
+    shoulder_left, shoulder_right = np.asarray(keypoints["shoulder_left"]), np.asarray(keypoints["shoulder_right"])
+    armpit_left, armpit_right = np.asarray(keypoints["armpit_left"]), np.asarray(keypoints["armpit_right"])
+    waist_left, waist_right = np.asarray(keypoints["waist_left"]), np.asarray(keypoints["waist_right"])
+    sleeve_top_left, sleeve_top_right = np.asarray(keypoints["sleeve_left_top"]), np.asarray(
+        keypoints["sleeve_right_top"]
+    )
 
     top_left = (armpit_left + shoulder_left + neck_left) / 3
     top_right = (armpit_right + shoulder_right + neck_right) / 3
@@ -54,27 +53,27 @@ def shirt_sleeve_and_waist_grasps(
     bottom_center = (waist_left + waist_right) / 2
 
     bottom_to_top = top_center - bottom_center
-    bottom_to_top /= np.linalg.norm(bottom_to_top)
+    bottom_to_top = bottom_to_top / np.linalg.norm(bottom_to_top, axis=-1, keepdims=True)
 
     sleeve_grasp_approach_direction = -bottom_to_top
     waist_grasp_approach_direction = bottom_to_top
 
-    if left:
-        sleeve_to_shoulder = shoulder_left - sleeve_top_left
-        sleeve_to_shoulder /= np.linalg.norm(sleeve_to_shoulder)
-        sleeve_grasp_location = sleeve_top_left + sleeve_inset * sleeve_to_shoulder
-        waist_left_to_right = waist_right - waist_left
-        waist_grasp_location = waist_left + waist_inset * waist_left_to_right
-    else:
-        sleeve_to_shoulder = shoulder_right - sleeve_top_right
-        sleeve_to_shoulder /= np.linalg.norm(sleeve_to_shoulder)
-        sleeve_grasp_location = sleeve_top_right + sleeve_inset * sleeve_to_shoulder
-        waist_right_to_left = waist_left - waist_right
-        waist_grasp_location = waist_right + waist_inset * waist_right_to_left
+    # The grasps on the right side mirror those on the left side.
+    left = np.asarray(left)[..., np.newaxis]
+    sleeve_top = np.where(left, sleeve_top_left, sleeve_top_right)
+    shoulder = np.where(left, shoulder_left, shoulder_right)
+    waist_start = np.where(left, waist_left, waist_right)
+    waist_end = np.where(left, waist_right, waist_left)
+
+    sleeve_to_shoulder = shoulder - sleeve_top
+    sleeve_to_shoulder = sleeve_to_shoulder / np.linalg.norm(sleeve_to_shoulder, axis=-1, keepdims=True)
+    sleeve_grasp_location = sleeve_top + np.asarray(sleeve_inset)[..., np.newaxis] * sleeve_to_shoulder
+    waist_grasp_location = waist_start + np.asarray(waist_inset)[..., np.newaxis] * (waist_end - waist_start)
 
     # Add grasp depth
-    sleeve_grasp_location += grasp_depth * sleeve_grasp_approach_direction
-    waist_grasp_location += grasp_depth * waist_grasp_approach_direction
+    grasp_depth = np.asarray(grasp_depth)[..., np.newaxis]
+    sleeve_grasp_location = sleeve_grasp_location + grasp_depth * sleeve_grasp_approach_direction
+    waist_grasp_location = waist_grasp_location + grasp_depth * waist_grasp_approach_direction
 
     sleeve_grasp = (sleeve_grasp_location, sleeve_grasp_approach_direction)
     waist_grasp = (waist_grasp_location, waist_grasp_approach_direction)
@@ -6,9 +6,10 @@ from linen.path.combine import combine_orientation_and_position_paths
 from linen.path.concatenate import concatenate_trajectories
 from linen.path.constant import constant_trajectory
 from linen.path.linear import linear_trajectory
-from linen.path.path import Path
+from linen.path.path import Path, named_builder
 
 
+@named_builder
 def slide_grasp_position_trajectory(
     grasp_location: Vector3DType,
     approach_direction: Vector3DType,
@@ -59,6 +60,7 @@ def slide_grasp_orientation(approach_direction, approach_angle) -> np.ndarray:
     return pitched_orientation
 
 
+@named_builder
 def slide_grasp_trajectory(
     grasp_location: Vector3DType,
     approach_direction: Vector3DType,
@@ -2,7 +2,7 @@ from typing import List, Tuple
 
 import numpy as np
 
-from linen.grasping.edge_grasps import orthogonal_insetted_edge_grasps
+from linen.grasping.edge_grasps import orthogonal_insetted_edge_grasps, orthogonal_insetted_edge_grasps_batch
 
 
 def towel_aligned_grasps(ordered_keypoints, grasp_depth=0.05, inset=0.05, grasped_edge: int = 0):
@@ -62,40 +62,91 @@ def towel_twisted_grasps(
 
     """
 
-    left_bottom_to_top = ordered_keypoints[1] - ordered_keypoints[2]
-    right_bottom_to_top = ordered_keypoints[0] - ordered_keypoints[3]
+    locations, approach_directions = towel_twisted_grasps_batch(
+        np.array(ordered_keypoints)[np.newaxis], grasp_depth, inset, top_grasp_near0
+    )
+    grasp_top = (locations[0, 0], approach_directions[0, 0])
+    grasp_bottom = (locations[0, 1], approach_directions[0, 1])
+    return grasp_top, grasp_bottom
 
-    bottom_to_top = (left_bottom_to_top + right_bottom_to_top) / 2
-    bottom_to_top /= np.linalg.norm(bottom_to_top)
 
-    approach_direction_top = -bottom_to_top
-    approach_direction_bottom = bottom_to_top
+def towel_aligned_grasps_batch(
+    ordered_keypoints: np.ndarray,
+    grasp_depths: np.ndarray = 0.05,
+    insets: np.ndarray = 0.05,
+    grasped_edges: np.ndarray = 0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """The grasps of towel_aligned_grasps for B towels at once.
+
+    Args:
+        ordered_keypoints: The keypoints of the towels ordered counterclockwise, shape (B, 4, 3).
+        grasp_depths: The depths of the grasps, a scalar or shape (B,).
+        insets: The distances along the edges to inset the grasp locations, a scalar or shape (B,).
+        grasped_edges: The edges to grasp, a scalar or shape (B,).
+
+    Returns:
+        The grasp locations with shape (B, 2, 3), and the approach directions with shape (B, 2, 3).
+    """
+    ordered_keypoints = np.asarray(ordered_keypoints, dtype=np.float64)
+    towels = np.arange(len(ordered_keypoints))
+    starts = np.broadcast_to(grasped_edges, towels.shape)
+    ends = (starts + 1) % 4
+    return orthogonal_insetted_edge_grasps_batch(
+        ordered_keypoints[towels, starts], ordered_keypoints[towels, ends], grasp_depths, insets
+    )
+
+
+def towel_twisted_grasps_batch(
+    ordered_keypoints: np.ndarray,
+    grasp_depths: np.ndarray = 0.05,
+    insets: np.ndarray = 0.05,
+    top_grasps_near0: np.ndarray = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """The grasps of towel_twisted_grasps for B towels at once.
+
+    Args:
+        ordered_keypoints: The keypoints of the towels ordered counterclockwise, shape (B, 4, 3).
+        grasp_depths: The depths of the grasps, a scalar or shape (B,).
+        insets: The distances along the edges to inset the grasp locations, a scalar or shape (B,).
+        top_grasps_near0: Whether the grasp at the top edge should be near the first keypoint, a scalar or shape (B,).
+
+    Returns:
+        The grasp locations with shape (B, 2, 3), and the approach directions with shape (B, 2, 3). The first grasp of
+        each towel is the grasp at its top edge.
+    """
+    keypoints = np.asarray(ordered_keypoints, dtype=np.float64)
+    grasp_depths = np.asarray(grasp_depths)[..., np.newaxis]
+    insets = np.asarray(insets)[..., np.newaxis]
+    near0 = np.asarray(top_grasps_near0)[..., np.newaxis]
+
+    left_bottom_to_top = keypoints[:, 1] - keypoints[:, 2]
+    right_bottom_to_top = keypoints[:, 0] - keypoints[:, 3]
+
+    bottom_to_top = (left_bottom_to_top + right_bottom_to_top) / 2
+    bottom_to_top /= np.linalg.norm(bottom_to_top, axis=-1, keepdims=True)
 
     # Project and normalize
-    approach_direction_top[2] = 0
-    approach_direction_bottom[2] = 0
-    approach_direction_top /= np.linalg.norm(approach_direction_top)
-    approach_direction_bottom /= np.linalg.norm(approach_direction_bottom)
+    approach_direction_bottom = bottom_to_top.copy()
+    approach_direction_bottom[:, 2] = 0
+    approach_direction_bottom /= np.linalg.norm(approach_direction_bottom, axis=-1, keepdims=True)
+    approach_direction_top = -approach_direction_bottom
 
-    top_left_to_right = ordered_keypoints[0] - ordered_keypoints[1]
-    bottom_left_to_right = ordered_keypoints[3] - ordered_keypoints[2]
+    top_left_to_right = keypoints[:, 0] - keypoints[:, 1]
+    bottom_left_to_right = keypoints[:, 3] - keypoints[:, 2]
     left_to_right = (top_left_to_right + bottom_left_to_right) / 2
-    left_to_right /= np.linalg.norm(left_to_right)
+    left_to_right /= np.linalg.norm(left_to_right, axis=-1, keepdims=True)
 
-    if top_grasp_near0:
-        location_top = ordered_keypoints[0] - inset * left_to_right
-        location_bottom = ordered_keypoints[2] + inset * left_to_right
-    else:
-        location_top = ordered_keypoints[1] + inset * left_to_right
-        location_bottom = ordered_keypoints[3] - inset * left_to_right
+    location_top = np.where(near0, keypoints[:, 0] - insets * left_to_right, keypoints[:, 1] + insets * left_to_right)
+    location_bottom = np.where(
+        near0, keypoints[:, 2] + insets * left_to_right, keypoints[:, 3] - insets * left_to_right
+    )
 
-    location_top += grasp_depth * approach_direction_top
-    location_bottom += grasp_depth * approach_direction_bottom
+    location_top += grasp_depths * approach_direction_top
+    location_bottom += grasp_depths * approach_direction_bottom
 
-    grasp_top = (location_top, approach_direction_top)
-    grasp_bottom = (location_bottom, approach_direction_bottom)
-
-    return grasp_top, grasp_bottom
+    locations = np.stack([location_top, location_bottom], axis=1)
+    approach_directions = np.stack([approach_direction_top, approach_direction_bottom], axis=1)
+    return locations, approach_directions
 
 
 # def towel_opposing_grasps(ordered_keypoints, parallel_near_edge=(0, 1)):
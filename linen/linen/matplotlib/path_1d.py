@@ -11,7 +11,10 @@ def make_2d(path_1d: Path):
     def path_2d(t: float) -> np.ndarray:
         return np.array([t, path_1d(t)])
 
-    return Path(path_2d, start_time=path_1d.start_time, end_time=path_1d.end_time)
+    def paths_2d(times: np.ndarray) -> np.ndarray:
+        return np.column_stack([times, path_1d.sample(times)])
+
+    return Path(path_2d, start_time=path_1d.start_time, end_time=path_1d.end_time, batch_function=paths_2d)
 
 
 def plot_path_1d(
@@ -77,22 +77,11 @@ def colorline(
 
 
 def calculate_path_2d_limits(path: Path, num_path_samples: int = 100):
-    x_min = np.inf
-    x_max = -np.inf
-    y_min = np.inf
-    y_max = -np.inf
-
     t_range = np.linspace(path.start_time, path.end_time, num_path_samples)
+    points = path.sample(t_range)
 
-    for t in t_range:
-        x, y = path(t)
-        x_min = min(x_min, x)
-        x_max = max(x_max, x)
-        y_min = min(y_min, y)
-        y_max = max(y_max, y)
-
-    xlim = np.array([x_min, x_max])
-    ylim = np.array([y_min, y_max])
+    xlim = np.array([points[:, 0].min(), points[:, 0].max()])
+    ylim = np.array([points[:, 1].min(), points[:, 1].max()])
     return xlim, ylim
 
 
@@ -137,8 +126,8 @@ def plot_path_2d(
     if grid:
         ax.grid()
 
-    points = [path(t) for t in np.linspace(0, path.duration, 100)]
-    xs, ys = np.array(points).T
+    points = path.sample(np.linspace(0, path.duration, 100))
+    xs, ys = points.T
 
     if cmap is not None:
         colorline(ax, xs, ys, cmap=cmap)
@@ -38,8 +38,8 @@ def plot_path_3d(
     grid: bool = True,
     ax: plt.Axes = None,
 ) -> plt.Axes:
-    points = [path(t) for t in np.linspace(0, path.duration, 100)]
-    xs, ys, zs = np.array(points).T
+    points = path.sample(np.linspace(0, path.duration, 100))
+    xs, ys, zs = points.T
 
     if ax is None:
         _, ax = plt.subplots(subplot_kw={"projection": "3d"})
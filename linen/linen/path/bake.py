@@ -0,0 +1,115 @@
+from typing import Callable, Tuple
+
+import numpy as np
+
+from linen.geometry.quaternion import (
+    make_quaternions_continuous,
+    matrices_to_quaternions,
+    quaternions_to_matrices,
+    slerp_quaternions,
+)
+from linen.path.compact import position_quaternion_path
+from linen.path.fusion import fuse
+from linen.path.path import Path, expand_times, named_builder
+
+
+def bake_times(path: Path, rate_hz: float) -> np.ndarray:
+    """The evenly spaced times at which a path is sampled when baking it. The first and last time are exactly the
+    start and end of the path, so the actual sample rate is slightly higher than rate_hz.
+
+    Args:
+        path: The path to bake.
+        rate_hz: The minimum amount of samples per unit of time.
+
+    Returns:
+        The sample times.
+    """
+    num_samples = max(2, int(np.ceil(path.duration * rate_hz)) + 1)
+    return np.linspace(path.start_time, path.end_time, num_samples)
+
+
+def pose_table_function(
+    table: np.ndarray, lookup: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]], representation: str
+) -> Callable[[np.ndarray], np.ndarray]:
+    # Evaluate a (N, 7) table of compact poses, lerping the positions and slerping the quaternions.
+    positions, quaternions = table[:, :3], make_quaternions_continuous(table[:, 3:])
+
+    def batch_function(query_times: np.ndarray) -> np.ndarray:
+        indices, fractions = lookup(query_times)
+        slerped = slerp_quaternions(quaternions[indices], quaternions[indices + 1], fractions)
+        interpolated_positions = positions[indices] + fractions[:, np.newaxis] * (
+            positions[indices + 1] - positions[indices]
+        )
+        if representation == "position_quaternion":
+            return np.concatenate([interpolated_positions, slerped], axis=-1)
+        values = np.zeros((len(query_times), 4, 4))
+        values[:, :3, :3] = quaternions_to_matrices(slerped)
+        values[:, :3, 3] = interpolated_positions
+        values[:, 3, 3] = 1.0
+        return values
+
+    return batch_function
+
+
+@named_builder
+def baked_path(path: Path, rate_hz: float, representation: str = "matrix", dtype: np.dtype = np.float64) -> Path:
+    """Sample a path once into a contiguous table and return a new path that is evaluated from that table.
+
+    Evaluating a baked path costs the same for every t: an index computation and an interpolation between two
+    neighbouring samples, regardless of how many closures the original path was composed of. Values are interpolated
+    linearly, except for orientations (3x3) and poses (4x4) where the rotation block is interpolated with slerp.
+
+    Poses are tabulated in the compact (N, 7) position + quaternion format, so the table of a pose path is 4.6 times
+    smaller than its 4x4 samples when dtype is np.float32.
+
+    Args:
+        path: The path to bake.
+        rate_hz: The minimum amount of samples per unit of time, e.g. the frequency of the control loop.
+        representation: For pose paths, whether the baked path returns 4x4 poses ("matrix") or the compact
+            (x, y, z, qx, qy, qz, qw) vectors ("position_quaternion").
+        dtype: The floating point type of the table.
+
+    Returns:
+        The baked path, with the same domain as the original path.
+    """
+    times = bake_times(path, rate_hz)
+    fused = fuse(path)
+    start_time = path.start_time
+    num_intervals = len(times) - 1
+    interval = path.duration / num_intervals
+
+    def lookup(query_times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if interval == 0.0:
+            return np.zeros(len(query_times), dtype=int), np.zeros(len(query_times))
+        u = (query_times - start_time) / interval
+        indices = np.clip(np.floor(u).astype(int), 0, num_intervals - 1)
+        return indices, u - indices
+
+    value_shape = np.shape(fused(start_time))
+    if representation != "matrix" and (representation != "position_quaternion" or value_shape != (4, 4)):
+        raise ValueError(f"Values of shape {value_shape} can't be baked to the {representation} representation")
+
+    if value_shape == (4, 4):
+        table = position_quaternion_path(fused).sample(times, out=np.empty((len(times), 7), dtype=dtype))
+        batch_function = pose_table_function(table, lookup, representation)
+
+    elif value_shape == (3, 3):
+        quaternions = make_quaternions_continuous(matrices_to_quaternions(fused.sample(times))).astype(dtype)
+
+        def batch_function(query_times: np.ndarray) -> np.ndarray:
+            indices, fractions = lookup(query_times)
+            slerped = slerp_quaternions(quaternions[indices], quaternions[indices + 1], fractions)
+            return quaternions_to_matrices(slerped)
+
+    else:
+        samples = np.ascontiguousarray(fused.sample(times), dtype=dtype)
+
+        def batch_function(query_times: np.ndarray) -> np.ndarray:
+            indices, fractions = lookup(query_times)
+            fractions = expand_times(fractions, samples[0])
+            return samples[indices] + fractions * (samples[indices + 1] - samples[indices])
+
+    def function(t: float) -> np.ndarray:
+        return batch_function(np.array([t]))[0]
+
+    return Path(function, path.start_time, path.end_time, batch_function)
@@ -0,0 +1,216 @@
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from linen.path.path import Path
+
+# Opt-in memoization of builder functions such as slide_grasp_trajectory or circular_fold_trajectory, which planners
+# call again with the same keypoints across retries and visualization passes. Paths are immutable, so a cached path can
+# safely be returned to several callers. Nothing is cached unless a builder is wrapped explicitly.
+
+DEFAULT_TOLERANCE = 1e-9
+# Values whose bin is not below this are hashed by value, the bins must fit in an int64.
+MAX_BIN = 2.0**62
+
+
+def update_array_hash(digest: Any, array: np.ndarray, tolerance: float) -> None:
+    # Floating point values that differ by much less than the tolerance map to the same integer bins. Values close to
+    # the boundary between two bins can still map to different bins, which only costs a cache miss. Values without a
+    # bin, because they are not finite or too large for int64 bins, are hashed by their value and position instead.
+    if not np.issubdtype(array.dtype, np.floating):
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        # Object arrays, e.g. of Python integers too large for int64, have no stable bytes.
+        digest.update(
+            repr(array.tolist()).encode() if array.dtype == object else np.ascontiguousarray(array).tobytes()
+        )
+        return
+    # Floating point arrays of any precision share their bins.
+    digest.update(f"f{array.shape}".encode())
+    values = array.astype(np.float64)
+    if tolerance == 0.0:
+        binned = np.zeros(values.shape, dtype=bool)
+    else:
+        with np.errstate(over="ignore", invalid="ignore"):
+            bins = np.round(values / tolerance)
+        binned = np.isfinite(bins) & (np.abs(bins) < MAX_BIN)
+        digest.update(np.where(binned, bins, 0.0).astype(np.int64).tobytes())
+    # All NaNs are hashed alike, regardless of their payload.
+    unbinned = values[~binned]
+    digest.update(np.packbits(binned.ravel()).tobytes())
+    digest.update(np.where(np.isnan(unbinned), np.nan, unbinned).tobytes())
+
+
+def update_hash(digest: Any, value: Any, tolerance: float) -> None:
+    # Hash a value by content, recursing into containers. Values that are not numbers, arrays or containers are
+    # hashed by their repr, so they should have one that identifies them, like strings, enums and None.
+    if isinstance(value, (dict, list, tuple)):
+        items = sorted(value.items()) if isinstance(value, dict) else enumerate(value)
+        digest.update(f"{type(value).__name__}{len(value)}(".encode())
+        for key, item in items:
+            digest.update(repr(key).encode())
+            update_hash(digest, item, tolerance)
+        digest.update(b")")
+    elif isinstance(value, (np.ndarray, float, int, np.number)) and not isinstance(value, bool):
+        update_array_hash(digest, np.asarray(value), tolerance)
+    else:
+        digest.update(repr(value).encode())
+
+
+def cache_key(builder: Callable[..., Any], args: Tuple, kwargs: Dict[str, Any], tolerance: float) -> str:
+    """A stable hash of a builder call, in which arrays and floats are compared up to the tolerance.
+
+    The arguments are bound to the parameters of the builder first, with the defaults filled in, so that calls that
+    pass the same values positionally, by keyword or by default share a key.
+
+    Args:
+        builder: The builder function, its qualified name is part of the key.
+        args: The positional arguments of the call.
+        kwargs: The keyword arguments of the call.
+        tolerance: The quantization step of floating point values.
+
+    Returns:
+        The hexadecimal digest of the call.
+    """
+    arguments = inspect.signature(builder).bind(*args, **kwargs)
+    arguments.apply_defaults()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{builder.__module__}.{builder.__qualname__}".encode())
+    update_hash(digest, list(arguments.arguments.items()), tolerance)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    """The usage of a BuilderCache since it was created or cleared.
+
+    Attributes:
+        hits: The amount of calls that returned a cached result.
+        misses: The amount of calls that ran the builder.
+        evictions: The amount of results that were dropped because the cache was full.
+        size: The amount of results currently in the cache.
+        max_size: The maximal amount of results in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls > 0 else 0.0
+
+
+class BuilderCache:
+    """A bounded least recently used cache of builder results, keyed by the content of the builder arguments.
+
+    Example:
+        cache = BuilderCache(max_size=256, bake_rate_hz=500.0)
+        cached_slide_grasp_trajectory = cache.wrap(slide_grasp_trajectory)
+        trajectory = cached_slide_grasp_trajectory(grasp_location, approach_direction)
+        print(cache.statistics())
+
+    One cache can be shared by several builders, the name of the builder is part of the key. It is safe to use from
+    several threads, but two threads that miss on the same key at the same time both run the builder.
+    """
+
+    def __init__(
+        self, max_size: int = 128, tolerance: float = DEFAULT_TOLERANCE, bake_rate_hz: Optional[float] = None
+    ) -> None:
+        """
+        Args:
+            max_size: The maximal amount of results to keep, the least recently used result is evicted first.
+            tolerance: The quantization step of floating point arguments, e.g. 1e-6 to treat keypoints that differ by
+                less than a micrometer as equal.
+            bake_rate_hz: When given, paths returned by the builders are baked at this rate before they are cached,
+                see Path.bake. Paths inside returned tuples and lists are baked too.
+        """
+        if max_size < 1:
+            raise ValueError(f"The cache must hold at least one result, got max_size={max_size}.")
+        self.max_size = max_size
+        self.tolerance = tolerance
+        self.bake_rate_hz = bake_rate_hz
+        self._results: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get_or_build(self, builder: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """The cached result of builder(*args, **kwargs), which is built and cached first if needed."""
+        # The key is computed before building, because some builders normalize their array arguments in place.
+        key = cache_key(builder, args, kwargs, self.tolerance)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return self._results[key]
+            self._misses += 1
+
+        result = self._baked(builder(*args, **kwargs))
+
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def wrap(self, builder: Callable[..., Any]) -> Callable[..., Any]:
+        """The builder with its results cached in this cache, can also be used as a decorator."""
+
+        @functools.wraps(builder)
+        def cached_builder(*args: Any, **kwargs: Any) -> Any:
+            return self.get_or_build(builder, *args, **kwargs)
+
+        cached_builder.cache = self  # type: ignore
+        return cached_builder
+
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(self._hits, self._misses, self._evictions, len(self._results), self.max_size)
+
+    def clear(self) -> None:
+        """Drop all results and reset the statistics."""
+        with self._lock:
+            self._results.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _baked(self, result: Any) -> Any:
+        if self.bake_rate_hz is None:
+            return result
+        if isinstance(result, Path):
+            return result.bake(self.bake_rate_hz)
+        if isinstance(result, (tuple, list)):
+            return type(result)(self._baked(item) for item in result)
+        return result
+
+
+def cached_builder(
+    builder: Callable[..., Any],
+    max_size: int = 128,
+    tolerance: float = DEFAULT_TOLERANCE,
+    bake_rate_hz: Optional[float] = None,
+) -> Callable[..., Any]:
+    """Wrap a builder with its own BuilderCache, which is available as the cache attribute of the wrapper.
+
+    Args:
+        builder: The builder function, e.g. linear_slerp_trajectory.
+        max_size: The maximal amount of results to keep.
+        tolerance: The quantization step of floating point arguments.
+        bake_rate_hz: When given, the returned paths are baked at this rate before they are cached.
+
+    Returns:
+        The cached builder, which takes the same arguments.
+    """
+    return BuilderCache(max_size, tolerance, bake_rate_hz).wrap(builder)
@@ -1,11 +1,65 @@
+from dataclasses import dataclass, field, replace
+from typing import Callable, Optional
+
 import numpy as np
 from airo_typing import Vector3DType
 
 from linen.geometry.project import project_point_on_line
-from linen.geometry.rotate import rotate_orientation, rotate_point, rotate_pose
-from linen.path.path import Path
+from linen.geometry.rotate import cross_product_matrix, point_rotation_kernel, pose_rotation_kernel, rotation_kernel
+from linen.path.path import Path, PathNode, named_builder
+
+
+def circular_arc_derivative_path(
+    start: np.ndarray, center: Vector3DType, axis: Vector3DType, angular_speed: float, end_time: float, n: int
+) -> Path:
+    """
+    The exact n-th derivative of a circular arc path where the angle is angular_speed * t.
+
+    The arc is R(angular_speed * t) applied to the start relative to the center. Because the rotation R commutes with
+    the cross product matrix K of its unit axis, the n-th derivative is angular_speed^n * R(angular_speed * t) K^n
+    applied to the start relative to the center. For poses, the derivative of the bottom row of the matrix is zero.
+
+    Args:
+        start: The start position (3,), orientation (3, 3) or pose (4, 4) of the arc.
+        center: The center of the rotation, ignored for orientations.
+        axis: The axis to rotate around, which will be normalized.
+        angular_speed: The rate of change of the angle with respect to the path parameter.
+        end_time: The end of the domain of the arc.
+        n: The order of the derivative.
+
+    Returns:
+        The path of n-th derivatives.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    derivative_matrix = angular_speed**n * np.linalg.matrix_power(cross_product_matrix(axis), n)
+
+    if start.shape == (3,):
+        relative_start = derivative_matrix @ (start - center)
+    elif start.shape == (3, 3):
+        relative_start = derivative_matrix @ start
+    else:
+        relative_start = np.zeros((4, 4))
+        relative_start[:3, :3] = derivative_matrix @ start[:3, :3]
+        relative_start[:3, 3] = derivative_matrix @ (start[:3, 3] - center)
+
+    # The rotation only acts on the top three rows, the bottom row of a pose derivative stays zero.
+    rotate = rotation_kernel(relative_start[:3], axis)
+    is_pose = start.shape == (4, 4)
+
+    def function(t: float) -> np.ndarray:
+        return np.vstack([rotate(angular_speed * t), np.zeros((1, 4))]) if is_pose else rotate(angular_speed * t)
+
+    def batch_function(times: np.ndarray) -> np.ndarray:
+        if not is_pose:
+            return rotate(angular_speed * times)
+        values = np.zeros((len(times), 4, 4))
+        values[:, :3] = rotate(angular_speed * times)
+        return values
 
+    return Path(function, start_time=0.0, end_time=end_time, batch_function=batch_function)
 
+
+@named_builder
 def circular_arc_position_path(
     start: Vector3DType, center: Vector3DType, axis: Vector3DType, max_angle: float
 ) -> Path:
@@ -16,18 +70,33 @@ def circular_arc_position_path(
         start: The start position, the point that will be rotated.
         center: The center of the rotation.
         axis: The axis to rotate around, which will be normalized.
-        max_angle: The maximum angle in radians to rotate by. Determines the length of the path.
+        max_angle: The maximum angle in radians to rotate by. Determines the length of the path. Negative angles rotate
+            clockwise around the axis, the path is then a function of the absolute angle.
 
     Returns:
         The path of positions in function of angle.
     """
 
+    rotate = point_rotation_kernel(start, center, axis)
+
+    # Negative angles rotate clockwise, the path parameter is then the absolute angle.
+    direction = 1.0 if max_angle >= 0 else -1.0
+    end_angle = abs(max_angle)
+
     def function(angle: float) -> Vector3DType:
-        return rotate_point(start, center, axis, angle)
+        return rotate(direction * angle)
+
+    def batch_function(angles: np.ndarray) -> np.ndarray:
+        return rotate(direction * angles)
 
-    return Path(function, start_time=0.0, end_time=max_angle)
+    def derivative(n: int) -> Path:
+        return circular_arc_derivative_path(start, center, axis, direction, end_angle, n)
 
+    node = PathNode("arc", parameters={"start": start, "center": center, "axis": axis, "max_angle": max_angle})
+    return Path(function, 0.0, end_angle, batch_function=batch_function, node=node, derivative=derivative)
 
+
+@named_builder
 def circular_arc_orientation_path(start_orientation, axis, max_angle: float) -> Path:
     """
     A path of orientations on a circular arc in function of angle, created by rotating a start orientation.
@@ -35,18 +104,33 @@ def circular_arc_orientation_path(start_orientation, axis, max_angle: float) ->
     Args:
         start_orientation: The start orientation, the orientation that will be rotated.
         axis: The axis to rotate around, which will be normalized.
-        max_angle: The maximum angle in radians to rotate by.
+        max_angle: The maximum angle in radians to rotate by. Negative angles rotate clockwise around the axis, the path
+            is then a function of the absolute angle.
 
     Returns:
         The path of orientations in function of angle.
     """
 
+    rotate = rotation_kernel(start_orientation, axis)
+
+    # Negative angles rotate clockwise, the path parameter is then the absolute angle.
+    direction = 1.0 if max_angle >= 0 else -1.0
+    end_angle = abs(max_angle)
+
     def function(angle: float) -> np.ndarray:
-        return rotate_orientation(start_orientation, axis, angle)
+        return rotate(direction * angle)
+
+    def batch_function(angles: np.ndarray) -> np.ndarray:
+        return rotate(direction * angles)
 
-    return Path(function, start_time=0.0, end_time=max_angle)
+    def derivative(n: int) -> Path:
+        return circular_arc_derivative_path(start_orientation, np.zeros(3), axis, direction, end_angle, n)
 
+    node = PathNode("arc", parameters={"start": start_orientation, "axis": axis, "max_angle": max_angle})
+    return Path(function, 0.0, end_angle, batch_function=batch_function, node=node, derivative=derivative)
 
+
+@named_builder
 def circular_arc_path(start_pose: np.ndarray, center: Vector3DType, axis: Vector3DType, max_angle: float) -> Path:
     """
     A path of poses on a circular arc in function of angle, created by rotating a start pose.
@@ -55,18 +139,169 @@ def circular_arc_path(start_pose: np.ndarray, center: Vector3DType, axis: Vector
         start_pose: The start pose, the pose that will be rotated.
         center: The center of the rotation.
         axis: The axis to rotate around, which will be normalized.
-        max_angle: The maximum angle in radians to rotate by. Determines the length of the path.
+        max_angle: The maximum angle in radians to rotate by. Determines the length of the path. Negative angles rotate
+            clockwise around the axis, the path is then a function of the absolute angle.
 
     Returns:
         The path of poses in function of angle.
     """
 
+    rotate = pose_rotation_kernel(start_pose, center, axis)
+
+    # Negative angles rotate clockwise, the path parameter is then the absolute angle.
+    direction = 1.0 if max_angle >= 0 else -1.0
+    end_angle = abs(max_angle)
+
     def function(angle: float) -> np.ndarray:
-        return rotate_pose(start_pose, center, axis, angle)
+        return rotate(direction * angle)
+
+    def batch_function(angles: np.ndarray) -> np.ndarray:
+        return rotate(direction * angles)
+
+    def derivative(n: int) -> Path:
+        return circular_arc_derivative_path(start_pose, center, axis, direction, end_angle, n)
+
+    node = PathNode("arc", parameters={"start": start_pose, "center": center, "axis": axis, "max_angle": max_angle})
+    return Path(function, 0.0, end_angle, batch_function=batch_function, node=node, derivative=derivative)
+
+
+@dataclass(frozen=True, eq=False)
+class CircularArc:
+    """A circular arc, compiled once so that positions, orientations, poses and tangents at arrays of angles are
+    evaluated in closed form with a handful of array operations.
 
-    return Path(function, start_time=0.0, end_time=max_angle)
+    Angles are measured around the axis with the right-hand rule, from the start point that was used to build the arc.
+    The arc goes from start_angle to end_angle, which can be in either order and are not limited to [0, 2 pi], e.g. an
+    arc from 0 to -pi / 2 rotates clockwise. So reversing an arc only swaps these angles, see reversed().
+
+    Attributes:
+        center: The center of the circle, i.e. the projection of the start point on the axis.
+        axis: The unit axis of rotation.
+        radius: The radius of the circle.
+        basis_x: Unit vector in the plane of the circle, from the center to the point at angle 0.
+        basis_y: Unit vector in the plane of the circle, the cross product of the axis and basis_x.
+        start_angle: The angle at the start of the arc.
+        end_angle: The angle at the end of the arc.
+        orientation: The orientation at angle 0, or None for arcs of positions.
+    """
+
+    center: np.ndarray
+    axis: np.ndarray
+    radius: float
+    basis_x: np.ndarray
+    basis_y: np.ndarray
+    start_angle: float
+    end_angle: float
+    orientation: Optional[np.ndarray] = None
+    rotate_orientation: Optional[Callable[[np.ndarray], np.ndarray]] = field(default=None, repr=False)
+
+    @property
+    def direction(self) -> float:
+        """1.0 when the angle increases along the arc, -1.0 when it decreases."""
+        return 1.0 if self.end_angle >= self.start_angle else -1.0
+
+    @property
+    def length(self) -> float:
+        return self.radius * abs(self.end_angle - self.start_angle)
+
+    def reversed(self) -> "CircularArc":
+        return replace(self, start_angle=self.end_angle, end_angle=self.start_angle)
+
+    def angular_speed(self, speed: float) -> float:
+        """The signed rate of change of the angle when the arc is traveled at the given speed in meters per second."""
+        return self.direction * speed / self.radius
+
+    def angular_velocity(self, speed: float) -> np.ndarray:
+        """The angular velocity vector when the arc is traveled at the given speed, which is the same along the arc."""
+        return self.angular_speed(speed) * self.axis
+
+    def positions(self, angles: np.ndarray) -> np.ndarray:
+        """The positions at a scalar angle, shape (3,), or at an array of N angles, shape (N, 3)."""
+        angles = np.expand_dims(angles, -1)
+        return self.center + self.radius * (np.cos(angles) * self.basis_x + np.sin(angles) * self.basis_y)
+
+    def tangents(self, angles: np.ndarray) -> np.ndarray:
+        """The unit tangents in the direction of travel along the arc, shape (3,) or (N, 3)."""
+        angles = np.expand_dims(angles, -1)
+        return self.direction * (np.cos(angles) * self.basis_y - np.sin(angles) * self.basis_x)
+
+    def orientations(self, angles: np.ndarray) -> np.ndarray:
+        """The orientations at a scalar angle, shape (3, 3), or an array of N angles, shape (N, 3, 3)."""
+        if self.rotate_orientation is None:
+            raise ValueError("This arc was built from a position, so it has no orientations.")
+        return self.rotate_orientation(angles)
+
+    def poses(self, angles: np.ndarray) -> np.ndarray:
+        """The poses at a scalar angle, shape (4, 4), or an array of N angles, shape (N, 4, 4)."""
+        poses = np.zeros(np.shape(angles) + (4, 4))
+        poses[..., :3, :3] = self.orientations(angles)
+        poses[..., :3, 3] = self.positions(angles)
+        poses[..., 3, 3] = 1.0
+        return poses
+
+    def values(self, angles: np.ndarray) -> np.ndarray:
+        """The poses for arcs built from a pose, else the positions."""
+        return self.positions(angles) if self.orientation is None else self.poses(angles)
+
+
+def circular_arc(start: np.ndarray, center: Vector3DType, axis: Vector3DType, max_angle: float) -> CircularArc:
+    """Compile the circular arc traced by rotating a start position or pose around an axis.
+
+    Args:
+        start: The start position (3,) or start pose (4, 4).
+        center: A point on the axis of rotation.
+        axis: The axis to rotate around, which will be normalized.
+        max_angle: The angle in radians to rotate by, negative angles rotate clockwise around the axis.
+
+    Returns:
+        The compiled arc, which goes from angle 0 to max_angle.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    orientation = start[:3, :3] if start.shape == (4, 4) else None
+    position = start[:3, 3] if start.shape == (4, 4) else start
+
+    unit_axis = np.asarray(axis, dtype=np.float64) / np.linalg.norm(axis)
+    circle_center = project_point_on_line(position, (center, unit_axis))
+    offset = position - circle_center
+    radius = float(np.linalg.norm(offset))
+    basis_x = offset / radius if radius > 0.0 else np.zeros(3)
+    basis_y = np.cross(unit_axis, basis_x)
+
+    rotate_orientation = rotation_kernel(orientation, unit_axis) if orientation is not None else None
+    return CircularArc(
+        circle_center, unit_axis, radius, basis_x, basis_y, 0.0, float(max_angle), orientation, rotate_orientation
+    )
+
+
+def arc_trajectory(arc: CircularArc, speed: float) -> Path:
+    """A trajectory that travels a compiled circular arc at a constant speed, from its start angle to its end angle.
+
+    Args:
+        arc: The arc, built with circular_arc() and possibly reversed.
+        speed: The speed in meters per second.
+
+    Returns:
+        The trajectory of poses, or positions if the arc was built from a position.
+    """
+    # Duration is length / speed, the length of a circular arc is the central angle times the radius.
+    end_time = arc.length / speed
+    angular_speed = arc.angular_speed(speed)
+    start_angle = arc.start_angle
+
+    def function(time: float) -> np.ndarray:
+        return arc.values(start_angle + angular_speed * time)
+
+    def batch_function(times: np.ndarray) -> np.ndarray:
+        return arc.values(start_angle + angular_speed * times)
+
+    def derivative(n: int) -> Path:
+        return circular_arc_derivative_path(arc.values(start_angle), arc.center, arc.axis, angular_speed, end_time, n)
+
+    node = PathNode("arc", parameters={"arc": arc, "speed": speed})
+    return Path(function, 0.0, end_time, batch_function=batch_function, node=node, derivative=derivative)
 
 
+@named_builder
 def circular_arc_position_trajectory(
     start: Vector3DType,
     center: Vector3DType,
@@ -81,28 +316,17 @@ def circular_arc_position_trajectory(
         start: The start position, the point that will be rotated.
         center: The center of the rotation.
         axis: The axis to rotate around, which will be normalized.
-        max_angle: The maximum angle in radians to rotate by. Determines the length of the path.
+        max_angle: The maximum angle in radians to rotate by. Determines the length of the path. Negative angles rotate
+            clockwise around the axis.
         speed: The speed in meters per second.
 
     Returns:
         The trajectory of positions in function of time.
     """
-    start_projected = project_point_on_line(start, (center, axis))
-    radius = np.linalg.norm(start_projected - start)
-
-    # If we use angle = time, the speed along the path is 1 radius/s.
-    # If we use angle = time / radius, the speed along the path is 1 m/s.
-    # If we use angle = speed * (time / radius), we get a path with the desired speed.
-    def function(time: float) -> Vector3DType:
-        angle = speed * (time / radius)
-        return rotate_point(start, center, axis, angle)
-
-    # Duration is length / speed, the length of a circular arc is the central angle times the radius.
-    end_time = (radius * max_angle) / speed
-
-    return Path(function, start_time=0.0, end_time=end_time)
+    return arc_trajectory(circular_arc(start, center, axis, max_angle), speed)
 
 
+@named_builder
 def circular_arc_trajectory(
     start: np.ndarray,
     center: Vector3DType,
@@ -117,24 +341,11 @@ def circular_arc_trajectory(
         start: The start pose, the pose that will be rotated.
         center: The center of the rotation.
         axis: The axis to rotate around, which will be normalized.
-        max_angle: The maximum angle in radians to rotate by. Determines the length of the path.
+        max_angle: The maximum angle in radians to rotate by. Determines the length of the path. Negative angles rotate
+            clockwise around the axis.
         speed: The speed in meters per second.
 
     Returns:
         The trajectory of poses in function of time.
     """
-    start_position = start[:3, 3]
-    start_projected = project_point_on_line(start_position, (center, axis))
-    radius = np.linalg.norm(start_projected - start_position)
-
-    # If we use angle = time, the speed along the path is 1 radius/s.
-    # If we use angle = time / radius, the speed along the path is 1 m/s.
-    # If we use angle = speed * (time / radius), we get a path with the desired speed.
-    def function(time: float) -> Vector3DType:
-        angle = speed * (time / radius)
-        return rotate_pose(start, center, axis, angle)
-
-    # Duration is length / speed, the length of a circular arc is the central angle times the radius.
-    end_time = (radius * max_angle) / speed
-
-    return Path(function, start_time=0.0, end_time=end_time)
+    return arc_trajectory(circular_arc(start, center, axis, max_angle), speed)
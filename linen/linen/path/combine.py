@@ -1,11 +1,15 @@
 import numpy as np
 
-from linen.path.path import Path
+from linen.path.path import Path, PathNode, named_builder
 
 
+@named_builder
 def combine_orientation_and_position_paths(orientation: Path, position: Path) -> Path:
     """Combine an orientation and position path into a pose path.
 
+    Batches of poses can be written into a caller-supplied (N, 4, 4) buffer with pose_path.sample(times, out=buffer).
+    The child paths then fill the rotation and translation blocks of that buffer in place.
+
     Args:
         orientation: The orientation path that returns 3x3 matrices.
         position: The position path.
@@ -20,9 +24,21 @@ def combine_orientation_and_position_paths(orientation: Path, position: Path) ->
         pose[:3, 3] = position(t)
         return pose
 
+    def fill_poses(times: np.ndarray, out: np.ndarray) -> None:
+        orientation.sample(times, out=out[:, :3, :3])
+        position.sample(times, out=out[:, :3, 3])
+        out[:, 3, :3] = 0.0
+        out[:, 3, 3] = 1.0
+
+    def poses(times: np.ndarray) -> np.ndarray:
+        poses = np.empty((len(times), 4, 4))
+        fill_poses(times, poses)
+        return poses
+
     # TODO maybe enforce/assert that the trajectories are start and end together?
     # Combining two incorrect trajectories has resulted in a bug for me.
     start = min(orientation.start_time, position.start_time)
     end = max(orientation.end_time, position.end_time)
 
-    return Path(pose, start, end)
+    node = PathNode("combine", children=(orientation, position))
+    return Path(pose, start, end, batch_function=poses, fill_function=fill_poses, node=node)
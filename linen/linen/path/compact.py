@@ -0,0 +1,84 @@
+import numpy as np
+
+from linen.geometry.quaternion import make_quaternions_continuous, matrices_to_quaternions
+from linen.path.path import Path, PathNode, named_builder
+from linen.path.pose_interpolation import quaternion_pose_trajectory
+from linen.path.slerp import quaternion_slerp_trajectory
+
+# Pose paths return 4x4 matrices, but for storage the compact (N, 7) position + quaternion format of
+# linen.geometry.quaternion is 4.6 times smaller in float32. The paths made here return that format directly, and
+# builders that interpolate quaternions internally are rebuilt so that they never form the rotation matrices.
+
+
+@named_builder
+def quaternion_orientation_path(orientation: Path) -> Path:
+    """The (x, y, z, w) quaternions of an orientation path that returns 3x3 matrices."""
+    node = orientation.node
+    if node is not None and node.kind == "slerp":
+        return quaternion_slerp_trajectory(node.parameters["times"], node.parameters["quaternions"], "quaternion")
+
+    def quaternion(t: float) -> np.ndarray:
+        return matrices_to_quaternions(orientation(t))
+
+    def quaternions(times: np.ndarray) -> np.ndarray:
+        return make_quaternions_continuous(matrices_to_quaternions(orientation.sample(times)))
+
+    return Path(quaternion, orientation.start_time, orientation.end_time, batch_function=quaternions)
+
+
+@named_builder
+def position_quaternion_path(pose_path: Path) -> Path:
+    """Convert a pose path that returns 4x4 matrices into a path that returns (x, y, z, qx, qy, qz, qw) vectors.
+
+    Sampling the result with an out buffer writes the values straight into it, so a float32 buffer of shape (N, 7)
+    gives compact samples without an intermediate (N, 4, 4) array, e.g.
+        position_quaternion_path(path).sample(times, out=np.empty((len(times), 7), dtype=np.float32))
+
+    Args:
+        pose_path: The pose path.
+
+    Returns:
+        The path of compact poses, with the same domain.
+    """
+    node = pose_path.node
+    if node is not None and node.kind == "pose_interpolation":
+        parameters = node.parameters
+        if parameters["representation"] == "position_quaternion":
+            return pose_path
+        return quaternion_pose_trajectory(
+            parameters["times"],
+            parameters["positions"],
+            parameters["quaternions"],
+            parameters["mode"],
+            "position_quaternion",
+        )
+
+    if node is not None and node.kind == "combine":
+        orientation, position = node.children
+        quaternion = quaternion_orientation_path(orientation)
+
+        def function(t: float) -> np.ndarray:
+            return np.concatenate([position(t), quaternion(t)])
+
+        def fill_function(times: np.ndarray, out: np.ndarray) -> None:
+            position.sample(times, out=out[:, :3])
+            quaternion.sample(times, out=out[:, 3:])
+
+    else:
+
+        def function(t: float) -> np.ndarray:
+            pose = pose_path(t)
+            return np.concatenate([pose[:3, 3], matrices_to_quaternions(pose[:3, :3])])
+
+        def fill_function(times: np.ndarray, out: np.ndarray) -> None:
+            poses = pose_path.sample(times)
+            out[:, :3] = poses[:, :3, 3]
+            out[:, 3:] = make_quaternions_continuous(matrices_to_quaternions(poses[:, :3, :3]))
+
+    def batch_function(times: np.ndarray) -> np.ndarray:
+        out = np.empty((len(times), 7))
+        fill_function(times, out)
+        return out
+
+    node = PathNode("position_quaternion", children=(pose_path,))
+    return Path(function, pose_path.start_time, pose_path.end_time, batch_function, fill_function, node)
@@ -1,19 +1,89 @@
+from bisect import bisect_left
 from typing import List
 
 import numpy as np
 
-from linen.path.path import Path
+from linen.path.path import Path, PathNode, named_builder
+from linen.path.polynomial.polynomial import gathered_polynomial_function, padded_coefficients
 
 
+@named_builder
 def concatenate_trajectories(trajectories: List[Path]) -> Path:
-    durations = [trajectory.duration for trajectory in trajectories]
-    functions = [trajectory.function for trajectory in trajectories]
+    """Concatenate trajectories so that each one starts when the previous one ends.
 
-    def concatenated_functions(t: float) -> np.ndarray:
-        for function, duration in zip(functions, durations):
-            if t <= duration:
-                return function(t)
-            t -= duration  # go to next trajectory
-        return function(duration)  # if we get here, return last point
+    The cumulative end times of the trajectories are precomputed, so the active trajectory is found by bisection and
+    the cost of an evaluation does not grow with the amount of trajectories. At the boundary between two trajectories,
+    the end of the earlier trajectory is returned.
 
-    return Path(concatenated_functions, 0.0, sum(durations))
+    Args:
+        trajectories: The trajectories to concatenate.
+
+    Returns:
+        The concatenated trajectory, with domain [0, sum of durations].
+    """
+    durations = np.array([trajectory.duration for trajectory in trajectories])
+    end_times = np.cumsum(durations)
+    start_times = end_times - durations
+    end_times_list = end_times.tolist()
+    last_index = len(trajectories) - 1
+
+    def concatenated_function(t: float) -> np.ndarray:
+        i = min(bisect_left(end_times_list, t), last_index)
+        trajectory = trajectories[i]
+        return trajectory(trajectory.start_time + t - start_times[i])
+
+    value_shape = np.shape(trajectories[0].start)
+
+    # When all trajectories are polynomials, e.g. the segments of a spline, every sample is evaluated in one gathered
+    # kernel instead of one call per trajectory.
+    is_polynomial = all(
+        trajectory.node is not None and trajectory.node.kind == "polynomial" for trajectory in trajectories
+    )
+    if is_polynomial:
+        padded = padded_coefficients([trajectory.node.parameters["coefficients"] for trajectory in trajectories])
+        trajectory_start_times = np.array([trajectory.start_time for trajectory in trajectories])
+
+    def concatenated_fill_function(times: np.ndarray, out: np.ndarray) -> None:
+        indices = np.minimum(np.searchsorted(end_times, times, side="left"), last_index)
+        local_times = times - start_times[indices]
+
+        if is_polynomial:
+            out[...] = gathered_polynomial_function(padded, indices, trajectory_start_times[indices] + local_times)
+            return
+
+        # Group the samples per trajectory so that each trajectory is evaluated with a single vectorized call.
+        # For sorted times, the most common case, each group is a contiguous slice of out that is filled in place.
+        order = np.argsort(indices, kind="stable")
+        is_sorted = np.all(order[1:] > order[:-1])
+        sorted_indices = indices[order]
+        group_starts = np.flatnonzero(np.diff(sorted_indices, prepend=-1))
+        group_ends = np.append(group_starts[1:], len(times))
+
+        for group_start, group_end in zip(group_starts, group_ends):
+            trajectory = trajectories[sorted_indices[group_start]]
+            group = order[group_start:group_end]
+            group_times = trajectory.start_time + local_times[group]
+            if is_sorted:
+                trajectory.sample(group_times, out=out[group_start:group_end])
+            else:
+                out[group] = trajectory.sample(group_times)
+
+    def concatenated_batch_function(times: np.ndarray) -> np.ndarray:
+        values = np.empty((len(times),) + value_shape)
+        concatenated_fill_function(times, values)
+        return values
+
+    def derivative(n: int) -> Path:
+        return concatenate_trajectories([trajectory.derivative(n) for trajectory in trajectories])
+
+    has_derivatives = all(trajectory.derivative is not None for trajectory in trajectories)
+
+    return Path(
+        concatenated_function,
+        0.0,
+        float(end_times[-1]),
+        concatenated_batch_function,
+        concatenated_fill_function,
+        PathNode("concat", children=tuple(trajectories)),
+        derivative if has_derivatives else None,
+    )
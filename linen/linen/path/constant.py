@@ -1,10 +1,21 @@
 import numpy as np
 
-from linen.path.path import Path
+from linen.path.path import Path, PathNode, named_builder
 
 
+@named_builder
 def constant_trajectory(value: np.ndarray, duration: float) -> Path:
     def constant_function(t: float) -> np.ndarray:
         return value
 
-    return Path(constant_function, 0.0, duration)
+    def constant_batch_function(times: np.ndarray) -> np.ndarray:
+        return np.repeat(np.asarray(value)[np.newaxis], len(times), axis=0)
+
+    def constant_fill_function(times: np.ndarray, out: np.ndarray) -> None:
+        out[...] = value
+
+    def derivative(n: int) -> Path:
+        return constant_trajectory(np.zeros_like(value, dtype=np.float64), duration)
+
+    node = PathNode("constant", parameters={"value": value, "duration": duration})
+    return Path(constant_function, 0.0, duration, constant_batch_function, constant_fill_function, node, derivative)
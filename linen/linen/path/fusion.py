@@ -0,0 +1,171 @@
+from typing import List, Optional
+
+from linen.path.circular_arc import arc_trajectory
+from linen.path.combine import combine_orientation_and_position_paths
+from linen.path.concatenate import concatenate_trajectories
+from linen.path.constant import constant_trajectory
+from linen.path.linear import linear_duration_trajectory
+from linen.path.path import Path, PathNode
+from linen.path.pose_interpolation import quaternion_pose_trajectory
+from linen.path.reparametrization.speed import scale_speed
+from linen.path.slerp import quaternion_slerp_trajectory
+from linen.path.split import split_pose_path
+
+# Fusion rewrites the expression graph recorded in Path.node into an equivalent graph with fewer layers:
+#   - chains of time scales are collapsed into a single factor, which is then pushed down into the leaves,
+#     e.g. a time scaled linear trajectory becomes a linear trajectory with a shorter duration,
+#   - nested concatenations are flattened into a single concatenation,
+#   - splitting a combined pose path returns the original orientation or position path.
+# Paths without a node, or with a node kind that has no rewrite rule, are left untouched.
+
+
+def fuse(path: Path) -> Path:
+    """Simplify the construction graph of a path so that evaluating it costs about the same as evaluating its leaves.
+
+    Args:
+        path: The path to fuse.
+
+    Returns:
+        An equivalent path with fewer layers of wrapping, or the path itself if nothing could be simplified.
+    """
+    node = path.node
+    if node is None:
+        return path
+
+    if node.kind == "time_scale":
+        return time_scaled(fuse(node.children[0]), node.parameters["factor"])
+
+    if node.kind == "concat":
+        children = [fuse(child) for child in node.children]
+        flattened = flatten_concatenation(children)
+        if len(flattened) == len(node.children) and all(a is b for a, b in zip(flattened, node.children)):
+            return path
+        return concatenate_trajectories(flattened)
+
+    if node.kind == "combine":
+        orientation, position = (fuse(child) for child in node.children)
+        return fused_combination(path, orientation, position)
+
+    if node.kind == "split":
+        return split_block(fuse(node.children[0]), node.parameters["block"])
+
+    return path
+
+
+def starts_at_zero(path: Path) -> bool:
+    return path.start_time == 0.0
+
+
+def flatten_concatenation(trajectories: List[Path]) -> List[Path]:
+    flattened = []
+    for trajectory in trajectories:
+        node = trajectory.node
+        if node is not None and node.kind == "concat" and all(starts_at_zero(child) for child in node.children):
+            flattened.extend(node.children)
+        else:
+            flattened.append(trajectory)
+    return flattened
+
+
+def fused_combination(path: Path, orientation: Path, position: Path) -> Path:
+    # Combining the two halves of the same split pose path gives back that pose path.
+    orientation_node, position_node = orientation.node, position.node
+    if (
+        orientation_node is not None
+        and position_node is not None
+        and orientation_node.kind == "split"
+        and position_node.kind == "split"
+        and orientation_node.children[0] is position_node.children[0]
+    ):
+        return orientation_node.children[0]
+
+    if path.node is not None and orientation is path.node.children[0] and position is path.node.children[1]:
+        return path
+    return combine_orientation_and_position_paths(orientation, position)
+
+
+def split_block(pose_path: Path, block: str) -> Path:
+    """Take the orientation or position block of a pose path, without wrapping the pose path when possible.
+
+    Args:
+        pose_path: The pose path to split.
+        block: Either "orientation" or "position".
+
+    Returns:
+        The orientation or position path.
+    """
+    node = pose_path.node
+
+    if node is not None and node.kind == "combine":
+        child = node.children[0] if block == "orientation" else node.children[1]
+        if child.start_time == pose_path.start_time and child.end_time == pose_path.end_time:
+            return child
+
+    if node is not None and node.kind == "concat" and all(starts_at_zero(child) for child in node.children):
+        return concatenate_trajectories([split_block(child, block) for child in node.children])
+
+    if node is not None and node.kind == "time_scale":
+        return time_scaled(split_block(node.children[0], block), node.parameters["factor"])
+
+    orientation_path, position_path = split_pose_path(pose_path)
+    return orientation_path if block == "orientation" else position_path
+
+
+def time_scaled(trajectory: Path, factor: float) -> Path:
+    """The equivalent of scale_speed(trajectory, factor), with the factor pushed into the trajectory's leaves when their
+    builders allow it, so that no extra layer of time remapping is evaluated.
+
+    Args:
+        trajectory: The trajectory to scale. Must start at t=0.0.
+        factor: The factor to scale the speed by.
+
+    Returns:
+        The scaled trajectory.
+    """
+    if factor == 1.0:
+        return trajectory
+
+    node = trajectory.node
+    if node is None or not starts_at_zero(trajectory):
+        return scale_speed(trajectory, factor)
+
+    parameters = node.parameters
+
+    if node.kind == "time_scale":
+        return time_scaled(node.children[0], factor * parameters["factor"])
+
+    if node.kind == "concat" and all(starts_at_zero(child) for child in node.children):
+        return concatenate_trajectories([time_scaled(child, factor) for child in node.children])
+
+    if node.kind == "combine" and all(starts_at_zero(child) for child in node.children):
+        orientation, position = (time_scaled(child, factor) for child in node.children)
+        return combine_orientation_and_position_paths(orientation, position)
+
+    leaf = time_scaled_leaf(node, factor)
+    return leaf if leaf is not None else scale_speed(trajectory, factor)
+
+
+def time_scaled_leaf(node: PathNode, factor: float) -> Optional[Path]:
+    # Rebuild a leaf with the time scale applied to its builder arguments, None if its builder has no such rule.
+    parameters = node.parameters
+
+    if node.kind == "linear":
+        return linear_duration_trajectory(parameters["start"], parameters["end"], parameters["duration"] / factor)
+
+    if node.kind == "constant":
+        return constant_trajectory(parameters["value"], parameters["duration"] / factor)
+
+    if node.kind == "slerp":
+        times = parameters["times"] / factor
+        return quaternion_slerp_trajectory(times, parameters["quaternions"], parameters["representation"])
+
+    if node.kind == "pose_interpolation":
+        times = parameters["times"] / factor
+        return quaternion_pose_trajectory(
+            times, parameters["positions"], parameters["quaternions"], parameters["mode"], parameters["representation"]
+        )
+
+    if node.kind == "arc" and "speed" in parameters:
+        return arc_trajectory(parameters["arc"], parameters["speed"] * factor)
+
+    return None
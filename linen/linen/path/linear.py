@@ -4,29 +4,63 @@ import numpy as np
 
 from linen.path.combine import combine_orientation_and_position_paths
 from linen.path.constant import constant_trajectory
-from linen.path.path import Path
-from linen.path.slerp import slerp_trajectory
+from linen.path.path import Path, PathNode, expand_times, named_builder
+from linen.path.pose_interpolation import pose_interpolation_trajectory
 
 
 def linear_interpolation(a: np.ndarray, b: np.ndarray) -> Callable[[float], np.ndarray]:
     return lambda t: a + t * (b - a)
 
 
+def linear_interpolation_batch(a: np.ndarray, b: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+    return lambda times: a + expand_times(times, a) * (b - a)
+
+
+def linear_interpolation_fill(a: np.ndarray, b: np.ndarray) -> Callable[[np.ndarray, np.ndarray], None]:
+    difference = b - a
+
+    def fill(times: np.ndarray, out: np.ndarray) -> None:
+        np.multiply(expand_times(times, a), difference, out=out)
+        out += a
+
+    return fill
+
+
+@named_builder
 def linear_path(p0: np.ndarray, p1: np.ndarray) -> Path:
-    function = linear_interpolation(p0, p1)
-    return Path(function, 0.0, 1.0)
+    return linear_duration_trajectory(p0, p1, 1.0)
 
 
-def linear_trajectory(p0: np.ndarray, p1: np.ndarray, speed: float) -> Path:
-    """A linear path that you travel at a given constant speed."""
+@named_builder
+def linear_duration_trajectory(p0: np.ndarray, p1: np.ndarray, duration: float) -> Path:
+    """A linear path from p0 to p1 that takes the given duration."""
     linear = linear_interpolation(p0, p1)  # domain [0, 1]
-    length = np.linalg.norm(p1 - p0)
-    duration = length / speed
+    linear_batch = linear_interpolation_batch(p0, p1)
+    linear_fill = linear_interpolation_fill(p0, p1)
 
     def function(t: float) -> np.ndarray:
         return linear(t / duration)  # domain [0, duration]
 
-    return Path(function, 0.0, duration)
+    def batch_function(times: np.ndarray) -> np.ndarray:
+        return linear_batch(times / duration)
+
+    def fill_function(times: np.ndarray, out: np.ndarray) -> None:
+        linear_fill(times / duration, out)
+
+    def derivative(n: int) -> Path:
+        velocity = (p1 - p0) / duration
+        return constant_trajectory(velocity if n == 1 else np.zeros_like(velocity), duration)
+
+    node = PathNode("linear", parameters={"start": p0, "end": p1, "duration": duration})
+    return Path(function, 0.0, duration, batch_function, fill_function, node, derivative)
+
+
+@named_builder
+def linear_trajectory(p0: np.ndarray, p1: np.ndarray, speed: float) -> Path:
+    """A linear path that you travel at a given constant speed."""
+    length = np.linalg.norm(p1 - p0)
+    duration = length / speed
+    return linear_duration_trajectory(p0, p1, duration)
 
 
 def linear_constant_orientation_trajectory(p0: np.ndarray, p1: np.ndarray, orientation: np.ndarray, speed: float):
@@ -36,15 +70,8 @@ def linear_constant_orientation_trajectory(p0: np.ndarray, p1: np.ndarray, orien
     return combine_orientation_and_position_paths(orientation_trajectory, position_trajectory)
 
 
+@named_builder
 def linear_slerp_trajectory(pose0: np.ndarray, pose1: np.ndarray, speed: float) -> Path:
     """A linear position trajectory where the orientation is interpolated using slerp."""
-
-    p0, p1 = pose0[:3, 3], pose1[:3, 3]
-    position_trajectory = linear_trajectory(p0, p1, speed)
-
-    orientations = [pose0[:3, :3], pose1[:3, :3]]
-    times = [0.0, position_trajectory.duration]
-    orientation_trajectory = slerp_trajectory(times, orientations)
-
-    pose_trajectory = combine_orientation_and_position_paths(orientation_trajectory, position_trajectory)
-    return pose_trajectory
+    duration = np.linalg.norm(pose1[:3, 3] - pose0[:3, 3]) / speed
+    return pose_interpolation_trajectory([0.0, duration], [pose0, pose1])
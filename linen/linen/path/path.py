@@ -1,11 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable
+import dataclasses
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 import numpy as np
 
 
+@dataclass(frozen=True)
+class PathNode:
+    """A record of how a path was built, which together with the nodes of its children forms an expression graph.
+
+    The kind names the operation, e.g. "linear", "arc", "slerp", "constant", "polynomial" for leaves and "concat",
+    "time_scale", "combine" and "split" for compositions. The parameters are the builder arguments needed to rebuild
+    the path, which is what linen.path.fusion uses to simplify the graph.
+    """
+
+    kind: str
+    children: Tuple[Path, ...] = ()
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+
 @dataclass(frozen=True)
 class Path:
     """A path is a function that maps points from its scalar domain [start_time, end_time] to values.
@@ -22,11 +38,29 @@ class Path:
     However, we do not make seperate classes for each type of path (e.g. a linear, a quadratic bezier, circular etc.)
     as that would make composing and transforming paths more complex. We prefer the pattern with builder_functions e.g.
     linear_path, quadratic_bezier_path, etc. that return a Path with the correct path function and domain.
+
+    Builders can optionally supply a batch_function, a vectorized kernel that maps a 1D array of N times to a stacked
+    (N, ...) array of values. Path.sample() uses it when available and falls back to calling function per sample.
+    They can also supply a fill_function that writes those values into a caller-supplied (N, ...) buffer instead of
+    allocating a new array, which Path.sample(times, out=buffer) uses.
+
+    Builders can also record a PathNode that describes how the path was constructed. Paths without a node are
+    treated as opaque functions. Finally, builders whose derivatives exist in closed form can supply a derivative
+    function that maps an order n to the exact n-th derivative path, which linen.path.transformation.differentation
+    uses instead of numerical differentiation.
+
+    Public builders are decorated with named_builder, which records their name on the paths they return, e.g. for
+    linen.path.profiling. When a builder delegates to another builder, the outermost name is kept.
     """
 
     function: Callable[[float], np.ndarray]
     start_time: float
     end_time: float
+    batch_function: Optional[Callable[[np.ndarray], np.ndarray]] = None
+    fill_function: Optional[Callable[[np.ndarray, np.ndarray], None]] = None
+    node: Optional[PathNode] = field(default=None, compare=False)
+    derivative: Optional[Callable[[int], Path]] = None
+    name: Optional[str] = field(default=None, compare=False)
 
     @property
     def duration(self) -> float:
@@ -50,6 +84,95 @@ class Path:
             t = self.start_time
         return self.function(t)
 
+    def sample(self, times: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Evaluate the path at many times at once. Times outside the domain are clamped, like in __call__.
+
+        Args:
+            times: A 1D array of N times.
+            out: Optional buffer of shape (N, ...) to write the values into. Paths with a fill_function do this
+                without allocating intermediate arrays for the values.
+
+        Returns:
+            The values stacked in an array of shape (N, ...), this is out when it was given.
+        """
+        times = np.clip(np.asarray(times, dtype=np.float64), self.start_time, self.end_time)
+        if out is not None:
+            if self.fill_function is not None:
+                self.fill_function(times, out)
+            else:
+                out[...] = self._sample_clamped(times)
+            return out
+        return self._sample_clamped(times)
+
+    def _sample_clamped(self, times: np.ndarray) -> np.ndarray:
+        if self.batch_function is not None:
+            return self.batch_function(times)
+        return np.array([self.function(t) for t in times])
+
+    def bake(self, rate_hz: float, representation: str = "matrix", dtype: np.dtype = np.float64) -> Path:
+        """Sample this path once at the given rate into a table. See linen.path.bake.baked_path for details.
+
+        Args:
+            rate_hz: The minimum amount of samples per unit of time, e.g. the frequency of the control loop.
+            representation: For pose paths, "matrix" for 4x4 poses or "position_quaternion" for (N, 7) vectors.
+            dtype: The floating point type of the table, e.g. np.float32 to halve its memory.
+
+        Returns:
+            The baked path, which is evaluated in constant time by interpolating the table.
+        """
+        # Imported here because the baking module itself builds on Path.
+        from linen.path.bake import baked_path
+
+        return baked_path(self, rate_hz, representation, dtype)
+
+    def stream(self, rate_hz: float, chunk_size: int) -> Iterator[np.ndarray]:
+        """Generate the setpoints of this path at a fixed rate in chunks. See linen.path.stream for details and for the
+        asyncio variant that paces the chunks in real time.
+
+        Args:
+            rate_hz: The amount of setpoints per unit of time.
+            chunk_size: The amount of setpoints per chunk. The last chunk can be shorter.
+
+        Returns:
+            An iterator over arrays of shape (chunk_size, ...) with consecutive setpoints.
+        """
+        from linen.path.stream import stream_setpoints
+
+        return stream_setpoints(self, rate_hz, chunk_size)
+
     # TODO considers adding either convencience (holding value) or assert for sampling outside of domain
     # TODO consider distinguishing between PositionPath, OrientationPath and PosePath e.g. for visualization
     # TODO how to handle joint paths
+
+
+def named_builder(builder: Callable[..., Path]) -> Callable[..., Path]:
+    """Decorate a builder function so that the paths it returns carry its name, see Path.
+
+    Args:
+        builder: The builder function.
+
+    Returns:
+        The builder, with the same signature, that sets the name of the returned path.
+    """
+
+    @functools.wraps(builder)
+    def named(*args: Any, **kwargs: Any) -> Path:
+        path = builder(*args, **kwargs)
+        return dataclasses.replace(path, name=builder.__name__)
+
+    return named
+
+
+def expand_times(times: np.ndarray, value: np.ndarray) -> np.ndarray:
+    """Reshape a 1D array of times so that it broadcasts against values shaped like the given value.
+
+    This makes it possible to reuse scalar formulas such as a + t * (b - a) as vectorized kernels.
+
+    Args:
+        times: A 1D array of N times.
+        value: A single value of the path, e.g. a point of shape (3,).
+
+    Returns:
+        The times with shape (N, 1, ..., 1), with one trailing axis per dimension of the value.
+    """
+    return np.reshape(times, (-1,) + (1,) * np.ndim(value))
@@ -2,7 +2,8 @@ from typing import Callable
 
 import numpy as np
 
-from linen.path.path import Path
+from linen.path.path import Path, named_builder
+from linen.path.polynomial.polynomial import polynomial_path
 
 
 # Quadratic Bezier curve
@@ -10,9 +11,15 @@ def quadratic_bezier_function(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray) ->
     return lambda t: (1 - t) ** 2 * p0 + 2 * (1 - t) * t * p1 + t**2 * p2
 
 
+def quadratic_bezier_coefficients(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    """The coefficients of the quadratic Bezier curve in the power basis 1, t, t^2."""
+    p0, p1, p2 = np.asarray(p0), np.asarray(p1), np.asarray(p2)
+    return np.array([p0, 2 * (p1 - p0), p0 - 2 * p1 + p2])
+
+
+@named_builder
 def quadratic_bezier_path(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray) -> Path:
-    function = quadratic_bezier_function(p0, p1, p2)
-    return Path(function, start_time=0.0, end_time=1.0)
+    return polynomial_path(quadratic_bezier_coefficients(p0, p1, p2))
 
 
 # Cubic Bezier curve
@@ -22,6 +29,12 @@ def cubic_bezier_function(
     return lambda t: (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t**2 * p2 + t**3 * p3
 
 
+def cubic_bezier_coefficients(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
+    """The coefficients of the cubic Bezier curve in the power basis 1, t, t^2, t^3."""
+    p0, p1, p2, p3 = np.asarray(p0), np.asarray(p1), np.asarray(p2), np.asarray(p3)
+    return np.array([p0, 3 * (p1 - p0), 3 * (p0 - 2 * p1 + p2), -p0 + 3 * p1 - 3 * p2 + p3])
+
+
+@named_builder
 def cubic_bezier_path(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Path:
-    function = cubic_bezier_function(p0, p1, p2, p3)
-    return Path(function, start_time=0.0, end_time=1.0)
+    return polynomial_path(cubic_bezier_coefficients(p0, p1, p2, p3))
@@ -2,13 +2,14 @@ from typing import Callable
 
 import numpy as np
 
-from linen.path.path import Path
+from linen.path.path import Path, named_builder
+from linen.path.polynomial.polynomial import polynomial_path
 
 # Note that SciPy also has a BSpline class we could use.
 # https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.BSpline.html
 
 
-def bspline_function(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Callable[[float], np.ndarray]:
+def bspline_characteristic_matrix() -> np.ndarray:
     characteristic_matrix = np.array(
         [
             [1, 4, 1, 0],
@@ -19,6 +20,11 @@ def bspline_function(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndar
         dtype=np.float64,
     )
     characteristic_matrix /= 6.0
+    return characteristic_matrix
+
+
+def bspline_function(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Callable[[float], np.ndarray]:
+    characteristic_matrix = bspline_characteristic_matrix()
 
     def bspline(t):
         t_vector = np.array([1, t, t**2, t**3])
@@ -27,6 +33,6 @@ def bspline_function(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndar
     return bspline
 
 
+@named_builder
 def bspline_path(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Path:
-    function = bspline_function(p0, p1, p2, p3)
-    return Path(function, start_time=0.0, end_time=1.0)
+    return polynomial_path(bspline_characteristic_matrix() @ np.array([p0, p1, p2, p3]))
@@ -3,10 +3,11 @@ from typing import List
 import numpy as np
 
 from linen.path.concatenate import concatenate_trajectories
-from linen.path.path import Path
+from linen.path.path import Path, named_builder
 from linen.path.polynomial.hermite import hermite_path
 
 
+@named_builder
 def catmull_rom_path(points: List[np.ndarray]) -> Path:
     tangents = []
     for i in range(len(points)):
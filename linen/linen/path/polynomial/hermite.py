@@ -2,7 +2,8 @@ from typing import Callable
 
 import numpy as np
 
-from linen.path.path import Path
+from linen.path.path import Path, named_builder
+from linen.path.polynomial.polynomial import polynomial_path
 
 
 # Hermite curve
@@ -15,6 +16,12 @@ def hermite_function(p0: np.ndarray, v0: np.ndarray, p1: np.ndarray, v1: np.ndar
     )
 
 
+def hermite_coefficients(p0: np.ndarray, v0: np.ndarray, p1: np.ndarray, v1: np.ndarray) -> np.ndarray:
+    """The coefficients of the Hermite curve in the power basis 1, t, t^2, t^3."""
+    p0, v0, p1, v1 = np.asarray(p0), np.asarray(v0), np.asarray(p1), np.asarray(v1)
+    return np.array([p0, v0, -3 * p0 - 2 * v0 + 3 * p1 - v1, 2 * p0 + v0 - 2 * p1 + v1])
+
+
+@named_builder
 def hermite_path(p0: np.ndarray, v0: np.ndarray, p1: np.ndarray, v1: np.ndarray) -> Path:
-    function = hermite_function(p0, v0, p1, v1)
-    return Path(function, start_time=0.0, end_time=1.0)
+    return polynomial_path(hermite_coefficients(p0, v0, p1, v1))
@@ -0,0 +1,140 @@
+from bisect import bisect_right
+from typing import List
+
+import numpy as np
+
+from linen.path.path import Path, PathNode, expand_times, named_builder
+
+
+def polynomial_function(coefficients: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """Evaluate sum_k coefficients[k] * t^k with Horner's method, the coefficients may be arrays e.g. 3D points.
+
+    Args:
+        coefficients: The coefficients, shape (degree + 1, ...), starting from the constant term.
+        times: The times, either a scalar or a 1D array of N times.
+
+    Returns:
+        The values, shape (...) for a scalar time or (N, ...) for an array of times.
+    """
+    if np.ndim(times) > 0:
+        times = expand_times(times, coefficients[0])
+    values = coefficients[-1] * np.ones_like(times)
+    for coefficient in coefficients[-2::-1]:
+        values = values * times + coefficient
+    return values
+
+
+def derivative_coefficients(coefficients: np.ndarray, n: int) -> np.ndarray:
+    """The coefficients of the n-th derivative of a polynomial, a single zero coefficient if the degree is below n."""
+    if n >= len(coefficients):
+        return np.zeros_like(coefficients[:1])
+    powers = np.arange(n, len(coefficients))
+    factors = np.ones(len(powers))
+    for i in range(n):
+        factors *= powers - i
+    return expand_times(factors, coefficients[0]) * coefficients[n:]
+
+
+@named_builder
+def polynomial_path(coefficients: np.ndarray, start_time: float = 0.0, end_time: float = 1.0) -> Path:
+    """A path whose values are a polynomial in t with (possibly vector-valued) coefficients.
+
+    Its derivatives are polynomial paths too, so they are exact. The coefficients are recorded in a "polynomial" node,
+    which lets concatenations of polynomial paths evaluate all of their segments with a single gathered kernel.
+
+    Args:
+        coefficients: The coefficients, shape (degree + 1, ...), starting from the constant term.
+        start_time: The start of the domain.
+        end_time: The end of the domain.
+
+    Returns:
+        The polynomial path.
+    """
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+
+    def derivative(n: int) -> Path:
+        return polynomial_path(derivative_coefficients(coefficients, n), start_time, end_time)
+
+    return Path(
+        lambda t: polynomial_function(coefficients, t),
+        start_time,
+        end_time,
+        batch_function=lambda times: polynomial_function(coefficients, times),
+        node=PathNode("polynomial", parameters={"coefficients": coefficients}),
+        derivative=derivative,
+    )
+
+
+def padded_coefficients(coefficients: List[np.ndarray]) -> np.ndarray:
+    """Stack the coefficients of polynomials of different degrees, padded with zeros to the highest degree.
+
+    Args:
+        coefficients: K arrays of coefficients, starting from the constant term, with the same value shape.
+
+    Returns:
+        The padded coefficients, shape (K, max degree + 1, ...).
+    """
+    max_length = max(len(c) for c in coefficients)
+    value_shape = np.shape(coefficients[0])[1:]
+    padded = np.zeros((len(coefficients), max_length) + value_shape)
+    for i, piece_coefficients in enumerate(coefficients):
+        padded[i, : len(piece_coefficients)] = piece_coefficients
+    return padded
+
+
+def gathered_polynomial_function(padded: np.ndarray, pieces: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """Evaluate a different polynomial for each sample, gathering the coefficients in one indexing operation.
+
+    Args:
+        padded: The padded coefficients of K polynomials, see padded_coefficients.
+        pieces: For each of the N samples, the index of the polynomial to evaluate.
+        times: The N times to evaluate the polynomials at.
+
+    Returns:
+        The values, shape (N, ...).
+    """
+    piece_coefficients = padded[pieces]  # (N, degree + 1, ...)
+    expanded_times = expand_times(times, padded[0, 0])
+    values = piece_coefficients[:, -1]
+    for k in range(padded.shape[1] - 2, -1, -1):
+        values = values * expanded_times + piece_coefficients[:, k]
+    return values
+
+
+@named_builder
+def piecewise_polynomial_path(breakpoints: np.ndarray, coefficients: List[np.ndarray]) -> Path:
+    """A path made of polynomial pieces, piece i is used for t in [breakpoints[i], breakpoints[i + 1]).
+
+    The pieces are polynomials in t itself (not in t - breakpoints[i]), which matches how most motion profiles are
+    written down in the literature. The pieces can have different degrees.
+
+    Args:
+        breakpoints: The K + 1 increasing times that delimit the K pieces, the first and last are the domain.
+        coefficients: K arrays of coefficients, starting from the constant term.
+
+    Returns:
+        The piecewise polynomial path.
+    """
+    breakpoints = np.asarray(breakpoints, dtype=np.float64)
+    coefficients = [np.asarray(c, dtype=np.float64) for c in coefficients]
+
+    # Pad all pieces to the same degree so the coefficients can be gathered per sample in one indexing operation.
+    padded = padded_coefficients(coefficients)
+
+    inner_breakpoints = breakpoints[1:-1]
+    inner_breakpoints_list = inner_breakpoints.tolist()
+
+    def function(t: float) -> np.ndarray:
+        i = bisect_right(inner_breakpoints_list, t)
+        return polynomial_function(coefficients[i], t)
+
+    def batch_function(times: np.ndarray) -> np.ndarray:
+        pieces = np.searchsorted(inner_breakpoints, times, side="right")
+        return gathered_polynomial_function(padded, pieces, times)
+
+    def derivative(n: int) -> Path:
+        derivatives = [derivative_coefficients(piece_coefficients, n) for piece_coefficients in coefficients]
+        return piecewise_polynomial_path(breakpoints, derivatives)
+
+    start_time, end_time = float(breakpoints[0]), float(breakpoints[-1])
+    return Path(function, start_time, end_time, batch_function=batch_function, derivative=derivative)
@@ -0,0 +1,171 @@
+from typing import Callable, List
+
+import numpy as np
+
+from linen.geometry.quaternion import matrices_to_quaternions, multiply_quaternions, quaternions_to_matrices
+from linen.path.path import Path, PathNode, named_builder
+from linen.path.slerp import QuaternionKeyframes, quaternion_keyframes, scalar_slerp_kernel
+
+# Both modes slerp the orientation, they differ in the path of the position between two keyframes:
+#   - "decoupled" interpolates the position linearly, independent of the rotation,
+#   - "screw" moves the pose along the screw motion between the keyframes, i.e. it rotates around a fixed axis while
+#     translating along that axis. This is the constant velocity twist in SE(3), and the path a point rigidly
+#     attached to a rotating tool actually follows.
+POSE_INTERPOLATION_MODES = ("decoupled", "screw")
+POSE_REPRESENTATIONS = ("matrix", "position_quaternion")
+
+
+def screw_position_kernel(
+    keyframes: QuaternionKeyframes, positions: np.ndarray
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Precompute the screw motion of the positions between consecutive keyframes.
+
+    The relative rotation of an interval has unit axis k and angle theta. Its screw axis passes through a point c and
+    the translation along it is d. At fraction f, the position is the start position rotated by f * theta around the
+    screw axis (Rodrigues' formula) plus f * d * k.
+
+    Args:
+        keyframes: The orientation keyframes.
+        positions: The positions of the keyframes, shape (K, 3).
+
+    Returns:
+        A function that maps N interval indices and fractions to positions with shape (N, 3), or a single index and
+        fraction to a position with shape (3,).
+    """
+    q0, q1 = keyframes.quaternions[:-1], keyframes.quaternions[1:]
+    conjugates = q0 * np.array([-1.0, -1.0, -1.0, 1.0])
+    relative = multiply_quaternions(q1, conjugates)
+    rotation_angles = 2.0 * keyframes.angles
+
+    # Intervals without rotation are a pure translation, which the same formula expresses with c = p0 and u = 0.
+    screw = ~keyframes.nearly_parallel
+    axes = np.zeros_like(positions[:-1])
+    axes[screw] = relative[screw, :3] / np.linalg.norm(relative[screw, :3], axis=-1, keepdims=True)
+
+    p0, p1 = positions[:-1], positions[1:]
+    translations = p1 - np.einsum("kij,kj->ki", quaternions_to_matrices(relative), p0)
+    pitches = np.sum(axes * translations, axis=-1)
+    perpendicular = translations - pitches[:, np.newaxis] * axes
+    cotangents = np.zeros_like(rotation_angles)
+    cotangents[screw] = 1.0 / np.tan(rotation_angles[screw] / 2.0)
+    centers = 0.5 * (perpendicular + cotangents[:, np.newaxis] * np.cross(axes, perpendicular))
+
+    centers = np.where(screw[:, np.newaxis], centers, p0)
+    offsets = np.where(screw[:, np.newaxis], p0 - centers, 0.0)
+    offsets_cross = np.cross(axes, offsets)
+    offsets_axial = np.sum(axes * offsets, axis=-1, keepdims=True) * axes
+    steps = np.where(screw[:, np.newaxis], pitches[:, np.newaxis] * axes, p1 - p0)
+
+    def screw_positions(indices: np.ndarray, fractions: np.ndarray) -> np.ndarray:
+        fractions = np.asarray(fractions)[..., np.newaxis]
+        angles = fractions * rotation_angles[indices, np.newaxis]
+        cosines = np.cos(angles)
+        return (
+            centers[indices]
+            + cosines * offsets[indices]
+            + np.sin(angles) * offsets_cross[indices]
+            + (1.0 - cosines) * offsets_axial[indices]
+            + fractions * steps[indices]
+        )
+
+    return screw_positions
+
+
+@named_builder
+def quaternion_pose_trajectory(
+    times: List[float],
+    positions: np.ndarray,
+    quaternions: np.ndarray,
+    mode: str = "decoupled",
+    representation: str = "matrix",
+) -> Path:
+    """Create a pose path that interpolates between keyframes given as positions and unit quaternions.
+
+    The position and the orientation are evaluated together in one vectorized pass: a binary search for the keyframe
+    intervals of all times, followed by a few array operations on precomputed per interval quantities.
+
+    Args:
+        times: The increasing times of the K keyframes, at least two.
+        positions: The positions of the keyframes, shape (K, 3).
+        quaternions: The orientations of the keyframes as (x, y, z, w) quaternions, shape (K, 4).
+        mode: How the position moves between keyframes, "decoupled" or "screw", see POSE_INTERPOLATION_MODES.
+        representation: "matrix" for 4x4 poses or "position_quaternion" for (x, y, z, qx, qy, qz, qw) vectors.
+
+    Returns:
+        The path of interpolated poses.
+    """
+    if mode not in POSE_INTERPOLATION_MODES:
+        raise ValueError(f"Unknown pose interpolation mode {mode}, use one of {list(POSE_INTERPOLATION_MODES)}")
+    if representation not in POSE_REPRESENTATIONS:
+        raise ValueError(f"Unknown pose representation {representation}, use one of {list(POSE_REPRESENTATIONS)}")
+
+    keyframes = quaternion_keyframes(times, quaternions)
+    positions = np.asarray(positions, dtype=np.float64)
+
+    if mode == "screw":
+        interpolate_positions = screw_position_kernel(keyframes, positions)
+    else:
+        steps = np.diff(positions, axis=0)
+
+        def interpolate_positions(indices: np.ndarray, fractions: np.ndarray) -> np.ndarray:
+            return positions[indices] + np.asarray(fractions)[..., np.newaxis] * steps[indices]
+
+    def fill_function(sample_times: np.ndarray, out: np.ndarray) -> None:
+        indices, fractions = keyframes.locate(sample_times)
+        if representation == "matrix":
+            out[:, :3, :3] = quaternions_to_matrices(keyframes.interpolate(indices, fractions))
+            out[:, :3, 3] = interpolate_positions(indices, fractions)
+            out[:, 3, :3] = 0.0
+            out[:, 3, 3] = 1.0
+        else:
+            out[:, :3] = interpolate_positions(indices, fractions)
+            out[:, 3:] = keyframes.interpolate(indices, fractions)
+
+    value_shape = (4, 4) if representation == "matrix" else (7,)
+
+    def batch_function(sample_times: np.ndarray) -> np.ndarray:
+        out = np.empty((len(sample_times),) + value_shape)
+        fill_function(sample_times, out)
+        return out
+
+    locate_and_interpolate = scalar_slerp_kernel(keyframes)
+
+    def function(t: float) -> np.ndarray:
+        i, fraction, quaternion = locate_and_interpolate(t)
+        position = interpolate_positions(i, fraction)
+        if representation == "position_quaternion":
+            return np.concatenate([position, quaternion])
+        pose = np.identity(4)
+        pose[:3, :3] = quaternions_to_matrices(quaternion)
+        pose[:3, 3] = position
+        return pose
+
+    parameters = {
+        "times": keyframes.times,
+        "positions": positions,
+        "quaternions": keyframes.quaternions,
+        "mode": mode,
+        "representation": representation,
+    }
+    node = PathNode("pose_interpolation", parameters=parameters)
+    return Path(function, float(keyframes.times[0]), float(keyframes.times[-1]), batch_function, fill_function, node)
+
+
+@named_builder
+def pose_interpolation_trajectory(
+    times: List[float], poses: List[np.ndarray], mode: str = "decoupled", representation: str = "matrix"
+) -> Path:
+    """Create a pose path that interpolates between 4x4 pose keyframes, e.g. grasp, lift and laydown poses.
+
+    Args:
+        times: The increasing times of the K keyframes, at least two.
+        poses: The 4x4 poses of the keyframes.
+        mode: How the position moves between keyframes, "decoupled" or "screw", see POSE_INTERPOLATION_MODES.
+        representation: "matrix" for 4x4 poses or "position_quaternion" for (x, y, z, qx, qy, qz, qw) vectors.
+
+    Returns:
+        The path of interpolated poses.
+    """
+    poses = np.asarray(poses, dtype=np.float64)
+    quaternions = matrices_to_quaternions(poses[:, :3, :3])
+    return quaternion_pose_trajectory(times, poses[:, :3, 3], quaternions, mode, representation)
@@ -0,0 +1,166 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from linen.path.path import Path
+
+# The profiler replaces Path.__call__ and Path.sample on the class itself, and only while it is active. So when no
+# profiler is active, evaluating a path runs the original methods and there is no overhead at all.
+active_profiler: Optional["PathProfiler"] = None
+
+
+@dataclass
+class ProfileEntry:
+    """The evaluations of paths built by the same builder, at the same position in the call tree.
+
+    Attributes:
+        calls: The amount of calls of path(t) or path.sample(times).
+        samples: The amount of times evaluated, a scalar call counts as one sample.
+        total_time: The time spent in these calls, including the time spent evaluating nested paths.
+        self_time: The time spent in these calls, excluding the time spent evaluating nested paths.
+    """
+
+    calls: int = 0
+    samples: int = 0
+    total_time: float = 0.0
+    self_time: float = 0.0
+
+
+def builder_name(path: Path) -> str:
+    """The name of the builder that made a path, e.g. slerp_trajectory, as recorded by named_builder. Other paths are
+    named after the function their path function was defined in, or else by their node kind, if they have one.
+
+    Args:
+        path: The path.
+
+    Returns:
+        The name of the builder.
+    """
+    if path.name is not None:
+        return path.name
+    qualified_name = getattr(path.function, "__qualname__", "")
+    name = qualified_name.split(".<locals>")[0]
+    if name and name != "<lambda>":
+        return name
+    if path.node is not None:
+        return path.node.kind
+    return "path"
+
+
+class PathProfiler:
+    """Context manager that counts and times the evaluations of all paths, keyed by builder name and call stack.
+
+    Example:
+        with PathProfiler() as profiler:
+            trajectory.sample(times)
+        print(profiler.table())
+
+    Only one profiler can be active at a time. Evaluations in other threads are recorded too, each thread has its own
+    call stack so that concurrent evaluations, e.g. of several streams, are attributed to the right builders.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[Tuple[str, ...], ProfileEntry] = {}
+        self._threads = threading.local()
+        self._entries_lock = threading.Lock()
+        self._original_call: Optional[Callable[..., Any]] = None
+        self._original_sample: Optional[Callable[..., Any]] = None
+
+    def __enter__(self) -> "PathProfiler":
+        global active_profiler
+        if active_profiler is not None:
+            raise RuntimeError("A PathProfiler is already active.")
+        active_profiler = self
+
+        original_call, original_sample = Path.__call__, Path.sample
+        self._original_call, self._original_sample = original_call, original_sample
+        profiler = self
+
+        def profiled_call(path: Path, t: float) -> np.ndarray:
+            return profiler._record(builder_name(path), 1, lambda: original_call(path, t))
+
+        def profiled_sample(path: Path, times: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+            return profiler._record(builder_name(path), len(times), lambda: original_sample(path, times, out))
+
+        Path.__call__ = profiled_call  # type: ignore
+        Path.sample = profiled_sample  # type: ignore
+        return self
+
+    def __exit__(self, *exception_info: Any) -> None:
+        global active_profiler
+        Path.__call__ = self._original_call  # type: ignore
+        Path.sample = self._original_sample  # type: ignore
+        self._original_call = self._original_sample = None
+        active_profiler = None
+
+    def _thread_stacks(self) -> Tuple[List[str], List[float]]:
+        # The builder names and the time spent in nested evaluations of the calls in progress in this thread.
+        if not hasattr(self._threads, "stack"):
+            self._threads.stack, self._threads.child_times = [], []
+        return self._threads.stack, self._threads.child_times
+
+    def _record(self, name: str, samples: int, evaluate: Callable[[], np.ndarray]) -> np.ndarray:
+        stack, child_times = self._thread_stacks()
+        stack.append(name)
+        child_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            return evaluate()
+        finally:
+            elapsed = time.perf_counter() - start
+            child_time = child_times.pop()
+            key = tuple(stack)
+            stack.pop()
+            if child_times:
+                child_times[-1] += elapsed
+
+            with self._entries_lock:
+                entry = self.entries.setdefault(key, ProfileEntry())
+                entry.calls += 1
+                entry.samples += samples
+                entry.total_time += elapsed
+                entry.self_time += elapsed - child_time
+
+    def by_builder(self) -> Dict[str, ProfileEntry]:
+        """The entries summed per builder, regardless of where in the call tree the paths were evaluated.
+
+        The total time of a builder whose paths are nested in paths of the same builder is only counted for the
+        outermost evaluations, so that it is not counted twice.
+
+        Returns:
+            The summed entries, keyed by builder name.
+        """
+        summed: Dict[str, ProfileEntry] = {}
+        for stack, entry in self.entries.items():
+            name = stack[-1]
+            total = summed.setdefault(name, ProfileEntry())
+            total.calls += entry.calls
+            total.samples += entry.samples
+            total.self_time += entry.self_time
+            if name not in stack[:-1]:
+                total.total_time += entry.total_time
+        return summed
+
+    def table(self) -> str:
+        """A table of the evaluations per builder, sorted by self time, the most expensive builder first."""
+        rows = sorted(self.by_builder().items(), key=lambda item: item[1].self_time, reverse=True)
+        width = max([len("builder")] + [len(name) for name, _ in rows])
+        lines = [f"{'builder':<{width}} {'calls':>10} {'samples':>12} {'total [ms]':>12} {'self [ms]':>12}"]
+        for name, entry in rows:
+            lines.append(
+                f"{name:<{width}} {entry.calls:>10} {entry.samples:>12} "
+                f"{entry.total_time * 1e3:>12.3f} {entry.self_time * 1e3:>12.3f}"
+            )
+        return "\n".join(lines)
+
+    def folded_stacks(self) -> str:
+        """The self times in microseconds in the folded stack format, one "outer;inner;innermost time" line per call
+        stack, which flamegraph.pl, speedscope and most other flame graph tools can read.
+        """
+        lines = []
+        for stack, entry in sorted(self.entries.items()):
+            lines.append(f"{';'.join(stack)} {round(entry.self_time * 1e6)}")
+        return "\n".join(lines)
@@ -1,56 +1,230 @@
-import numpy as np
-
-from linen.path.path import Path
-
-
-def integrate_arc_length(path: Path, num=50):
-    # TODO implement smarter method e.g. Gauss-Kronrod or Gaussian quadrature
-    arc_length_sum = 0
-    s_range = np.linspace(path.start_time, path.end_time, num)
-    for i in range(len(s_range) - 1):
-        s = s_range[i]
-        s_next = s_range[i + 1]
-        arc_length_sum += np.linalg.norm(path(s_next) - path(s))
-
-    return arc_length_sum
-
+from dataclasses import dataclass, field
+from typing import Callable, List, Tuple
 
-def create_arc_length_to_parameter_map(path: Path, num=1000):
-    arc_length_to_s: dict[float, float] = {0.0: 0.0}
-
-    arc_length_sum = 0
-    s_range = np.linspace(path.start_time, path.end_time, num)
-    for i in range(len(s_range) - 1):
-        s = s_range[i]
-        s_next = s_range[i + 1]
-        arc_length_sum += np.linalg.norm(path(s_next) - path(s))
-        arc_length_to_s[arc_length_sum] = s_next
-
-    return arc_length_to_s, arc_length_sum
-
-
-def arc_length_parametrize(path: Path):
-    arc_length_to_s, arc_length = create_arc_length_to_parameter_map(path)
-    arc_lengths = np.array(list(arc_length_to_s.keys()))
-
-    def arc_length_parametrized(t):
-        if np.isclose(t, 0.0):
-            return path.start
-        if np.isclose(t, arc_length):
-            return path.end
+import numpy as np
+from scipy.interpolate import CubicHermiteSpline
 
-        # TODO verify correctness of the 3 lines below
-        i = np.searchsorted(arc_lengths, t, side="right")
-        arc_length_next = arc_lengths[min(i, len(arc_lengths) - 1)]
-        arc_length_prev = arc_lengths[max(i - 1, 0)]
+from linen.path.path import Path, named_builder
+from linen.path.transformation.differentation import differentiated
 
-        s_prev = arc_length_to_s[arc_length_prev]
-        s_next = arc_length_to_s[arc_length_next]
+# Gauss-Legendre nodes and weights on [-1, 1]. The difference between both rules estimates the quadrature error.
+GAUSS_LEGENDRE_COARSE = np.polynomial.legendre.leggauss(8)
+GAUSS_LEGENDRE_FINE = np.polynomial.legendre.leggauss(16)
 
-        weight_next = (t - arc_length_prev) / (arc_length_next - arc_length_prev)
-        weight_prev = 1 - weight_next
 
-        s_interpolated = s_next * weight_next + s_prev * weight_prev
-        return path(s_interpolated)
+def speed_function(path: Path) -> Callable[[np.ndarray], np.ndarray]:
+    """The norm of the path's derivative, using the exact derivative when the path's builder provides one.
 
-    return Path(arc_length_parametrized, start_time=0.0, end_time=arc_length)
+    Args:
+        path: The path, its values are flattened so e.g. the speed of a pose path includes its rotation block.
+
+    Returns:
+        A vectorized function that maps an array of N parameters to N speeds.
+    """
+    derivative = differentiated(path)
+
+    def speeds(parameters: np.ndarray) -> np.ndarray:
+        return np.linalg.norm(derivative.sample(parameters).reshape(len(parameters), -1), axis=1)
+
+    return speeds
+
+
+def gauss_legendre(
+    speeds: Callable[[np.ndarray], np.ndarray],
+    a: np.ndarray,
+    b: np.ndarray,
+    rules: List[Tuple[np.ndarray, np.ndarray]],
+) -> List[np.ndarray]:
+    """Integrate the speed over many intervals [a, b] at once with Gauss-Legendre rules, sampling the path once."""
+    nodes = np.concatenate([rule_nodes for rule_nodes, _ in rules])
+    half_widths = (b - a) / 2
+    parameters = ((a + b) / 2)[:, np.newaxis] + half_widths[:, np.newaxis] * nodes
+    values = speeds(parameters.ravel()).reshape(parameters.shape)
+
+    integrals = []
+    offset = 0
+    for rule_nodes, weights in rules:
+        integrals.append(half_widths * (values[:, offset : offset + len(rule_nodes)] @ weights))
+        offset += len(rule_nodes)
+    return integrals
+
+
+def concatenation_joints(path: Path) -> np.ndarray:
+    # The parameters where the children of a concatenation meet, empty for other paths.
+    if path.node is None or path.node.kind != "concat":
+        return np.zeros(0)
+    return np.cumsum([child.duration for child in path.node.children])[:-1]
+
+
+def initial_breakpoints(path: Path, num_intervals: int) -> np.ndarray:
+    # The joints of a concatenation are where the speed can have kinks, so we never integrate across them.
+    breakpoints = np.linspace(path.start_time, path.end_time, num_intervals + 1)
+    return np.union1d(breakpoints, concatenation_joints(path))
+
+
+@dataclass(frozen=True)
+class ArcLengthTable:
+    """The arc length of a path as a function of its parameter, tabulated at adaptively chosen knots.
+
+    Both the forward map (parameter to arc length) and the inverse map are stored as arrays. The inverse map is a
+    monotone cubic Hermite interpolant that uses the exact slope 1 / speed at the knots, limited where needed to keep
+    it monotone.
+
+    Attributes:
+        parameters: The knots in the domain of the path, shape (K,).
+        arc_lengths: The arc length from the start of the path to each knot, shape (K,).
+        length: The total arc length of the path.
+        quadrature_error: Estimate of the absolute error of the tabulated arc lengths.
+        inverse_error: The largest arc length error of the inverse map measured between the knots.
+    """
+
+    parameters: np.ndarray
+    arc_lengths: np.ndarray
+    length: float
+    quadrature_error: float
+    inverse_error: float
+    inverse: CubicHermiteSpline = field(repr=False, compare=False)
+
+    def parameters_at(self, arc_lengths: np.ndarray) -> np.ndarray:
+        """The path parameters at which the given arc lengths are reached, vectorized."""
+        return self.inverse(np.clip(arc_lengths, 0.0, self.length))
+
+
+def monotone_slopes(arc_lengths: np.ndarray, parameters: np.ndarray, speeds: np.ndarray) -> np.ndarray:
+    # du/ds = 1 / speed, limited to 3 times the neighbouring secant slopes, which is sufficient for monotonicity.
+    secants = np.diff(parameters) / np.diff(arc_lengths)
+    slopes = 1.0 / np.maximum(speeds, np.finfo(np.float64).tiny)
+    slopes[:-1] = np.minimum(slopes[:-1], 3 * secants)
+    slopes[1:] = np.minimum(slopes[1:], 3 * secants)
+    return slopes
+
+
+def arc_length_table(
+    path: Path, tolerance: float = 1e-6, num_intervals: int = 16, max_iterations: int = 30
+) -> ArcLengthTable:
+    """Tabulate the arc length of a path with adaptive Gauss-Legendre quadrature of its speed.
+
+    Intervals are bisected until the quadrature error estimate is below their share of the tolerance. Then knots are
+    added until the inverse map is accurate to the tolerance (in arc length) halfway between knots.
+
+    Args:
+        path: The path to tabulate.
+        tolerance: The absolute arc length error to aim for.
+        num_intervals: The amount of intervals to start the adaptive quadrature with.
+        max_iterations: The maximum amount of refinement steps, for both the quadrature and the inverse map.
+
+    Returns:
+        The arc length table.
+    """
+    speeds = speed_function(path)
+    duration = path.duration
+
+    # Adaptive quadrature: keep the intervals whose two rules agree, bisect the others.
+    breakpoints = initial_breakpoints(path, num_intervals)
+    pending_a, pending_b = breakpoints[:-1], breakpoints[1:]
+    accepted_a, accepted_b, accepted_lengths, accepted_errors = [], [], [], []
+    for iteration in range(max_iterations):
+        fine, coarse = gauss_legendre(speeds, pending_a, pending_b, [GAUSS_LEGENDRE_FINE, GAUSS_LEGENDRE_COARSE])
+        errors = np.abs(fine - coarse)
+        converged = errors <= tolerance * (pending_b - pending_a) / duration
+        if iteration == max_iterations - 1:
+            converged[:] = True
+
+        accepted_a.append(pending_a[converged])
+        accepted_b.append(pending_b[converged])
+        accepted_lengths.append(fine[converged])
+        accepted_errors.append(errors[converged])
+
+        a, b = pending_a[~converged], pending_b[~converged]
+        if len(a) == 0:
+            break
+        middle = (a + b) / 2
+        pending_a, pending_b = np.concatenate([a, middle]), np.concatenate([middle, b])
+
+    a = np.concatenate(accepted_a)
+    order = np.argsort(a)
+    a, b = a[order], np.concatenate(accepted_b)[order]
+    interval_lengths = np.concatenate(accepted_lengths)[order]
+    quadrature_error = float(np.sum(np.concatenate(accepted_errors)))
+
+    parameters = np.append(a, b[-1])
+    arc_lengths = np.concatenate([[0.0], np.cumsum(interval_lengths)])
+
+    # Stretches without arc length can't be inverted, we keep the first parameter at which a length is reached.
+    increasing = np.concatenate([[True], np.diff(arc_lengths) > 0.0])
+    parameters, arc_lengths = parameters[increasing], arc_lengths[increasing]
+    if len(parameters) < 2:
+        # A path without any length, every arc length maps to the start.
+        inverse = CubicHermiteSpline([0.0, 1.0], np.full(2, path.start_time), np.zeros(2))
+        return ArcLengthTable(
+            np.array([path.start_time, path.end_time]), np.zeros(2), 0.0, quadrature_error, 0.0, inverse
+        )
+
+    # Add knots halfway between two knots where the inverse map is inaccurate. The Hermite interpolant of an interval
+    # only depends on its two knots, so intervals that were accurate once are not checked again.
+    knot_speeds = speeds(parameters)
+    interval_errors = np.full(len(parameters) - 1, np.inf)
+    for iteration in range(max_iterations):
+        inverse = CubicHermiteSpline(arc_lengths, parameters, monotone_slopes(arc_lengths, parameters, knot_speeds))
+
+        unchecked = np.flatnonzero(np.isinf(interval_errors))
+        if len(unchecked) == 0:
+            break
+        middles = (parameters[unchecked] + parameters[unchecked + 1]) / 2
+        (half_lengths,) = gauss_legendre(speeds, parameters[unchecked], middles, [GAUSS_LEGENDRE_FINE])
+        middle_lengths = arc_lengths[unchecked] + half_lengths
+        middle_speeds = speeds(middles)
+        errors = np.abs(inverse(middle_lengths) - middles) * middle_speeds
+
+        accurate = errors <= tolerance
+        if iteration == max_iterations - 1:
+            accurate[:] = True
+        interval_errors[unchecked[accurate]] = errors[accurate]
+        inaccurate = unchecked[~accurate]
+        if len(inaccurate) == 0:
+            break
+
+        # Insert the middles of the inaccurate intervals, both of their halves still have to be checked.
+        parameters = np.insert(parameters, inaccurate + 1, middles[~accurate])
+        arc_lengths = np.insert(arc_lengths, inaccurate + 1, middle_lengths[~accurate])
+        knot_speeds = np.insert(knot_speeds, inaccurate + 1, middle_speeds[~accurate])
+        interval_errors = np.insert(interval_errors, inaccurate + 1, np.inf)
+
+    inverse_error = float(np.max(interval_errors))
+    length = float(arc_lengths[-1])
+    return ArcLengthTable(parameters, arc_lengths, length, quadrature_error, inverse_error, inverse)
+
+
+def integrate_arc_length(path: Path, tolerance: float = 1e-6) -> float:
+    """The length of a path, computed with adaptive Gauss-Legendre quadrature of its speed.
+
+    Args:
+        path: The path.
+        tolerance: The absolute error to aim for.
+
+    Returns:
+        The arc length.
+    """
+    return arc_length_table(path, tolerance).length
+
+
+@named_builder
+def arc_length_parametrize(path: Path, tolerance: float = 1e-6) -> Path:
+    """Reparametrize a path by arc length, so that traversing it with unit parameter speed has unit speed in space.
+
+    Args:
+        path: The path to reparametrize.
+        tolerance: The absolute arc length error to aim for, the achieved error is reported by arc_length_table.
+
+    Returns:
+        The arc length parametrized path, with domain [0, length].
+    """
+    table = arc_length_table(path, tolerance)
+
+    def arc_length_parametrized(s: float) -> np.ndarray:
+        return path(float(table.parameters_at(s)))
+
+    def arc_length_parametrized_batch(arc_lengths: np.ndarray) -> np.ndarray:
+        return path.sample(table.parameters_at(arc_lengths))
+
+    return Path(arc_length_parametrized, 0.0, table.length, batch_function=arc_length_parametrized_batch)
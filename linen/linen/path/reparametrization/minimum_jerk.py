@@ -1,10 +1,23 @@
-from linen.path.path import Path
+import numpy as np
+
+from linen.path.path import Path, named_builder
+from linen.path.polynomial.polynomial import polynomial_path
 
 
 def minimum_jerk_function(t: float):
-    """Minimum jerk function for t in [0, 1]"""
+    """Minimum jerk function for t in [0, 1]. Also works elementwise on arrays of t."""
     return 10 * (t**3) - 15 * (t**4) + 6 * (t**5)
 
 
+@named_builder
 def minimum_jerk_path() -> Path:
-    return Path(minimum_jerk_function, start_time=0.0, end_time=1.0)
+    coefficients = np.array([0.0, 0.0, 0.0, 10.0, -15.0, 6.0])
+    polynomial = polynomial_path(coefficients)
+    return Path(
+        minimum_jerk_function,
+        start_time=0.0,
+        end_time=1.0,
+        batch_function=minimum_jerk_function,
+        node=polynomial.node,
+        derivative=polynomial.derivative,
+    )
@@ -0,0 +1,331 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from linen.path.path import Path
+from linen.path.polynomial.polynomial import piecewise_polynomial_path
+
+# Closed-form time-optimal double-S (jerk limited) and trapezoidal (acceleration limited) motion profiles, from:
+#   Trajectory Planning for Automatic Machines and Robots, Section 3.4 Trajectory with Double S Velocity Profile.
+# A profile moves a displacement h from a start to an end velocity and consists of seven phases of constant jerk:
+#   jerk up, constant acceleration, jerk down, constant velocity, jerk down, constant deceleration, jerk up.
+# A trapezoidal profile is the limit of infinite jerk, where the jerk phases have zero duration. All functions work on
+# batches of B profiles at once, so thousands of profiles cost a few array operations instead of Python loops.
+
+NUM_PHASES = 7
+PHASE_JERK_SIGNS = np.array([1.0, 0.0, -1.0, 0.0, -1.0, 0.0, 1.0])
+
+
+@dataclass(frozen=True)
+class MotionProfiles:
+    """B one-dimensional motion profiles, each made of seven phases of constant jerk, some of which can be empty.
+
+    Attributes:
+        phase_start_times: The time at which each phase starts, the first is 0, shape (B, 7).
+        positions: The position at the start of each phase, shape (B, 7).
+        velocities: The velocity at the start of each phase, shape (B, 7).
+        accelerations: The acceleration at the start of each phase, shape (B, 7).
+        jerks: The constant jerk of each phase, shape (B, 7).
+        durations: The duration of each profile, shape (B,).
+    """
+
+    phase_start_times: np.ndarray
+    positions: np.ndarray
+    velocities: np.ndarray
+    accelerations: np.ndarray
+    jerks: np.ndarray
+    durations: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def sample(self, times: np.ndarray, order: int = 0) -> np.ndarray:
+        """Evaluate all profiles at many times at once. Times outside [0, duration] are clamped.
+
+        Args:
+            times: N times shared by all profiles, shape (N,), or different times per profile, shape (B, N).
+            order: 0 for the position, 1 for the velocity, 2 for the acceleration and 3 for the jerk.
+
+        Returns:
+            The values, shape (B, N).
+        """
+        times = np.broadcast_to(np.asarray(times, dtype=np.float64), (len(self), np.shape(times)[-1]))
+        times = np.clip(times, 0.0, self.durations[:, np.newaxis])
+        phases = np.sum(times[..., np.newaxis] >= self.phase_start_times[:, np.newaxis, 1:], axis=-1)
+        tau = times - np.take_along_axis(self.phase_start_times, phases, axis=1)
+
+        # Taylor coefficients of the position in tau, q + v tau + a tau^2 / 2 + j tau^3 / 6, and their derivatives.
+        coefficients = [self.positions, self.velocities, self.accelerations, self.jerks][order:]
+        factorials = [1.0, 1.0, 2.0, 6.0]
+        values = np.zeros_like(tau)
+        for k in range(len(coefficients) - 1, -1, -1):
+            values = values * tau + np.take_along_axis(coefficients[k], phases, axis=1) / factorials[k]
+        return values
+
+    def path(self, index: int = 0) -> Path:
+        """The position of one of the profiles as a piecewise polynomial path, with exact derivatives.
+
+        Args:
+            index: The index of the profile.
+
+        Returns:
+            The path, with domain [0, duration].
+        """
+        # The phases are polynomials in tau = t - start, the path needs them as polynomials in t.
+        s = self.phase_start_times[index]
+        c0, c1 = self.positions[index], self.velocities[index]
+        c2, c3 = self.accelerations[index] / 2.0, self.jerks[index] / 6.0
+        coefficients = np.stack(
+            [c0 - c1 * s + c2 * s**2 - c3 * s**3, c1 - 2.0 * c2 * s + 3.0 * c3 * s**2, c2 - 3.0 * c3 * s, c3], axis=-1
+        )
+        breakpoints = np.append(s, self.durations[index])
+        return piecewise_polynomial_path(breakpoints, coefficients)
+
+
+def acceleration_phase(
+    velocity_change: np.ndarray, max_acceleration: np.ndarray, max_jerk: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The fastest change of velocity by a nonnegative amount, starting and ending at zero acceleration.
+
+    Returns:
+        The duration of each jerk phase, the duration of the whole acceleration phase and the peak acceleration.
+    """
+    # Without a velocity change the phase takes no time. Excluding it first avoids 0 * inf when the jerk is unlimited.
+    changes = velocity_change > 0.0
+    change = np.where(changes, velocity_change, 1.0)
+    reached = change * max_jerk >= max_acceleration**2
+    with np.errstate(invalid="ignore"):
+        jerk_duration = np.where(reached, max_acceleration / max_jerk, np.sqrt(change / max_jerk))
+        duration = np.where(reached, jerk_duration + change / max_acceleration, 2.0 * jerk_duration)
+        peak = np.where(reached, max_acceleration, np.sqrt(change * max_jerk))
+    return np.where(changes, jerk_duration, 0.0), np.where(changes, duration, 0.0), np.where(changes, peak, 0.0)
+
+
+def without_cruise(
+    h: np.ndarray, v0: np.ndarray, v1: np.ndarray, acceleration: np.ndarray, max_jerk: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The acceleration and deceleration durations of a profile that never cruises, when it reaches the given peak
+    acceleration in both phases. The durations are negative when one of the phases can't exist.
+
+    Returns:
+        The duration of the jerk phases, the acceleration duration and the deceleration duration.
+    """
+    jerk_duration = acceleration / max_jerk
+    delta = (
+        acceleration**4 / max_jerk**2
+        + 2.0 * (v0**2 + v1**2)
+        + acceleration * (4.0 * h - 2.0 * jerk_duration * (v0 + v1))
+    )
+    root = np.sqrt(np.maximum(delta, 0.0))
+    acceleration_duration = (acceleration * jerk_duration - 2.0 * v0 + root) / (2.0 * acceleration)
+    deceleration_duration = (acceleration * jerk_duration - 2.0 * v1 + root) / (2.0 * acceleration)
+    return jerk_duration, acceleration_duration, deceleration_duration
+
+
+def jerk_phases_fit(
+    h: np.ndarray, v0: np.ndarray, v1: np.ndarray, acceleration: np.ndarray, max_jerk: np.ndarray
+) -> np.ndarray:
+    """Whether a profile without cruise that reaches the given peak acceleration has room for both of its jerk phases,
+    or only accelerates or only decelerates."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jerk_duration, acceleration_duration, deceleration_duration = without_cruise(h, v0, v1, acceleration, max_jerk)
+    one_sided = (acceleration_duration < 0.0) | (deceleration_duration < 0.0)
+    both_fit = (acceleration_duration >= 2.0 * jerk_duration) & (deceleration_duration >= 2.0 * jerk_duration)
+    return one_sided | both_fit
+
+
+def reduced_accelerations(
+    h: np.ndarray, v0: np.ndarray, v1: np.ndarray, max_acceleration: np.ndarray, max_jerk: np.ndarray
+) -> np.ndarray:
+    """The largest peak acceleration for which the jerk phases fit, found by bisection for all profiles at once. The
+    book lowers the acceleration in small steps instead."""
+    lowest, highest = np.zeros_like(max_acceleration), max_acceleration.copy()
+    for _ in range(32):  # The peak acceleration is found to a relative precision of 2^-32.
+        middle = (lowest + highest) / 2.0
+        middle_fits = jerk_phases_fit(h, v0, v1, middle, max_jerk)
+        lowest, highest = np.where(middle_fits, middle, lowest), np.where(middle_fits, highest, middle)
+    return lowest
+
+
+def one_sided_jerk_duration(h: np.ndarray, v0: np.ndarray, v1: np.ndarray, max_jerk: np.ndarray) -> np.ndarray:
+    # The jerk duration of a profile that only decelerates from v0 to v1 (or only accelerates, with v0 and v1 swapped).
+    velocity_sum = v0 + v1
+    root = np.sqrt(np.maximum(max_jerk * (max_jerk * h**2 + velocity_sum**2 * (v1 - v0)), 0.0))
+    return (max_jerk * h - root) / (max_jerk * velocity_sum)
+
+
+def double_s_phases(
+    h: np.ndarray,
+    v0: np.ndarray,
+    v1: np.ndarray,
+    max_velocity: np.ndarray,
+    max_acceleration: np.ndarray,
+    max_jerk: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The phase durations, peak acceleration and peak deceleration of profiles with a nonnegative displacement h.
+
+    Returns:
+        The durations of the seven phases, shape (B, 7), and the peak acceleration and deceleration, shape (B,).
+    """
+    # First assume the profile reaches the maximal velocity.
+    jerk_duration0, acceleration_duration, acceleration = acceleration_phase(
+        max_velocity - v0, max_acceleration, max_jerk
+    )
+    jerk_duration1, deceleration_duration, deceleration = acceleration_phase(
+        max_velocity - v1, max_acceleration, max_jerk
+    )
+    cruise_duration = (
+        h / max_velocity
+        - acceleration_duration / 2.0 * (1.0 + v0 / max_velocity)
+        - deceleration_duration / 2.0 * (1.0 + v1 / max_velocity)
+    )
+    cruises = cruise_duration > 0.0
+
+    # Otherwise there is no cruise phase, and the peak acceleration is lowered until both jerk phases fit.
+    peak = max_acceleration.copy()
+    reduce = ~cruises & ~jerk_phases_fit(h, v0, v1, max_acceleration, max_jerk)
+    peak[reduce] = reduced_accelerations(h[reduce], v0[reduce], v1[reduce], peak[reduce], max_jerk[reduce])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jerk_duration, no_cruise_acceleration, no_cruise_deceleration = without_cruise(h, v0, v1, peak, max_jerk)
+        jerk_duration = np.where(np.isfinite(max_jerk), jerk_duration, 0.0)
+        only_decelerates = ~cruises & (no_cruise_acceleration < 0.0)
+        only_accelerates = ~cruises & (no_cruise_deceleration < 0.0)
+        one_sided_duration = np.where(h > 0.0, 2.0 * h / (v0 + v1), 0.0)
+        decelerating_jerk = one_sided_jerk_duration(h, v0, v1, max_jerk)
+        accelerating_jerk = one_sided_jerk_duration(h, v1, v0, max_jerk)
+
+    no_cruise = ~cruises & ~only_decelerates & ~only_accelerates
+    jerk_duration0 = np.select(
+        [cruises, no_cruise, only_accelerates], [jerk_duration0, jerk_duration, accelerating_jerk]
+    )
+    jerk_duration1 = np.select(
+        [cruises, no_cruise, only_decelerates], [jerk_duration1, jerk_duration, decelerating_jerk]
+    )
+    acceleration_duration = np.select(
+        [cruises, no_cruise, only_accelerates], [acceleration_duration, no_cruise_acceleration, one_sided_duration]
+    )
+    deceleration_duration = np.select(
+        [cruises, no_cruise, only_decelerates], [deceleration_duration, no_cruise_deceleration, one_sided_duration]
+    )
+    with np.errstate(invalid="ignore"):
+        acceleration = np.select(
+            [cruises, no_cruise, only_accelerates], [acceleration, peak, max_jerk * jerk_duration0]
+        )
+        deceleration = np.select(
+            [cruises, no_cruise, only_decelerates], [deceleration, peak, max_jerk * jerk_duration1]
+        )
+    cruise_duration = np.where(cruises, cruise_duration, 0.0)
+
+    phase_durations = np.stack(
+        [
+            jerk_duration0,
+            acceleration_duration - 2.0 * jerk_duration0,
+            jerk_duration0,
+            cruise_duration,
+            jerk_duration1,
+            deceleration_duration - 2.0 * jerk_duration1,
+            jerk_duration1,
+        ],
+        axis=-1,
+    )
+    return np.maximum(phase_durations, 0.0), acceleration, deceleration
+
+
+def double_s_profiles(
+    displacements: np.ndarray,
+    max_velocity: np.ndarray,
+    max_acceleration: np.ndarray,
+    max_jerk: np.ndarray = np.inf,
+    start_velocity: np.ndarray = 0.0,
+    end_velocity: np.ndarray = 0.0,
+    start_position: np.ndarray = 0.0,
+) -> MotionProfiles:
+    """The time-optimal double-S profiles for a batch of displacements under velocity, acceleration and jerk limits.
+
+    All arguments broadcast against each other, e.g. B displacements with a single set of limits. Negative
+    displacements are handled by mirroring the profile. With an infinite jerk limit the profiles are trapezoidal.
+
+    Args:
+        displacements: The signed distances to travel, shape (B,).
+        max_velocity: The velocity limits.
+        max_acceleration: The acceleration limits.
+        max_jerk: The jerk limits.
+        start_velocity: The velocities at the start, at most max_velocity in magnitude.
+        end_velocity: The velocities at the end, at most max_velocity in magnitude.
+        start_position: The positions at the start.
+
+    Returns:
+        The profiles.
+    """
+    arrays = np.broadcast_arrays(
+        *[
+            np.atleast_1d(np.asarray(value, dtype=np.float64))
+            for value in (displacements, max_velocity, max_acceleration, max_jerk)
+            + (start_velocity, end_velocity, start_position)
+        ]
+    )
+    displacements, max_velocity, max_acceleration, max_jerk, v0, v1, q0 = arrays
+    if np.any(np.abs(v0) > max_velocity) or np.any(np.abs(v1) > max_velocity):
+        raise ValueError("The start and end velocities must not exceed the velocity limit.")
+
+    # Solve for positive displacements, the profile of a negative displacement is the mirrored profile.
+    signs = np.where(displacements < 0.0, -1.0, 1.0)
+    h, v0, v1 = signs * displacements, signs * v0, signs * v1
+
+    # The shortest jerk phase needed for the velocity change decides how much distance that change needs at least.
+    velocity_change = np.abs(v1 - v0)
+    with np.errstate(invalid="ignore"):
+        jerk_duration = np.minimum(np.sqrt(velocity_change / max_jerk), max_acceleration / max_jerk)
+        minimal_displacement = np.where(
+            jerk_duration < max_acceleration / max_jerk,
+            jerk_duration * (v0 + v1),
+            0.5 * (v0 + v1) * (jerk_duration + velocity_change / max_acceleration),
+        )
+    infeasible = h < minimal_displacement - 1e-12 * np.maximum(1.0, np.abs(minimal_displacement))
+    if np.any(infeasible):
+        raise ValueError(f"{np.count_nonzero(infeasible)} profiles can't reach their end velocity within the limits.")
+
+    phase_durations, acceleration, deceleration = double_s_phases(h, v0, v1, max_velocity, max_acceleration, max_jerk)
+    at_rest = (h == 0.0) & (v0 == 0.0) & (v1 == 0.0)
+    phase_durations[at_rest] = 0.0
+
+    zeros = np.zeros_like(h)
+    # Only the jerk phases have a jerk, and they are empty when the jerk is unlimited.
+    jerk_phases = (phase_durations > 0.0) & (PHASE_JERK_SIGNS != 0.0)
+    jerks = np.where(jerk_phases, PHASE_JERK_SIGNS * np.where(jerk_phases, max_jerk[:, np.newaxis], 0.0), 0.0)
+    accelerations = np.stack([zeros, acceleration, acceleration, zeros, zeros, -deceleration, -deceleration], axis=-1)
+    accelerations = np.where(at_rest[:, np.newaxis], 0.0, accelerations)
+
+    # Integrate the phases to get the position and velocity at the start of each phase.
+    positions, velocities = np.zeros_like(phase_durations), np.zeros_like(phase_durations)
+    velocities[:, 0] = v0
+    for k in range(NUM_PHASES - 1):
+        d, a, j = phase_durations[:, k], accelerations[:, k], jerks[:, k]
+        velocities[:, k + 1] = velocities[:, k] + a * d + j * d**2 / 2.0
+        positions[:, k + 1] = positions[:, k] + velocities[:, k] * d + a * d**2 / 2.0 + j * d**3 / 6.0
+
+    phase_start_times = np.concatenate([zeros[:, np.newaxis], np.cumsum(phase_durations[:, :-1], axis=-1)], axis=-1)
+    sign_factors = signs[:, np.newaxis]
+    return MotionProfiles(
+        phase_start_times,
+        q0[:, np.newaxis] + sign_factors * positions,
+        sign_factors * velocities,
+        sign_factors * accelerations,
+        sign_factors * jerks,
+        np.sum(phase_durations, axis=-1),
+    )
+
+
+def trapezoidal_profiles(
+    displacements: np.ndarray,
+    max_velocity: np.ndarray,
+    max_acceleration: np.ndarray,
+    start_velocity: np.ndarray = 0.0,
+    end_velocity: np.ndarray = 0.0,
+    start_position: np.ndarray = 0.0,
+) -> MotionProfiles:
+    """The time-optimal trapezoidal velocity profiles for a batch of displacements, see double_s_profiles."""
+    return double_s_profiles(
+        displacements, max_velocity, max_acceleration, np.inf, start_velocity, end_velocity, start_position
+    )
@@ -0,0 +1,87 @@
+from typing import Optional
+
+import numpy as np
+
+from linen.path.path import Path, PathNode, named_builder
+from linen.path.reparametrization.arc_length import ArcLengthTable, arc_length_table
+from linen.path.transformation.differentation import differentiated, finite_difference_derivative
+
+
+@named_builder
+def profiled_path(
+    path: Path,
+    profile: Path,
+    normalized: bool = True,
+    table: Optional[ArcLengthTable] = None,
+    tolerance: float = 1e-6,
+) -> Path:
+    """Traverse a geometric path, e.g. a circular fold arc, with a scalar motion profile along its arc length, e.g.
+    minimum_jerk_path, trapezoidal_position_path or s_position_path.
+
+    The arc length table is computed once, so each batch of samples costs one profile evaluation, one lookup in the
+    inverse map and one path evaluation. The first two derivatives follow from the chain rule with the exact
+    derivatives of the path and the profile, higher derivatives are approximated with finite differences.
+
+    Args:
+        path: The geometric path, its values are flattened to compute the arc length, see speed_function.
+        profile: The scalar profile, its domain becomes the domain of the profiled path.
+        normalized: Whether the profile values are fractions of the length of the path, like those of
+            minimum_jerk_path, instead of arc lengths, like those of s_position_path.
+        table: The arc length table of the path, pass it to share it between several profiles of the same path.
+        tolerance: The absolute arc length error to aim for when the table is computed here.
+
+    Returns:
+        The profiled path, with the domain of the profile.
+    """
+    if table is None:
+        table = arc_length_table(path, tolerance)
+    scale = table.length if normalized else 1.0
+
+    def parameters(times: np.ndarray) -> np.ndarray:
+        return table.parameters_at(scale * profile.sample(times))
+
+    def derivative(n: int) -> Path:
+        # Chain rule: with the unit tangent T = q' / |q'| and arc length s(t), the derivatives of t -> q(u(s(t))) are
+        # T s_dot and T s_ddot + dT/ds s_dot^2, where dT/ds = (q'' - (T . q'') T) / |q'|^2.
+        if n > 2:
+            return finite_difference_derivative(derivative(2), n - 2)
+        first, second = differentiated(path, 1), differentiated(path, 2)
+        profile_first = differentiated(profile, 1)
+        profile_second = differentiated(profile, 2)
+
+        def derivative_batch_function(times: np.ndarray) -> np.ndarray:
+            u = parameters(times)
+            first_values = first.sample(u)
+            flat_first = first_values.reshape(len(u), -1)
+            speeds = np.maximum(np.linalg.norm(flat_first, axis=1), np.finfo(np.float64).tiny)
+            tangents = flat_first / speeds[:, np.newaxis]
+            s_dot = scale * profile_first.sample(times)
+            if n == 1:
+                return (tangents * s_dot[:, np.newaxis]).reshape(first_values.shape)
+
+            flat_second = second.sample(u).reshape(len(u), -1)
+            normal = flat_second - np.sum(tangents * flat_second, axis=1, keepdims=True) * tangents
+            curvature = normal / speeds[:, np.newaxis] ** 2
+            s_ddot = scale * profile_second.sample(times)
+            values = tangents * s_ddot[:, np.newaxis] + curvature * (s_dot**2)[:, np.newaxis]
+            return values.reshape(first_values.shape)
+
+        return Path(
+            lambda t: derivative_batch_function(np.array([t]))[0],
+            start_time=profile.start_time,
+            end_time=profile.end_time,
+            batch_function=derivative_batch_function,
+        )
+
+    def profiled_batch(times: np.ndarray) -> np.ndarray:
+        return path.sample(parameters(times))
+
+    node = PathNode("profiled", children=(path, profile), parameters={"normalized": normalized})
+    return Path(
+        lambda t: path(float(parameters(np.array([t]))[0])),
+        start_time=profile.start_time,
+        end_time=profile.end_time,
+        batch_function=profiled_batch,
+        node=node,
+        derivative=derivative,
+    )
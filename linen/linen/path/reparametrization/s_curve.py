@@ -1,36 +1,33 @@
-import numpy as np
-
-from linen.path.path import Path
-
-
-def s_position_path(maximum_velocity_phase_duration=0.5) -> Path:
-    acceleration_phase_duration = (1.0 - maximum_velocity_phase_duration) / 2
-
-    acceleration_phase_end = acceleration_phase_duration
-    acceleration_phase_end + maximum_velocity_phase_duration
-
-    q0 = 0.0
-    alim = 1.0
-    vlim = vmax = 1.0
-    v0 = 0.0
-    Ta = acceleration_phase_duration
-    jmax = 6.0
-    jmin = -jmax
-
-    Tj1 = np.sqrt((vmax - v0) / jmax)
-
-    print("Tj1", Tj1)
-
-    def function(t):
-        if t < 0.0:
-            return q0
-        if t < Tj1:
-            return q0 + v0 * t + jmax * t**3 / 6.0
-        if t < Ta - Tj1:
-            return q0 + v0 * t + alim / 6.0 * (3 * t * t - 3 * Tj1 * t + Tj1 * Tj1)
-        if t < Ta:
-            return q0 + (vlim + v0) * Ta / 2.0 + vlim * (t - Ta) - jmin * (t - Ta) ** 3 / 6.0
-
-        return q0 + (vlim + v0) * Ta / 2.0 + vlim * (t - Ta)
-
-    return Path(function, 0.0, 1.0)
+from linen.path.path import Path, named_builder
+from linen.path.reparametrization.motion_profile import double_s_profiles
+
+
+@named_builder
+def s_position_path(
+    *,
+    displacement: float = 1.0,
+    max_velocity: float = 1.0,
+    max_acceleration: float = 1.0,
+    max_jerk: float = 6.0,
+    start_velocity: float = 0.0,
+    end_velocity: float = 0.0,
+) -> Path:
+    """The time-optimal double-S (jerk limited) position profile from 0 to the displacement.
+
+    See linen.path.reparametrization.motion_profile for batches of profiles. The arguments are keyword-only, because
+    the only positional argument used to be maximum_velocity_phase_duration, the duration of the cruise phase of a
+    profile with unit duration.
+
+    Args:
+        displacement: The signed distance to travel.
+        max_velocity: The velocity limit.
+        max_acceleration: The acceleration limit.
+        max_jerk: The jerk limit.
+        start_velocity: The velocity at the start.
+        end_velocity: The velocity at the end.
+
+    Returns:
+        The position path with domain [0, duration]. Its exact derivatives are the velocity, acceleration and jerk.
+    """
+    profiles = double_s_profiles(displacement, max_velocity, max_acceleration, max_jerk, start_velocity, end_velocity)
+    return profiles.path(0)
@@ -1,6 +1,7 @@
-from linen.path.path import Path
+from linen.path.path import Path, PathNode, named_builder
 
 
+@named_builder
 def scale_speed(trajectory: Path, factor: float) -> Path:
     """Scale the speed of a trajectory by a given factor. Factors > 1.0 speed up the trajectory, factors < 1.0 slow it down.
 
@@ -11,8 +12,22 @@ def scale_speed(trajectory: Path, factor: float) -> Path:
     Returns:
         The scaled trajectory.
     """
+
+    def derivative(n: int) -> Path:
+        # Chain rule: the n-th derivative of t -> f(factor * t) is t -> factor^n * f^(n)(factor * t).
+        trajectory_derivative = trajectory.derivative(n)
+        return Path(
+            lambda t: factor**n * trajectory_derivative(t * factor),
+            start_time=0.0,
+            end_time=trajectory.end_time / factor,
+            batch_function=lambda times: factor**n * trajectory_derivative.sample(times * factor),
+        )
+
     return Path(
         lambda t: trajectory(t * factor),
         start_time=0.0,
         end_time=trajectory.end_time / factor,
+        batch_function=lambda times: trajectory.sample(times * factor),
+        node=PathNode("time_scale", children=(trajectory,), parameters={"factor": factor}),
+        derivative=derivative if trajectory.derivative is not None else None,
     )
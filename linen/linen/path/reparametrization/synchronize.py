@@ -1,16 +1,124 @@
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from linen.path.concatenate import concatenate_trajectories
+from linen.path.constant import constant_trajectory
+from linen.path.fusion import fuse
+from linen.path.path import Path
 from linen.path.reparametrization.speed import scale_speed
+from linen.path.stream import stream_times
+
+
+def synchronized_phase(trajectories: Sequence[Path]) -> List[Path]:
+    """Slow down the trajectories of one phase to the duration of the slowest one. The slowest trajectory is not
+    scaled and the others are scaled as little as possible, each by its own factor.
+
+    Args:
+        trajectories: The trajectories of the arms in this phase, each with domain [0, duration].
+
+    Returns:
+        The trajectories, all with the same duration.
+    """
+    duration = max(trajectory.duration for trajectory in trajectories)
+    synchronized = []
+    for trajectory in trajectories:
+        if trajectory.duration == duration:
+            synchronized.append(trajectory)
+        elif trajectory.duration == 0.0:
+            # An instantaneous phase can't be slowed down, so the arm waits at its pose instead.
+            synchronized.append(constant_trajectory(trajectory.end, duration))
+        else:
+            synchronized.append(scale_speed(trajectory, trajectory.duration / duration))
+    return synchronized
 
 
 def synchronize(trajectory0, trajectory1):
     """Slow down one the trajectories to match the duration of the other."""
-    duration0 = trajectory0.duration
-    duration1 = trajectory1.duration
+    trajectory0, trajectory1 = synchronized_phase([trajectory0, trajectory1])
+    return trajectory0, trajectory1
 
-    if duration0 > duration1:
-        factor = duration1 / duration0
-        trajectory1 = scale_speed(trajectory1, factor)
-    elif duration1 > duration0:
-        factor = duration0 / duration1
-        trajectory0 = scale_speed(trajectory0, factor)
 
-    return trajectory0, trajectory1
+@dataclass(frozen=True)
+class SynchronizedTrajectories:
+    """The trajectories of several arms on a shared time axis, evaluated together.
+
+    Attributes:
+        trajectories: The fused trajectory of each arm, all with domain [0, duration].
+        phase_end_times: The times at which the phases end, the same for all arms, shape (P,).
+    """
+
+    trajectories: Tuple[Path, ...]
+    phase_end_times: np.ndarray
+
+    @property
+    def num_arms(self) -> int:
+        return len(self.trajectories)
+
+    @property
+    def duration(self) -> float:
+        return float(self.phase_end_times[-1])
+
+    def __call__(self, t: float) -> np.ndarray:
+        """The values of all arms at time t, shape (arms, ...)."""
+        return np.stack([trajectory(t) for trajectory in self.trajectories])
+
+    def sample(self, times: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Evaluate all arms at many times at once.
+
+        Args:
+            times: A 1D array of N times, which are clamped to [0, duration].
+            out: Optional buffer of shape (arms, N, ...), e.g. (arms, N, 4, 4) for poses, to write the values into.
+
+        Returns:
+            The values, shape (arms, N, ...), this is out when it was given.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        if out is None:
+            first = self.trajectories[0].sample(times)
+            out = np.empty((self.num_arms,) + first.shape, dtype=first.dtype)
+            out[0] = first
+            remaining = range(1, self.num_arms)
+        else:
+            remaining = range(self.num_arms)
+        for arm in remaining:
+            self.trajectories[arm].sample(times, out=out[arm])
+        return out
+
+    def stream(self, rate_hz: float, chunk_size: int) -> Iterator[np.ndarray]:
+        """Generate the setpoints of all arms at a fixed rate in chunks, see linen.path.stream.stream_setpoints.
+
+        Args:
+            rate_hz: The amount of setpoints per unit of time.
+            chunk_size: The amount of setpoints per chunk. The last chunk can be shorter.
+
+        Yields:
+            Arrays of shape (arms, chunk_size, ...) with consecutive setpoints.
+        """
+        for times in stream_times(self.trajectories[0], rate_hz, chunk_size):
+            yield self.sample(times)
+
+
+def synchronize_phases(phases: Sequence[Sequence[Path]]) -> SynchronizedTrajectories:
+    """Synchronize the trajectories of N arms that move through the same phases, e.g. grasp, lift, lay down and
+    retreat, so that every phase starts and ends at the same time for all arms.
+
+    Each phase is synchronized separately: it lasts as long as the slowest arm needs for it, and only the faster arms
+    are slowed down to match. This keeps the total duration minimal, unlike scaling whole concatenated trajectories.
+
+    Args:
+        phases: For each arm, the list of its phase trajectories, each with domain [0, duration]. All arms must have
+            the same amount of phases.
+
+    Returns:
+        The synchronized trajectories, which evaluate all arms in one call.
+    """
+    num_phases = {len(arm_phases) for arm_phases in phases}
+    if len(num_phases) != 1 or 0 in num_phases:
+        raise ValueError(f"All arms must have the same, nonzero amount of phases, got {sorted(num_phases)}.")
+
+    synchronized = [synchronized_phase(phase_trajectories) for phase_trajectories in zip(*phases)]
+    phase_end_times = np.cumsum([phase_trajectories[0].duration for phase_trajectories in synchronized])
+    trajectories = tuple(fuse(concatenate_trajectories(list(arm_phases))) for arm_phases in zip(*synchronized))
+    return SynchronizedTrajectories(trajectories, phase_end_times)
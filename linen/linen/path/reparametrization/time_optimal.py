@@ -0,0 +1,491 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+import numpy as np
+from scipy.interpolate import CubicHermiteSpline
+
+from linen.path.path import Path, expand_times, named_builder
+from linen.path.reparametrization.arc_length import concatenation_joints, initial_breakpoints
+from linen.path.transformation.differentation import differentiated, finite_difference_derivative
+
+# Time-optimal time parametrization with the phase-plane method. A geometric path q(s) is traversed with a parameter
+# s(t), and the state of the motion is described by x = ds/dt^2 and u = d^2s/dt^2 at each point of a grid in s. The
+# Cartesian velocity and acceleration of the tool are then
+#   v = q'(s) sqrt(x)  and  a = q'(s) u + q''(s) x,
+# so a norm limit on the acceleration bounds u at each s to an interval that depends on x. The fastest motion follows
+# the largest x that can still be braked to a stop at the end (backward pass) and that can be reached from the start
+# (forward pass), both passes integrate with the extreme u of those intervals.
+
+# The acceleration along the path ramps at this fraction of the jerk limit, which leaves the rest for the jerk that
+# comes from the changing speed on a curved path.
+RAMP_FRACTION = 0.9
+
+# The least amount of grid points inside each segment of a concatenated path, so that the motion can speed up between
+# two corners no matter how short the segment between them is.
+MIN_SEGMENT_POINTS = 4
+
+# The amount of bisection steps to find the fastest speed from which a segment can still be braked in the backward pass.
+BISECTION_STEPS = 40
+
+
+@dataclass(frozen=True)
+class CartesianLimits:
+    """Limits on the norms of the linear (m/s) and angular (rad/s) velocity, acceleration and jerk of the tool.
+
+    Infinite limits are not enforced. The linear limits apply to the position of pose paths and to the value of other
+    vector valued paths, the angular limits to the orientation of pose and orientation paths.
+    """
+
+    linear_velocity: float = np.inf
+    linear_acceleration: float = np.inf
+    linear_jerk: float = np.inf
+    angular_velocity: float = np.inf
+    angular_acceleration: float = np.inf
+    angular_jerk: float = np.inf
+
+
+@dataclass(frozen=True)
+class TimeParametrization:
+    """The timing of a path on a grid of its parameter.
+
+    Attributes:
+        parameters: The grid in the domain of the path, shape (K,).
+        times: The time at which each parameter is reached, shape (K,).
+        parameter_speeds: The derivative ds/dt at each parameter, shape (K,).
+        parameter_accelerations: The constant d^2s/dt^2 between consecutive parameters, shape (K - 1,).
+    """
+
+    parameters: np.ndarray
+    times: np.ndarray
+    parameter_speeds: np.ndarray
+    parameter_accelerations: np.ndarray
+
+    @property
+    def duration(self) -> float:
+        return float(self.times[-1])
+
+    def parameters_at(self, times: np.ndarray) -> np.ndarray:
+        """The path parameters reached at the given times, vectorized. Between grid points the parameter is the exact
+        constant acceleration motion, a quadratic in t, which a cubic Hermite interpolant reproduces."""
+        s = CubicHermiteSpline(self.times, self.parameters, self.parameter_speeds)
+        return s(np.clip(times, 0.0, self.duration))
+
+
+@dataclass
+class LimitGroup:
+    # The first and second derivative of the linear or angular part of the path on the grid, with their limits.
+    first: np.ndarray
+    second: np.ndarray
+    velocity: float
+    acceleration: np.ndarray
+    jerk: float
+    tangential: np.ndarray  # The limit on the part of the acceleration along the path, lowered to meet the jerk limit.
+
+
+def vee(matrices: np.ndarray) -> np.ndarray:
+    # The vector of the skew-symmetric part of 3x3 matrices.
+    return 0.5 * np.stack(
+        [
+            matrices[:, 2, 1] - matrices[:, 1, 2],
+            matrices[:, 0, 2] - matrices[:, 2, 0],
+            matrices[:, 1, 0] - matrices[:, 0, 1],
+        ],
+        axis=-1,
+    )
+
+
+def limit_groups(path: Path, parameters: np.ndarray, limits: CartesianLimits) -> List[LimitGroup]:
+    """The derivatives of the linear and angular motion of a path with respect to its parameter."""
+    values = path.sample(parameters)
+    first = differentiated(path, 1).sample(parameters)
+    second = differentiated(path, 2).sample(parameters)
+    value_shape = values.shape[1:]
+    num_points = len(parameters)
+
+    def group(first: np.ndarray, second: np.ndarray, velocity: float, acceleration: float, jerk: float) -> LimitGroup:
+        accelerations = np.full(num_points, acceleration, dtype=np.float64)
+        return LimitGroup(first, second, velocity, accelerations, jerk, accelerations.copy())
+
+    groups = []
+    if value_shape in [(3, 3), (4, 4)]:
+        # The angular velocity per unit of s is the vector of R' R^T. Its derivative is the vector of R'' R^T, because
+        # the other term of the product rule, R' R'^T, is symmetric.
+        orientations = values[:, :3, :3]
+        transposed = np.transpose(orientations, (0, 2, 1))
+        angular_first = vee(first[:, :3, :3] @ transposed)
+        angular_second = vee(second[:, :3, :3] @ transposed)
+        groups.append(
+            group(
+                angular_first,
+                angular_second,
+                limits.angular_velocity,
+                limits.angular_acceleration,
+                limits.angular_jerk,
+            )
+        )
+    if value_shape == (4, 4):
+        first, second = first[:, :3, 3], second[:, :3, 3]
+    if value_shape != (3, 3):
+        first, second = first.reshape(num_points, -1), second.reshape(num_points, -1)
+        groups.append(group(first, second, limits.linear_velocity, limits.linear_acceleration, limits.linear_jerk))
+    return groups
+
+
+def grid_parameters(path: Path, num_points: int, joints: np.ndarray) -> np.ndarray:
+    """The grid of about num_points parameters, which includes the joints of a concatenation and has at least
+    MIN_SEGMENT_POINTS points strictly inside each segment between them."""
+    parameters = initial_breakpoints(path, num_points - 1)
+    boundaries = np.concatenate([[path.start_time], joints, [path.end_time]])
+    extra = []
+    for a, b in zip(boundaries[:-1], boundaries[1:]):
+        inside = np.searchsorted(parameters, b, side="left") - np.searchsorted(parameters, a, side="right")
+        if b > a and inside < MIN_SEGMENT_POINTS:
+            extra.append(np.linspace(a, b, MIN_SEGMENT_POINTS + 2)[1:-1])
+    return np.union1d(parameters, np.concatenate(extra)) if extra else parameters
+
+
+def one_sided_parameters(parameters: np.ndarray, joints: np.ndarray, side: float) -> np.ndarray:
+    """The grid with the joints of a concatenation replaced by the parameters at which the segment that ends (side -1)
+    or starts (side 1) there is evaluated, so that the derivatives sampled there are exactly those of that segment.
+
+    A concatenation evaluates the segment that ends at a joint, so for side -1 the joints stay where they are. For
+    side 1 they move to the next floating point number, which is already in the next segment. Sampling both sides at
+    a finite distance from the joint would make smooth joints, e.g. the knots of a spline, look like small corners.
+    """
+    if side < 0.0:
+        return parameters
+    moved = parameters.copy()
+    indices = np.searchsorted(parameters, joints)
+    moved[indices] = np.nextafter(parameters[indices], np.inf)
+    return moved
+
+
+def maximum_velocity_curve(groups: List[LimitGroup]) -> np.ndarray:
+    """The largest x = ds/dt^2 at each grid point for which the velocity and acceleration limits can be met."""
+    bound = np.full(len(groups[0].first), np.inf)
+    for group in groups:
+        first_squared = np.sum(group.first**2, axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bound = np.minimum(bound, np.where(first_squared > 0.0, group.velocity**2 / first_squared, np.inf))
+            # Only the component of q'' x perpendicular to q' can't be compensated by u, which bounds x.
+            projection = np.sum(group.first * group.second, axis=-1) / np.where(
+                first_squared > 0.0, first_squared, 1.0
+            )
+            perpendicular = np.linalg.norm(group.second - projection[:, np.newaxis] * group.first, axis=-1)
+            bound = np.minimum(bound, np.where(perpendicular > 0.0, group.acceleration / perpendicular, np.inf))
+    return bound
+
+
+def acceleration_bounds_function(groups: List[LimitGroup]) -> Callable[[int, float, float], Tuple[float, float]]:
+    """A function that maps a grid index i, the x at the other end of a segment and a coupling k to the interval of u
+    for which the acceleration limits are met at i, where x at i itself is x + k u. The coupling is 0 when x is the x
+    at i, 2 ds when i is the end of a segment that starts at x and -2 ds when i is the start of a segment that ends at
+    x. The interval is empty when no u is feasible.
+
+    This works on Python floats because it is called for every segment in the sequential passes.
+    """
+    coefficients = []
+    for group in groups:
+        coefficients.append(
+            (
+                np.sum(group.first**2, axis=-1).tolist(),
+                np.sum(group.first * group.second, axis=-1).tolist(),
+                np.sum(group.second**2, axis=-1).tolist(),
+                group.acceleration.tolist(),
+            )
+        )
+
+    def bounds(i: int, x: float, k: float) -> Tuple[float, float]:
+        lowest, highest = -math.inf, math.inf
+        for first_squared, first_second, second_squared, acceleration in coefficients:
+            if first_squared[i] == 0.0 or math.isinf(acceleration[i]):
+                continue
+            # |(q' + k q'') u + q'' x|^2 <= a^2 is a quadratic inequality a u^2 + 2 b u + c <= 0 in u.
+            a = first_squared[i] + k * (2.0 * first_second[i] + k * second_squared[i])
+            b = x * (first_second[i] + k * second_squared[i])
+            c = x * x * second_squared[i] - acceleration[i] ** 2
+            discriminant = b * b - a * c
+            if a <= 0.0 or discriminant < -1e-9 * (b * b + a * acceleration[i] ** 2):
+                return math.inf, -math.inf
+            root = math.sqrt(max(discriminant, 0.0))
+            lowest, highest = max(lowest, (-b - root) / a), min(highest, (-b + root) / a)
+        return lowest, highest
+
+    return bounds
+
+
+def tangential_bounds(arriving: List[LimitGroup], leaving: List[LimitGroup]) -> List[float]:
+    """The largest |u| of each segment for which the tangential limits are met at both of its ends."""
+    bound = np.full(len(arriving[0].first) - 1, np.inf)
+    for group, ends in [(group, slice(1, None)) for group in arriving] + [(group, slice(-1)) for group in leaving]:
+        speeds = np.linalg.norm(group.first[ends], axis=-1)
+        with np.errstate(divide="ignore"):
+            bound = np.minimum(bound, np.where(speeds > 0.0, group.tangential[ends] / speeds, np.inf))
+    return bound.tolist()
+
+
+def capped(lowest: float, highest: float, tangential: float) -> Tuple[float, float]:
+    # The tangential limits only ramp the acceleration for the jerk limit, so they are only applied where they leave a
+    # feasible u, i.e. away from the velocity curve.
+    if max(lowest, -tangential) <= min(highest, tangential):
+        return max(lowest, -tangential), min(highest, tangential)
+    return lowest, highest
+
+
+def backward_pass(
+    steps: List[float], arriving_bounds: Callable, leaving_bounds: Callable, limit: List[float], caps: List[float]
+) -> List[float]:
+    """The largest x at each grid point from which the motion can still brake to every later stop."""
+
+    def braking_interval(i: int, y: float) -> Tuple[float, float]:
+        # The u of segment i that ends at y, that is feasible at both ends and starts at an x in [0, limit].
+        step = 2.0 * steps[i]
+        end_lowest, end_highest = arriving_bounds(i + 1, y, 0.0)
+        start_lowest, start_highest = leaving_bounds(i, y, -step)
+        lowest = max(end_lowest, start_lowest, (y - limit[i]) / step)
+        return lowest, min(end_highest, start_highest, y / step)
+
+    def feasible(i: int, y: float) -> bool:
+        lowest, highest = braking_interval(i, y)
+        return lowest <= highest
+
+    backward = [0.0] * len(limit)
+    for i in range(len(limit) - 2, -1, -1):
+        y = backward[i + 1]
+        if not feasible(i, y):
+            # The segment is too short to brake from y, e.g. where the acceleration of the path jumps. The feasible
+            # pairs of x at both ends form a convex set that contains rest, so bisect for the largest feasible y.
+            lower, upper = 0.0, y
+            for _ in range(BISECTION_STEPS):
+                middle = (lower + upper) / 2
+                lower, upper = (middle, upper) if feasible(i, middle) else (lower, middle)
+            y = lower
+        lowest, highest = capped(*braking_interval(i, y), caps[i])
+        backward[i] = min(limit[i], max(y - 2.0 * steps[i] * lowest, 0.0)) if lowest <= highest else 0.0
+    return backward
+
+
+def forward_pass(
+    steps: List[float], arriving_bounds: Callable, leaving_bounds: Callable, backward: List[float], caps: List[float]
+) -> List[float]:
+    """Accelerate as hard as possible from rest until the backward curve is reached."""
+    forward = [0.0] * len(backward)
+    for i in range(len(backward) - 1):
+        x, step = forward[i], 2.0 * steps[i]
+        start_lowest, start_highest = leaving_bounds(i, x, 0.0)
+        end_lowest, end_highest = arriving_bounds(i + 1, x, step)
+        lowest, highest = capped(
+            max(start_lowest, end_lowest, -x / step),
+            min(start_highest, end_highest, (backward[i + 1] - x) / step),
+            caps[i],
+        )
+        # Every x below the backward curve has a feasible u, so an interval that is empty by rounding still ends at it.
+        forward[i + 1] = min(backward[i + 1], max(x + step * highest, 0.0)) if math.isfinite(highest) else x
+    return forward
+
+
+def phase_plane_profile(
+    parameters: np.ndarray, arriving: List[LimitGroup], leaving: List[LimitGroup], limit: np.ndarray
+) -> np.ndarray:
+    """The time-optimal x = ds/dt^2 on the grid below the limit, starting and ending at rest.
+
+    Every segment has a constant u, which must be feasible at both of its ends: with the derivatives of the segment
+    leaving its start and with those of the segment arriving at its end. Each step of the passes solves for that u
+    exactly, which depends on the previous step, so both passes are sequential loops over the grid.
+    """
+    steps = np.diff(parameters).tolist()
+    arriving_bounds, leaving_bounds = acceleration_bounds_function(arriving), acceleration_bounds_function(leaving)
+    caps = tangential_bounds(arriving, leaving)
+    backward = backward_pass(steps, arriving_bounds, leaving_bounds, limit.tolist(), caps)
+    return np.array(forward_pass(steps, arriving_bounds, leaving_bounds, backward, caps))
+
+
+def segment_durations(parameters: np.ndarray, x: np.ndarray) -> np.ndarray:
+    # With constant u on a segment, ds/dt is linear in t, so the duration is the step over the mean of ds/dt.
+    speeds = np.sqrt(x)
+    mean_speeds = (speeds[:-1] + speeds[1:]) / 2
+    return np.diff(parameters) / np.maximum(mean_speeds, np.finfo(np.float64).tiny)
+
+
+def segment_jerks(group: LimitGroup, x: np.ndarray, u: np.ndarray, durations: np.ndarray) -> np.ndarray:
+    """The change of the Cartesian acceleration between consecutive segments, per unit of time, shape (K,). The
+    motion is at rest before the first and after the last segment."""
+    middles_first = (group.first[:-1] + group.first[1:]) / 2
+    middles_second = (group.second[:-1] + group.second[1:]) / 2
+    middles_x = (x[:-1] + x[1:]) / 2
+    accelerations = middles_first * u[:, np.newaxis] + middles_second * middles_x[:, np.newaxis]
+    zeros = np.zeros((1, accelerations.shape[1]))
+    changes = np.linalg.norm(np.diff(np.concatenate([zeros, accelerations, zeros]), axis=0), axis=-1)
+    padded_durations = np.concatenate([[durations[0]], durations, [durations[-1]]])
+    return changes / ((padded_durations[:-1] + padded_durations[1:]) / 2)
+
+
+def ramped_tangential_limits(
+    group: LimitGroup, u: np.ndarray, durations: np.ndarray, on_limit: np.ndarray
+) -> np.ndarray:
+    """Limits on the acceleration along the path at each grid point that ramp up and down at the jerk limit.
+
+    Some segments fix the acceleration along the path: it is zero at the start and end at rest and at the segment
+    boundaries where it changes sign, and it can't change on segments that follow the velocity limit. Elsewhere the
+    limit is the fixed acceleration plus the jerk limit times the time to that segment, the smallest of
+    |T_j| + jerk * |t_k - t_j| over the fixed segments j, computed with a forward and a backward sweep.
+    """
+    middles_first = (group.first[:-1] + group.first[1:]) / 2
+    tangential = (u * np.linalg.norm(middles_first, axis=-1)).tolist()
+    durations, jerk = durations.tolist(), RAMP_FRACTION * group.jerk
+
+    limits = [abs(value) if fixed else math.inf for value, fixed in zip(tangential, on_limit.tolist())]
+    limits[0] = min(limits[0], jerk * durations[0] / 2)
+    limits[-1] = min(limits[-1], jerk * durations[-1] / 2)
+    for k in range(1, len(limits)):
+        if tangential[k] * tangential[k - 1] < 0.0:
+            limits[k] = min(limits[k], jerk * durations[k] / 2)
+            limits[k - 1] = min(limits[k - 1], jerk * durations[k - 1] / 2)
+    for k in range(1, len(limits)):
+        limits[k] = min(limits[k], limits[k - 1] + jerk * (durations[k - 1] + durations[k]) / 2)
+    for k in range(len(limits) - 2, -1, -1):
+        limits[k] = min(limits[k], limits[k + 1] + jerk * (durations[k] + durations[k + 1]) / 2)
+
+    # Grid point i is the start of segment i and the end of segment i - 1.
+    segment_limits = np.array(limits)
+    return np.minimum(np.append(segment_limits, np.inf), np.insert(segment_limits, 0, np.inf))
+
+
+def lower_tangential_limits(
+    group: LimitGroup, x: np.ndarray, u: np.ndarray, durations: np.ndarray, on_limit: np.ndarray
+) -> bool:
+    """Lower the tangential limits of the group where the jerk of a profile is too high.
+
+    Returns:
+        Whether the limits were lowered, False when the profile meets the jerk limit or when the ramps are already in
+        place and the rest of the jerk comes from the curvature of the path.
+    """
+    if np.isinf(group.jerk) or np.all(segment_jerks(group, x, u, durations) <= group.jerk * (1.0 + 1e-3)):
+        return False
+    tangential = np.minimum(group.tangential, ramped_tangential_limits(group, u, durations, on_limit))
+    if np.allclose(tangential, group.tangential):
+        return False
+    group.tangential = tangential
+    return True
+
+
+def velocity_limits(arriving: List[LimitGroup], leaving: List[LimitGroup]) -> np.ndarray:
+    """The maximum velocity curve on the grid, which is zero at the corners of the path, where the derivative jumps."""
+    limit = np.minimum(maximum_velocity_curve(arriving), maximum_velocity_curve(leaving))
+    first_arriving = np.concatenate([group.first for group in arriving], axis=-1)
+    first_leaving = np.concatenate([group.first for group in leaving], axis=-1)
+    jumps = np.linalg.norm(first_leaving - first_arriving, axis=-1)
+    scales = np.linalg.norm(first_arriving, axis=-1) + np.linalg.norm(first_leaving, axis=-1)
+    limit[jumps > 1e-6 * scales] = 0.0
+    if np.any(np.isinf(limit)):
+        raise ValueError("The limits don't bound the speed along the whole path, add a velocity limit.")
+    return limit
+
+
+def time_optimal_parametrization(
+    path: Path, limits: CartesianLimits, num_points: int = 1000, max_jerk_iterations: int = 100
+) -> TimeParametrization:
+    """The fastest timing of a geometric path that starts and ends at rest and respects the Cartesian limits.
+
+    Velocity and acceleration limits are handled exactly by the phase-plane method, up to the resolution of the grid.
+    Jerk limits are not convex in the phase plane. They are met approximately by lowering the limit on the
+    acceleration along the path at the grid points where the jerk is too high and recomputing the profile, until the
+    limits are met or max_jerk_iterations profiles have been computed. The jerk is that of the motion on the grid, which
+    has a constant acceleration between grid points. Jerk that comes from jumps in the curvature of the path, e.g. at
+    the knots of a Catmull-Rom spline, can't be lowered this way.
+
+    The joints of concatenated paths are always grid points, and the motion stops at joints where the path has a
+    corner. Short segments between joints get extra grid points, so that the motion also moves between two corners.
+
+    Each step of the phase-plane passes depends on the previous one, so they are sequential loops over the grid and
+    not vectorized. Their cost is linear in num_points, some tens of milliseconds for 1000 points, see the TimeOptimal
+    benchmark in benchmarks/bench_planners.py.
+
+    Args:
+        path: The geometric path, which returns positions, orientations, poses or other vectors.
+        limits: The limits, at least one velocity limit must be finite. Finite jerk limits require a finite
+            acceleration limit.
+        num_points: The amount of grid points, more points are slower but closer to the time-optimal motion.
+        max_jerk_iterations: The maximal amount of profiles computed to meet the jerk limits.
+
+    Returns:
+        The time parametrization.
+    """
+    joints = concatenation_joints(path)
+    parameters = grid_parameters(path, num_points, joints)
+    arriving = limit_groups(path, one_sided_parameters(parameters, joints, -1.0), limits)
+    leaving = limit_groups(path, one_sided_parameters(parameters, joints, 1.0), limits)
+    for group in leaving:
+        if np.isfinite(group.jerk) and np.any(np.isinf(group.acceleration)):
+            raise ValueError("A jerk limit requires the acceleration limit of the same motion to be finite.")
+    limit = velocity_limits(arriving, leaving)
+
+    for _ in range(max_jerk_iterations):
+        x = phase_plane_profile(parameters, arriving, leaving, limit)
+        u = np.diff(x) / (2.0 * np.diff(parameters))
+        durations = segment_durations(parameters, x)
+        on_limit = (x[:-1] >= limit[:-1] * (1.0 - 1e-9)) & (x[1:] >= limit[1:] * (1.0 - 1e-9))
+        lowered = False
+        for arriving_group, group in zip(arriving, leaving):
+            if lower_tangential_limits(group, x, u, durations, on_limit):
+                arriving_group.tangential = group.tangential
+                lowered = True
+        if not lowered:
+            break
+
+    times = np.concatenate([[0.0], np.cumsum(durations)])
+    return TimeParametrization(parameters, times, np.sqrt(x), u)
+
+
+@named_builder
+def time_optimal_trajectory(path: Path, limits: CartesianLimits, num_points: int = 1000) -> Path:
+    """Traverse a geometric path, e.g. a circular arc or Catmull-Rom spline, as fast as the Cartesian limits allow.
+    See time_optimal_parametrization.
+
+    Args:
+        path: The geometric path.
+        limits: The velocity, acceleration and jerk limits.
+        num_points: The amount of grid points of the parametrization.
+
+    Returns:
+        The trajectory, with domain [0, duration].
+    """
+    parametrization = time_optimal_parametrization(path, limits, num_points)
+    s = CubicHermiteSpline(parametrization.times, parametrization.parameters, parametrization.parameter_speeds)
+    s_dot, s_ddot = s.derivative(1), s.derivative(2)
+    duration = parametrization.duration
+
+    def parameters(times: np.ndarray) -> np.ndarray:
+        return np.clip(s(np.clip(times, 0.0, duration)), path.start_time, path.end_time)
+
+    def derivative(n: int) -> Path:
+        # Chain rule: the derivatives of t -> q(s(t)) are q' s_dot and q'' s_dot^2 + q' s_ddot.
+        if n > 2:
+            return finite_difference_derivative(derivative(2), n - 2)
+        first, second = differentiated(path, 1), differentiated(path, 2)
+
+        def derivative_batch_function(times: np.ndarray) -> np.ndarray:
+            s_values, speeds = parameters(times), s_dot(times)
+            first_values = first.sample(s_values)
+            if n == 1:
+                return expand_times(speeds, first_values[0]) * first_values
+            return (
+                expand_times(speeds**2, first_values[0]) * second.sample(s_values)
+                + expand_times(s_ddot(times), first_values[0]) * first_values
+            )
+
+        return Path(
+            lambda t: derivative_batch_function(np.array([t]))[0],
+            start_time=0.0,
+            end_time=duration,
+            batch_function=derivative_batch_function,
+        )
+
+    return Path(
+        lambda t: path(float(parameters(np.array([t]))[0])),
+        start_time=0.0,
+        end_time=duration,
+        batch_function=lambda times: path.sample(parameters(times)),
+        derivative=derivative,
+    )
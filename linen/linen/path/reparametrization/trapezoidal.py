@@ -1,4 +1,8 @@
-from linen.path.path import Path
+import numpy as np
+
+from linen.path.path import Path, named_builder
+from linen.path.polynomial.polynomial import piecewise_polynomial_path
+from linen.path.reparametrization.motion_profile import trapezoidal_profiles
 
 
 def trapezoidal_coefficients(acceleration_phase_duration: float = 0.25):
@@ -23,6 +27,7 @@ def trapezoidal_coefficients(acceleration_phase_duration: float = 0.25):
     return a0, a1, a2, b0, b1, c0, c1, c2
 
 
+@named_builder
 def trapezoidal_acceleration_path(constant_velocity_phase_duration=0.5):
     acceleration_phase_duration = (1.0 - constant_velocity_phase_duration) / 2
 
@@ -43,6 +48,7 @@ def trapezoidal_acceleration_path(constant_velocity_phase_duration=0.5):
     return Path(function, 0.0, 1.0)
 
 
+@named_builder
 def trapezoidal_velocity_path(constant_velocity_phase_duration=0.5):
     acceleration_phase_duration = (1.0 - constant_velocity_phase_duration) / 2
 
@@ -65,6 +71,7 @@ def trapezoidal_velocity_path(constant_velocity_phase_duration=0.5):
     return Path(function, 0.0, 1.0)
 
 
+@named_builder
 def trapezoidal_position_path(maximum_velocity_phase_duration=0.5):
     acceleration_phase_duration = (1.0 - maximum_velocity_phase_duration) / 2
 
@@ -75,15 +82,33 @@ def trapezoidal_position_path(maximum_velocity_phase_duration=0.5):
     # Section 3.2 Linear Trajectory with Parabolic Blends (Trapezoidal)
     a0, a1, a2, b0, b1, c0, c1, c2 = trapezoidal_coefficients(acceleration_phase_duration)
 
-    def function(t):
-        if t < 0.0:
-            return 0.0
-        if t < acceleration_phase_duration:
-            return a0 + a1 * t + a2 * t * t
-        if t < maximum_velocity_phase_end:
-            return b0 + b1 * t
-        if t <= 1.0:
-            return c0 + c1 * t + c2 * t * t
-        return 0.0
-
-    return Path(function, 0.0, 1.0)
+    # The three phases are polynomials in t, so the exact velocity and acceleration follow from the derivative.
+    breakpoints = [0.0, acceleration_phase_end, maximum_velocity_phase_end, 1.0]
+    coefficients = [np.array([a0, a1, a2]), np.array([b0, b1]), np.array([c0, c1, c2])]
+    return piecewise_polynomial_path(breakpoints, coefficients)
+
+
+@named_builder
+def trapezoidal_profile_path(
+    displacement: float,
+    max_velocity: float,
+    max_acceleration: float,
+    start_velocity: float = 0.0,
+    end_velocity: float = 0.0,
+) -> Path:
+    """The time-optimal trapezoidal velocity profile from 0 to the displacement. Unlike trapezoidal_position_path, the
+    duration follows from the limits instead of being 1.
+
+    See linen.path.reparametrization.motion_profile for batches of profiles.
+
+    Args:
+        displacement: The signed distance to travel.
+        max_velocity: The velocity limit.
+        max_acceleration: The acceleration limit.
+        start_velocity: The velocity at the start.
+        end_velocity: The velocity at the end.
+
+    Returns:
+        The position path with domain [0, duration]. Its exact derivatives are the velocity and acceleration.
+    """
+    return trapezoidal_profiles(displacement, max_velocity, max_acceleration, start_velocity, end_velocity).path(0)
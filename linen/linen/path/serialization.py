@@ -0,0 +1,77 @@
+from typing import BinaryIO, Tuple, Union
+
+import numpy as np
+
+from linen.geometry.quaternion import poses_to_position_quaternions
+from linen.path.bake import bake_times
+from linen.path.compact import position_quaternion_path
+from linen.path.fusion import fuse
+from linen.path.path import Path, named_builder
+from linen.path.pose_interpolation import quaternion_pose_trajectory
+
+# Pose trajectories are stored as .npz files with two arrays: the sample "times" (N,) and the compact
+# "position_quaternions" (N, 7), see linen.geometry.quaternion. This works for both planned trajectories, which are
+# sampled at a fixed rate, and recorded trajectories, whose timestamps are usually not evenly spaced.
+
+File = Union[str, BinaryIO]
+
+
+def save_pose_samples(file: File, times: np.ndarray, poses: np.ndarray, dtype: np.dtype = np.float32) -> None:
+    """Save timestamped poses, e.g. the measured TCP poses of a robot arm, in the compact format.
+
+    Args:
+        file: The file name or open binary file to write to.
+        times: The timestamps, shape (N,).
+        poses: The poses as 4x4 matrices with shape (N, 4, 4), or already in the compact format with shape (N, 7).
+        dtype: The floating point type of the stored poses, the times are always stored as float64.
+    """
+    poses = np.asarray(poses)
+    if poses.shape[1:] == (4, 4):
+        position_quaternions = poses_to_position_quaternions(poses, dtype)
+    else:
+        position_quaternions = poses.astype(dtype, copy=False)
+    np.savez(file, times=np.asarray(times, dtype=np.float64), position_quaternions=position_quaternions)
+
+
+def load_pose_samples(file: File) -> Tuple[np.ndarray, np.ndarray]:
+    """Load timestamped poses saved with save_pose_samples or save_pose_path.
+
+    Args:
+        file: The file name or open binary file to read from.
+
+    Returns:
+        The timestamps with shape (N,) and the compact poses with shape (N, 7), in the dtype they were stored in.
+    """
+    with np.load(file) as data:
+        return data["times"], data["position_quaternions"]
+
+
+def save_pose_path(file: File, pose_path: Path, rate_hz: float, dtype: np.dtype = np.float32) -> None:
+    """Sample a pose path at a fixed rate, see linen.path.bake.bake_times, and save the samples in the compact format.
+
+    Args:
+        file: The file name or open binary file to write to.
+        pose_path: The pose path to save.
+        rate_hz: The minimum amount of samples per unit of time.
+        dtype: The floating point type of the stored poses.
+    """
+    times = bake_times(pose_path, rate_hz)
+    out = np.empty((len(times), 7), dtype=dtype)
+    position_quaternions = position_quaternion_path(fuse(pose_path)).sample(times, out=out)
+    save_pose_samples(file, times, position_quaternions, dtype)
+
+
+@named_builder
+def load_pose_path(file: File, representation: str = "matrix") -> Path:
+    """Load saved pose samples as a path that interpolates between them, see quaternion_pose_trajectory.
+
+    Args:
+        file: The file name or open binary file to read from.
+        representation: "matrix" for a path of 4x4 poses or "position_quaternion" for (x, y, z, qx, qy, qz, qw).
+
+    Returns:
+        The pose path over the stored timestamps.
+    """
+    times, position_quaternions = load_pose_samples(file)
+    positions, quaternions = position_quaternions[:, :3], position_quaternions[:, 3:]
+    return quaternion_pose_trajectory(times, positions, quaternions, representation=representation)
@@ -1,12 +1,164 @@
-from typing import List
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
 
 import numpy as np
-from scipy.spatial.transform import Rotation, Slerp
 
-from linen.path.path import Path
+from linen.geometry.quaternion import (
+    make_quaternions_continuous,
+    matrices_to_quaternions,
+    quaternions_to_matrices,
+    quaternions_to_rotation_vectors,
+    slerp_angles,
+    slerp_quaternions_with_angles,
+)
+from linen.path.path import Path, PathNode, named_builder
 
+QUATERNION_CONVERSIONS = {
+    "matrix": quaternions_to_matrices,
+    "quaternion": lambda quaternions: quaternions,
+    "rotation_vector": quaternions_to_rotation_vectors,
+}
 
-def slerp_trajectory(times: List[float], orientations: List[np.ndarray]) -> Path:
+
+def quaternion_conversion(representation: str) -> Callable[[np.ndarray], np.ndarray]:
+    """The function that converts (..., 4) quaternions to the given representation: "matrix" for 3x3 orientation
+    matrices, "quaternion" for (x, y, z, w) quaternions or "rotation_vector" for axis times angle.
+
+    Args:
+        representation: The name of the representation.
+
+    Returns:
+        The conversion function.
+    """
+    if representation not in QUATERNION_CONVERSIONS:
+        raise ValueError(
+            f"Unknown orientation representation {representation}, use one of {list(QUATERNION_CONVERSIONS)}"
+        )
+    return QUATERNION_CONVERSIONS[representation]
+
+
+@dataclass(frozen=True)
+class QuaternionKeyframes:
+    """Unit quaternion keyframes with the per interval quantities that slerp needs, precomputed once.
+
+    Attributes:
+        times: The increasing times of the K keyframes, shape (K,).
+        quaternions: The normalized keyframes, made continuous so that slerp takes the shortest rotation, shape (K, 4).
+        inverse_durations: One over the duration of each interval, 0 for empty intervals, shape (K - 1,).
+        angles: The angle between the quaternions of each interval, half of the rotation angle, shape (K - 1,).
+        inverse_sin_angles: One over the sine of the angles, 1 for nearly parallel intervals, shape (K - 1,).
+        nearly_parallel: Whether the interval's quaternions are too close for slerp and are lerped, shape (K - 1,).
+    """
+
+    times: np.ndarray
+    quaternions: np.ndarray
+    inverse_durations: np.ndarray
+    angles: np.ndarray
+    inverse_sin_angles: np.ndarray
+    nearly_parallel: np.ndarray
+
+    def locate(self, sample_times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """The interval indices and the fractions within those intervals of an array of times, vectorized."""
+        indices = np.searchsorted(self.times[1:-1], sample_times, side="right")
+        fractions = (sample_times - self.times[indices]) * self.inverse_durations[indices]
+        return indices, fractions
+
+    def interpolate(self, indices: np.ndarray, fractions: np.ndarray) -> np.ndarray:
+        """The slerped unit quaternions at the given fractions of the given intervals, shape (N, 4)."""
+        return slerp_quaternions_with_angles(
+            self.quaternions[indices],
+            self.quaternions[indices + 1],
+            fractions,
+            self.angles[indices],
+            self.inverse_sin_angles[indices],
+            self.nearly_parallel[indices],
+        )
+
+
+def quaternion_keyframes(times: List[float], quaternions: np.ndarray) -> QuaternionKeyframes:
+    """Precompute the slerp intervals between unit quaternion keyframes.
+
+    Args:
+        times: The increasing times of the K keyframes, at least two.
+        quaternions: The (x, y, z, w) quaternions of the keyframes, which will be normalized, shape (K, 4).
+
+    Returns:
+        The keyframes.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    quaternions = np.asarray(quaternions, dtype=np.float64)
+    quaternions = make_quaternions_continuous(quaternions / np.linalg.norm(quaternions, axis=-1, keepdims=True))
+
+    durations = np.diff(times)
+    inverse_durations = np.divide(1.0, durations, out=np.zeros_like(durations), where=durations > 0.0)
+    angles, inverse_sin_angles, nearly_parallel = slerp_angles(quaternions[:-1], quaternions[1:])
+    return QuaternionKeyframes(times, quaternions, inverse_durations, angles, inverse_sin_angles, nearly_parallel)
+
+
+def scalar_slerp_kernel(keyframes: QuaternionKeyframes) -> Callable[[float], Tuple[int, float, np.ndarray]]:
+    """Slerp at a single time. The interval is located on Python floats, for which bisect is much faster than NumPy,
+    and the quaternion is interpolated by the batch kernel with arrays of length 1.
+
+    Args:
+        keyframes: The keyframes.
+
+    Returns:
+        A function that maps a time to its interval index, the fraction within that interval and the quaternion.
+    """
+    times, inner_times = keyframes.times.tolist(), keyframes.times[1:-1].tolist()
+    inverse_durations = keyframes.inverse_durations.tolist()
+
+    def locate_and_interpolate(t: float) -> Tuple[int, float, np.ndarray]:
+        i = bisect_right(inner_times, t)
+        fraction = (t - times[i]) * inverse_durations[i]
+        return i, fraction, keyframes.interpolate(np.array([i]), np.array([fraction]))[0]
+
+    return locate_and_interpolate
+
+
+@named_builder
+def quaternion_slerp_trajectory(times: List[float], quaternions: np.ndarray, representation: str = "matrix") -> Path:
+    """
+    Create a path of orientations by spherical linear interpolation between unit quaternion keyframes.
+
+    The angle between consecutive keyframes is precomputed, so evaluating the path at an array of times is a binary
+    search for the keyframe intervals and a few array operations, without any Python work per sample. Between two
+    keyframes, the path takes the shortest rotation.
+
+    Args:
+        times: The increasing times of the K keyframes, at least two.
+        quaternions: The orientations of the keyframes as (x, y, z, w) quaternions, shape (K, 4).
+        representation: The representation of the orientations the path returns, "matrix", "quaternion" or
+            "rotation_vector".
+
+    Returns:
+        The path of interpolated orientations.
+    """
+    convert = quaternion_conversion(representation)
+    keyframes = quaternion_keyframes(times, quaternions)
+    times, quaternions = keyframes.times, keyframes.quaternions
+
+    def batch_function(sample_times: np.ndarray) -> np.ndarray:
+        return convert(keyframes.interpolate(*keyframes.locate(sample_times)))
+
+    locate_and_interpolate = scalar_slerp_kernel(keyframes)
+
+    def function(t: float) -> np.ndarray:
+        return convert(locate_and_interpolate(t)[2])
+
+    parameters = {"times": times, "quaternions": quaternions, "representation": representation}
+    return Path(
+        function,
+        float(times[0]),
+        float(times[-1]),
+        batch_function=batch_function,
+        node=PathNode("slerp", parameters=parameters),
+    )
+
+
+@named_builder
+def slerp_trajectory(times: List[float], orientations: List[np.ndarray], representation: str = "matrix") -> Path:
     """
     Create a path of interpolated orientations. At least two orientations are required.
     The amount of orientations must equal the amount of times.
@@ -14,10 +166,11 @@ def slerp_trajectory(times: List[float], orientations: List[np.ndarray]) -> Path
     Args:
         times: The times at which the orientations are defined.
         orientations: The orientations at the given times.
+        representation: The representation of the orientations the path returns, "matrix", "quaternion" or
+            "rotation_vector".
 
     Returns:
         The path of interpolated orientations.
     """
-    orientations_scipy = Rotation.from_matrix(np.array(orientations))
-    slerp = Slerp(times, orientations_scipy)
-    return Path(lambda t: slerp(t).as_matrix(), times[0], times[-1])
+    quaternions = matrices_to_quaternions(np.array(orientations))
+    return quaternion_slerp_trajectory(times, quaternions, representation)
@@ -1,24 +1,80 @@
-from typing import Tuple
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from linen.path.path import Path
+import numpy as np
+
+from linen.path.path import Path, PathNode
+
+
+def shared_block(
+    cache: Dict[str, Any],
+    key: Any,
+    same_key: Callable[[Any, Any], bool],
+    evaluate: Callable[[], np.ndarray],
+    block: str,
+    index: Tuple,
+) -> np.ndarray:
+    # A copy of a block of the cached evaluation, which is evaluated first when the key changed or this block was read
+    # from it before. Once both blocks were read, the evaluation is released.
+    if cache["poses"] is None or block in cache["read"] or not same_key(cache["key"], key):
+        cache["key"], cache["poses"], cache["read"] = key, evaluate(), set()
+    values = cache["poses"][index].copy()
+    cache["read"].add(block)
+    if len(cache["read"]) == 2:
+        cache["key"], cache["poses"], cache["read"] = None, None, set()
+    return values
+
+
+def same_times(last_times: Optional[np.ndarray], times: np.ndarray) -> bool:
+    return last_times is not None and last_times.shape == times.shape and np.array_equal(last_times, times)
 
 
 def split_pose_path(pose_path: Path) -> Tuple[Path, Path]:
     """Split a pose path into an orientation and position path.
 
+    The two halves share their evaluations of the pose path. Sampling the orientation and the position at the same
+    times, e.g. once per control tick, therefore evaluates the pose path once. Each half returns a copy of its block,
+    so callers can modify the results in place, and the shared evaluation is released once both halves have read it.
+    Each thread shares its own evaluations, so the halves can be sampled from several threads at once.
+
     Args:
         pose_path: The pose path, that returns 4x4 pose matrices.
 
     Returns:
         The orientation path and position path.
     """
+    # Per thread, the last time(s), the pose(s) evaluated there and the blocks that were already read from them, for
+    # scalar and batch evaluation respectively.
+    caches = threading.local()
+
+    def thread_cache(evaluation: str) -> Dict[str, Any]:
+        if not hasattr(caches, evaluation):
+            setattr(caches, evaluation, {"key": None, "poses": None, "read": set()})
+        return getattr(caches, evaluation)
+
+    def scalar_block(t, block, index):
+        cache = thread_cache("scalar")
+        return shared_block(cache, t, lambda last_t, t: last_t == t, lambda: pose_path(t), block, index)
+
+    def batch_block(times, block, index):
+        cache = thread_cache("batch")
+        return shared_block(cache, times.copy(), same_times, lambda: pose_path.sample(times), block, index)
 
     def position(t):
-        return pose_path(t)[:3, 3]
+        return scalar_block(t, "position", (slice(None, 3), 3))
 
     def orientation(t):
-        return pose_path(t)[:3, :3]
+        return scalar_block(t, "orientation", (slice(None, 3), slice(None, 3)))
+
+    def positions(times):
+        return batch_block(times, "position", (slice(None), slice(None, 3), 3))
+
+    def orientations(times):
+        return batch_block(times, "orientation", (slice(None), slice(None, 3), slice(None, 3)))
 
-    position_path = Path(position, pose_path.start_time, pose_path.end_time)
-    orientation_path = Path(orientation, pose_path.start_time, pose_path.end_time)
+    start, end = pose_path.start_time, pose_path.end_time
+    position_node = PathNode("split", children=(pose_path,), parameters={"block": "position"})
+    orientation_node = PathNode("split", children=(pose_path,), parameters={"block": "orientation"})
+    position_path = Path(position, start, end, positions, node=position_node)
+    orientation_path = Path(orientation, start, end, orientations, node=orientation_node)
     return orientation_path, position_path
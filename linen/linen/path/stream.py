@@ -0,0 +1,107 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, Optional
+
+import numpy as np
+
+from linen.path.fusion import fuse
+from linen.path.path import Path
+
+
+@dataclass
+class StreamStatistics:
+    """Timing statistics of an asynchronous setpoint stream, updated while the stream is consumed.
+
+    Jitter is the delay between the moment a chunk was due and the moment it was handed to the consumer. An overrun is
+    a chunk that was not ready by the time it was due, e.g. because the consumer took too long with the previous chunk.
+    """
+
+    chunks: int = 0
+    overruns: int = 0
+    max_jitter: float = 0.0
+    total_jitter: float = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        return self.total_jitter / self.chunks if self.chunks > 0 else 0.0
+
+
+def stream_times(path: Path, rate_hz: float, chunk_size: int) -> Iterator[np.ndarray]:
+    """The setpoint times of a path at a fixed rate, in chunks. Only one chunk of times exists at any moment.
+
+    Args:
+        path: The path to stream.
+        rate_hz: The amount of setpoints per unit of time.
+        chunk_size: The amount of setpoints per chunk. The last chunk can be shorter.
+
+    Yields:
+        The times of the next chunk of setpoints, the last time is the end of the path. When the duration is not a
+        multiple of the period, the end is an extra setpoint less than one period after the last one on the grid.
+    """
+    num_setpoints = int(np.floor(path.duration * rate_hz + 1e-9)) + 1
+    if (num_setpoints - 1) / rate_hz < path.duration - 1e-9 / rate_hz:
+        num_setpoints += 1
+    for chunk_start in range(0, num_setpoints, chunk_size):
+        indices = np.arange(chunk_start, min(chunk_start + chunk_size, num_setpoints))
+        yield np.minimum(path.start_time + indices / rate_hz, path.end_time)
+
+
+def stream_setpoints(path: Path, rate_hz: float, chunk_size: int) -> Iterator[np.ndarray]:
+    """Generate the setpoints of a path at a fixed rate, in chunks that are sampled with the path's batch kernels.
+
+    Chunks are only sampled when they are requested, so memory stays bounded for long trajectories and there is no
+    large sampling step up front.
+
+    Args:
+        path: The path to stream.
+        rate_hz: The amount of setpoints per unit of time, e.g. the frequency of the controller.
+        chunk_size: The amount of setpoints per chunk. The last chunk can be shorter.
+
+    Yields:
+        Arrays of shape (chunk_size, ...) with consecutive setpoints.
+    """
+    fused = fuse(path)
+    for times in stream_times(path, rate_hz, chunk_size):
+        yield fused.sample(times)
+
+
+async def stream_setpoints_async(
+    path: Path, rate_hz: float, chunk_size: int, statistics: Optional[StreamStatistics] = None
+) -> AsyncIterator[np.ndarray]:
+    """Asynchronously generate the setpoints of a path in chunks, paced in real time against a monotonic clock.
+
+    Chunk k is due chunk_size / rate_hz * k seconds after the first chunk. Each chunk is sampled ahead of its due time
+    and handed to the consumer once it is due, without blocking the event loop while waiting.
+
+    Args:
+        path: The path to stream.
+        rate_hz: The amount of setpoints per second.
+        chunk_size: The amount of setpoints per chunk. The last chunk can be shorter.
+        statistics: Optional statistics object that is updated with the jitter and overruns of every chunk.
+
+    Yields:
+        Arrays of shape (chunk_size, ...) with consecutive setpoints.
+    """
+    if statistics is None:
+        statistics = StreamStatistics()
+
+    chunk_period = chunk_size / rate_hz
+    stream_start = 0.0
+
+    for chunk_index, setpoints in enumerate(stream_setpoints(path, rate_hz, chunk_size)):
+        ready = time.monotonic()
+        if chunk_index == 0:
+            stream_start = ready  # The clock starts when the first chunk is ready.
+
+        due = stream_start + chunk_index * chunk_period
+        if ready > due:
+            statistics.overruns += 1
+        else:
+            await asyncio.sleep(due - ready)
+
+        jitter = max(0.0, time.monotonic() - due)
+        statistics.chunks += 1
+        statistics.total_jitter += jitter
+        statistics.max_jitter = max(statistics.max_jitter, jitter)
+        yield setpoints
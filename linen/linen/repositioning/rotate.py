@@ -19,12 +19,6 @@ def rotate_trajectories(pose0: np.ndarray, pose1: np.ndarray, angle: float = np.
         _description_
     """
     rotate_axis = np.array([0, 0, 1])
-
-    # TODO: Quick fix for negative end causing problems. This should be handled in circular_arc_trajectory
-    if angle < 0:
-        angle = -angle
-        rotate_axis = -rotate_axis
-
     center = (pose0[:3, 3] + pose1[:3, 3]) / 2
     trajectory0 = circular_arc_trajectory(pose0, center, rotate_axis, angle, speed=0.1)
     trajectory1 = circular_arc_trajectory(pose1, center, rotate_axis, angle, speed=0.1)
@@ -11,7 +11,6 @@ setuptools.setup(
         "numpy",
         "scipy",
         "matplotlib",
-        "numdifftools",
     ],
     packages=find_namespace_packages(),
 )
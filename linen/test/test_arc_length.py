@@ -0,0 +1,36 @@
+import numpy as np
+
+from linen.path.circular_arc import circular_arc_position_path
+from linen.path.polynomial.catmull_rom import catmull_rom_path
+from linen.path.reparametrization.arc_length import arc_length_parametrize, arc_length_table, integrate_arc_length
+
+
+def test_arc_length_of_circular_arc():
+    radius = 2.0
+    path = circular_arc_position_path(np.array([radius, 0, 0]), np.zeros(3), np.array([0, 0, 1.0]), np.pi / 2)
+    assert np.isclose(integrate_arc_length(path), np.pi, atol=1e-6)
+
+    # Arc length parametrized, equal steps in s are equal angles on the circle.
+    parametrized = arc_length_parametrize(path)
+    arc_lengths = np.linspace(0, parametrized.end_time, 11)
+    angles = np.arctan2(*parametrized.sample(arc_lengths)[:, [1, 0]].T)
+    assert np.allclose(angles, arc_lengths / radius, atol=1e-6)
+    assert np.allclose(parametrized(1.0), parametrized.sample(np.array([1.0]))[0])
+
+
+def test_arc_length_table_of_catmull_rom():
+    points = list(np.random.default_rng(0).uniform(-1, 1, (200, 3)))
+    path = catmull_rom_path(points)
+    tolerance = 1e-6
+    table = arc_length_table(path, tolerance)
+
+    assert table.quadrature_error <= tolerance
+    assert table.inverse_error <= tolerance
+    assert np.all(np.diff(table.arc_lengths) > 0)
+
+    # The total length matches a very fine polyline approximation.
+    polyline = path.sample(np.linspace(path.start_time, path.end_time, 400001))
+    assert np.isclose(table.length, np.sum(np.linalg.norm(np.diff(polyline, axis=0), axis=1)), atol=1e-4)
+
+    # Mapping the tabulated arc lengths back gives the knots.
+    assert np.allclose(table.parameters_at(table.arc_lengths), table.parameters)
@@ -0,0 +1,30 @@
+import numpy as np
+
+from linen.folding.trajectories.circular_fold import circular_fold_trajectory
+from linen.path.linear import linear_trajectory
+
+
+def test_bake_position_trajectory_is_exact_for_linear():
+    trajectory = linear_trajectory(np.zeros(3), np.array([0.3, 0.1, 0.0]), speed=0.2)
+    baked = trajectory.bake(100)
+    times = np.linspace(-0.1, trajectory.duration + 0.1, 57)
+    assert np.allclose(baked.sample(times), trajectory.sample(times))
+    assert np.allclose(baked(0.123), trajectory(0.123))
+    assert np.allclose(baked.end, trajectory.end)
+
+
+def test_bake_pose_trajectory():
+    grasp_location = np.array([0.2, 0.0, 0.0])
+    fold_line = (np.zeros(3), np.array([0.0, 1.0, 0.0]))
+    trajectory = circular_fold_trajectory(grasp_location, np.array([1.0, 0.0, 0.0]), fold_line)
+    baked = trajectory.bake(1000)
+
+    times = np.linspace(0, trajectory.duration, 101)
+    baked_poses = baked.sample(times)
+    assert baked_poses.shape == (101, 4, 4)
+    assert np.allclose(baked_poses, trajectory.sample(times), atol=1e-5)
+
+    # The rotation blocks should remain orthonormal after interpolation.
+    orientations = baked_poses[:, :3, :3]
+    identities = orientations @ np.transpose(orientations, (0, 2, 1))
+    assert np.allclose(identities, np.identity(3))
@@ -0,0 +1,57 @@
+import numpy as np
+
+from linen.grasping.slide_grasp import slide_grasp_trajectory
+from linen.path.cache import BuilderCache, cache_key, cached_builder
+from linen.path.linear import linear_slerp_trajectory
+
+
+def test_cached_builder_hits_within_tolerance():
+    builder = cached_builder(slide_grasp_trajectory, tolerance=1e-6)
+    location, direction = np.array([0.1, 0.2, 0.0]), np.array([1.0, 1.0, 0.0])
+
+    # slide_grasp_trajectory normalizes the approach direction in place, so each call gets a fresh copy.
+    trajectory = builder(location, direction.copy())
+    assert builder(location + 1e-9, direction.copy()) is trajectory
+    assert builder(location, direction.copy(), speed=0.1) is not trajectory
+
+    statistics = builder.cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.size) == (1, 2, 2)
+
+
+def test_builder_cache_evicts_least_recently_used():
+    cache = BuilderCache(max_size=2, bake_rate_hz=100.0)
+    builder = cache.wrap(linear_slerp_trajectory)
+    poses = [np.identity(4) for _ in range(3)]
+    for i, pose in enumerate(poses):
+        pose[:3, 3] = [0.1 * (i + 1), 0.0, 0.0]
+
+    first = builder(np.identity(4), poses[0], 0.1)
+    builder(np.identity(4), poses[1], 0.1)
+    assert builder(np.identity(4), poses[0], 0.1) is first
+    builder(np.identity(4), poses[2], 0.1)  # Evicts the trajectory to poses[1].
+
+    statistics = cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.evictions, statistics.size) == (1, 3, 1, 2)
+    assert builder(np.identity(4), poses[0], 0.1) is first
+    assert np.allclose(first(first.end_time), poses[0])
+
+
+def test_cache_key_separates_values_without_bins():
+    def builder(value):
+        return value
+
+    keys = [cache_key(builder, (value,), {}, 1e-9) for value in [np.inf, -np.inf, np.nan, 2e10, -3e10]]
+    assert len(set(keys)) == len(keys)
+    assert cache_key(builder, (np.array([np.nan, 2e10]),), {}, 1e-9) == cache_key(
+        builder, (np.array([np.nan, 2e10]),), {}, 1e-9
+    )
+
+
+def test_cache_key_binds_arguments_to_parameters():
+    location, direction = np.array([0.1, 0.2, 0.0]), np.array([1.0, 0.0, 0.0])
+    builder = cached_builder(slide_grasp_trajectory)
+
+    trajectory = builder(location, direction.copy(), 0.05)
+    assert builder(location, direction.copy(), approach_distance=0.05) is trajectory
+    assert builder(grasp_location=location, approach_direction=direction.copy()) is trajectory
+    assert builder.cache.statistics().misses == 1
@@ -0,0 +1,38 @@
+import numpy as np
+
+from linen.path.circular_arc import arc_trajectory, circular_arc, circular_arc_trajectory
+from linen.path.transformation.differentation import differentiated
+
+
+def start_pose() -> np.ndarray:
+    pose = np.identity(4)
+    pose[:3, :3] = [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, -1.0]]
+    pose[:3, 3] = [0.3, 0.1, 0.2]
+    return pose
+
+
+def test_negative_angles_rotate_clockwise():
+    center, axis = np.array([0.0, 0.0, 0.5]), np.array([0.0, 0.0, 1.0])
+    clockwise = circular_arc_trajectory(start_pose(), center, axis, -np.pi / 2, speed=0.1)
+    flipped = circular_arc_trajectory(start_pose(), center, -axis, np.pi / 2, speed=0.1)
+
+    assert np.isclose(clockwise.duration, flipped.duration)
+    times = np.linspace(0.0, clockwise.duration, 20)
+    assert np.allclose(clockwise.sample(times), flipped.sample(times))
+    assert np.allclose(differentiated(clockwise).sample(times), differentiated(flipped).sample(times))
+
+
+def test_reversed_arc_and_tangents():
+    arc = circular_arc(start_pose(), np.zeros(3), np.array([0.0, 1.0, 1.0]), 3 * np.pi / 4)
+    forward = arc_trajectory(arc, speed=0.2)
+    backward = arc_trajectory(arc.reversed(), speed=0.2)
+
+    times = np.linspace(0.0, forward.duration, 20)
+    assert np.allclose(backward.sample(times), forward.sample(forward.duration - times))
+
+    # The tangents and angular velocity match the exact derivative of the trajectory.
+    angles = arc.start_angle + arc.angular_speed(0.2) * times
+    velocities = differentiated(forward).sample(times)
+    assert np.allclose(velocities[:, :3, 3], 0.2 * arc.tangents(angles))
+    angular_velocity = arc.angular_velocity(0.2)
+    assert np.allclose(velocities[:, :3, :3], np.cross(angular_velocity, arc.orientations(angles), axisb=1, axisc=1))
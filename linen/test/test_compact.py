@@ -0,0 +1,41 @@
+import io
+
+import numpy as np
+
+from linen.folding.trajectories.circular_fold import circular_fold_trajectory
+from linen.geometry.quaternion import poses_to_position_quaternions, position_quaternions_to_poses
+from linen.path.compact import position_quaternion_path
+from linen.path.serialization import load_pose_path, save_pose_path
+
+
+def fold_trajectory():
+    fold_line = (np.zeros(3), np.array([0.0, 1.0, 0.0]))
+    return circular_fold_trajectory(np.array([0.2, 0.0, 0.0]), np.array([1.0, 0.0, 0.0]), fold_line)
+
+
+def test_position_quaternion_samples_match_poses():
+    trajectory = fold_trajectory()
+    times = np.linspace(0, trajectory.duration, 101)
+    poses = trajectory.sample(times)
+
+    compact = position_quaternion_path(trajectory).sample(times, out=np.empty((101, 7), dtype=np.float32))
+    assert compact.dtype == np.float32
+    assert compact.nbytes * 4 < poses.nbytes
+    assert np.allclose(position_quaternions_to_poses(compact), poses, atol=1e-6)
+    assert np.allclose(position_quaternions_to_poses(poses_to_position_quaternions(poses)), poses)
+
+    baked = trajectory.bake(1000, representation="position_quaternion", dtype=np.float32)
+    assert baked.sample(times).shape == (101, 7)
+    assert np.allclose(position_quaternions_to_poses(baked.sample(times)), poses, atol=1e-5)
+
+
+def test_save_and_load_pose_path():
+    trajectory = fold_trajectory()
+    file = io.BytesIO()
+    save_pose_path(file, trajectory, rate_hz=500)
+    file.seek(0)
+    loaded = load_pose_path(file)
+
+    times = np.linspace(0, trajectory.duration, 101)
+    assert np.isclose(loaded.duration, trajectory.duration)
+    assert np.allclose(loaded.sample(times), trajectory.sample(times), atol=1e-5)
@@ -0,0 +1,20 @@
+import numpy as np
+
+from linen.path.concatenate import concatenate_trajectories
+from linen.path.linear import linear_trajectory
+
+
+def test_concatenate_many_segments():
+    points = np.random.default_rng(0).random((200, 3))
+    segments = [linear_trajectory(p0, p1, speed=0.5) for p0, p1 in zip(points[:-1], points[1:])]
+    trajectory = concatenate_trajectories(segments)
+
+    assert np.isclose(trajectory.duration, sum(segment.duration for segment in segments))
+
+    # Boundaries between segments and unsorted times.
+    boundaries = np.cumsum([segment.duration for segment in segments])
+    times = np.concatenate([boundaries, np.random.default_rng(1).random(100) * trajectory.duration])
+    samples = trajectory.sample(times)
+    assert np.allclose(samples, [trajectory(t) for t in times])
+    assert np.allclose(trajectory.sample(boundaries[:-1]), points[1:-1])
+    assert np.allclose(trajectory.end, points[-1])
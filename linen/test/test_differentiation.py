@@ -0,0 +1,60 @@
+import numpy as np
+
+from linen.path.circular_arc import circular_arc_trajectory
+from linen.path.linear import linear_trajectory
+from linen.path.path import Path
+from linen.path.polynomial.bezier import cubic_bezier_path
+from linen.path.polynomial.catmull_rom import catmull_rom_path
+from linen.path.reparametrization.minimum_jerk import minimum_jerk_path
+from linen.path.reparametrization.speed import scale_speed
+from linen.path.reparametrization.trapezoidal import trapezoidal_position_path
+from linen.path.transformation.differentation import differentiated, finite_difference_derivative
+
+
+def assert_derivative_is_exact(path: Path, n: int, atol: float = 1e-4):
+    assert path.derivative is not None
+    times = np.linspace(path.start_time, path.end_time, 37)[1:-1]
+    exact = differentiated(path, n).sample(times)
+    approximate = finite_difference_derivative(path, n).sample(times)
+    assert exact.shape == approximate.shape
+    assert np.allclose(exact, approximate, atol=atol)
+
+
+def test_polynomial_derivatives():
+    points = [np.array(p, dtype=float) for p in [[0, 0, 0], [1, 2, 0], [2, -1, 1], [3, 0, 0.5]]]
+    for n in [1, 2]:
+        assert_derivative_is_exact(cubic_bezier_path(*points), n)
+        assert_derivative_is_exact(minimum_jerk_path(), n)
+    assert_derivative_is_exact(catmull_rom_path(points), 1)
+    assert np.allclose(differentiated(minimum_jerk_path(), 3)(0.0), 60.0)
+
+
+def test_trajectory_derivatives():
+    trajectory = linear_trajectory(np.zeros(3), np.array([0.3, 0.4, 0.0]), speed=0.5)
+    assert np.allclose(differentiated(trajectory)(0.2), [0.3, 0.4, 0.0])
+    assert_derivative_is_exact(scale_speed(trajectory, 0.5), 1)
+
+    pose = np.identity(4)
+    pose[:3, 3] = [0.2, 0.0, 0.1]
+    arc = circular_arc_trajectory(pose, np.zeros(3), np.array([0.0, 1.0, 0.0]), np.pi / 2, speed=0.1)
+    assert_derivative_is_exact(arc, 1)
+    assert_derivative_is_exact(arc, 2)
+    speeds = np.linalg.norm(differentiated(arc).sample(np.linspace(0, arc.duration, 5))[:, :3, 3], axis=1)
+    assert np.allclose(speeds, 0.1)
+
+
+def test_trapezoidal_derivatives():
+    path = trapezoidal_position_path(0.5)
+    velocity = differentiated(path)
+    acceleration = differentiated(path, 2)
+    assert np.isclose(velocity(0.5), 4 / 3)
+    assert np.isclose(acceleration(0.1), 16 / 3)
+    assert np.isclose(acceleration(0.9), -16 / 3)
+
+
+def test_finite_difference_fallback():
+    path = Path(lambda t: np.array([np.sin(t), t**3]), 0.0, 2.0)
+    velocity = differentiated(path)
+    times = np.array([0.0, 0.5, 2.0])
+    assert np.allclose(velocity.sample(times), np.column_stack([np.cos(times), 3 * times**2]), atol=1e-5)
+    assert np.allclose(differentiated(path, 2)(1.0), [-np.sin(1.0), 6.0], atol=1e-4)
@@ -0,0 +1,32 @@
+import numpy as np
+
+from linen.folding.fold_lines.shirt import shirt_sleeve_and_side_fold_line
+from linen.folding.fold_lines.towel import towel_fold_line, towel_fold_line_batch
+
+TOWEL = np.array([[0.5, 0.25, 0.0], [-0.5, 0.25, 0.0], [-0.5, -0.25, 0.0], [0.5, -0.25, 0.0]])
+
+
+def test_towel_fold_line_batch():
+    point, direction = towel_fold_line(list(TOWEL), grasped_edge=0)
+    assert np.allclose(point, 0.0) and np.allclose(direction, [1, 0, 0])
+    assert np.allclose(towel_fold_line(list(TOWEL), grasped_edge=3)[1], [0, -1, 0])
+
+    towels = TOWEL + np.random.default_rng(0).uniform(-0.05, 0.05, (40, 4, 3))
+    edges = np.arange(40) % 4
+    points, directions = towel_fold_line_batch(towels, edges)
+    assert points.shape == directions.shape == (40, 3)
+    for i in range(40):
+        assert np.allclose(towel_fold_line(list(towels[i]), edges[i]), (points[i], directions[i]))
+
+
+def test_shirt_fold_line_batch():
+    rng = np.random.default_rng(0)
+    names = [f"{name}_{side}" for name in ["neck", "shoulder", "armpit", "waist"] for side in ["left", "right"]]
+    keypoints = {name: rng.normal(size=(30, 3)) for name in names}
+    left = np.arange(30) % 3 == 0
+    points, directions = shirt_sleeve_and_side_fold_line(keypoints, left)
+    assert points.shape == directions.shape == (30, 3)
+    for i in range(30):
+        single = {name: values[i] for name, values in keypoints.items()}
+        point, direction = shirt_sleeve_and_side_fold_line(single, left[i])
+        assert np.allclose(point, points[i]) and np.allclose(direction, directions[i])
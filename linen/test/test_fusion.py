@@ -0,0 +1,40 @@
+import numpy as np
+
+from linen.path.concatenate import concatenate_trajectories
+from linen.path.fusion import fuse
+from linen.path.linear import linear_constant_orientation_trajectory, linear_trajectory
+from linen.path.reparametrization.speed import scale_speed
+from linen.path.split import split_pose_path
+
+
+def node_kinds(path):
+    kinds = [path.node.kind if path.node is not None else None]
+    if path.node is not None:
+        for child in path.node.children:
+            kinds.extend(node_kinds(child))
+    return kinds
+
+
+def test_fuse_time_scales_and_concatenations():
+    a, b, c = np.zeros(3), np.array([0.1, 0.0, 0.0]), np.array([0.1, 0.2, 0.0])
+    inner = concatenate_trajectories([linear_trajectory(a, b, 0.1), linear_trajectory(b, c, 0.1)])
+    scaled = scale_speed(scale_speed(inner, 0.5), 0.8)
+    trajectory = concatenate_trajectories([scaled, linear_trajectory(c, a, 0.2)])
+
+    fused = fuse(trajectory)
+    assert node_kinds(fused) == ["concat", "linear", "linear", "linear"]
+
+    times = np.linspace(0, trajectory.duration, 101)
+    assert np.isclose(fused.duration, trajectory.duration)
+    assert np.allclose(fused.sample(times), trajectory.sample(times))
+
+
+def test_fuse_split_of_combine():
+    orientation = np.identity(3)
+    pose_trajectory = linear_constant_orientation_trajectory(np.zeros(3), np.ones(3), orientation, 0.5)
+    _, position_trajectory = split_pose_path(scale_speed(pose_trajectory, 2.0))
+
+    fused = fuse(position_trajectory)
+    assert node_kinds(fused) == ["linear"]
+    assert np.isclose(fused.duration, position_trajectory.duration)
+    assert np.allclose(fused(0.3), position_trajectory(0.3))
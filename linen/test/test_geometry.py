@@ -0,0 +1,44 @@
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from linen.geometry.orientation import flat_orientation, pitch_gripper_orientation, top_down_orientation
+from linen.geometry.project import project_point_on_line
+from linen.geometry.rotate import rotate_orientation, rotate_pose, rotate_vector
+
+
+def test_orientations_broadcast_over_batches():
+    rng = np.random.default_rng(0)
+    directions = np.zeros((20, 3))
+    directions[:, :2] = rng.normal(size=(20, 2))
+    angles = rng.uniform(-np.pi, np.pi, 20)
+
+    for function in [flat_orientation, top_down_orientation]:
+        orientations = function(directions)
+        assert orientations.shape == (20, 3, 3)
+        assert np.allclose(orientations, [function(direction) for direction in directions])
+
+    flat = flat_orientation(directions)
+    pitched = pitch_gripper_orientation(flat, angles)
+    assert np.allclose(pitched, [pitch_gripper_orientation(o, angle) for o, angle in zip(flat, angles)])
+    rotations = Rotation.from_rotvec(angles[:, np.newaxis] * flat[:, :, 1]).as_matrix()
+    assert np.allclose(pitched, rotations @ flat)
+
+
+def test_rotations_and_projections_broadcast_over_batches():
+    rng = np.random.default_rng(1)
+    vectors, axes, centers = rng.normal(size=(3, 20, 3))
+    angles = rng.uniform(-np.pi, np.pi, 20)
+    rotations = Rotation.from_rotvec(angles[:, np.newaxis] * axes / np.linalg.norm(axes, axis=1, keepdims=True))
+
+    assert np.allclose(rotate_vector(vectors, axes, angles), rotations.apply(vectors))
+    orientations = Rotation.random(20, random_state=2).as_matrix()
+    assert np.allclose(rotate_orientation(orientations, axes, angles), rotations.as_matrix() @ orientations)
+
+    poses = np.tile(np.identity(4), (20, 1, 1))
+    poses[:, :3, :3], poses[:, :3, 3] = orientations, vectors
+    rotated = rotate_pose(poses, centers, axes, angles)
+    assert np.allclose(rotated, [rotate_pose(*arguments) for arguments in zip(poses, centers, axes, angles)])
+
+    projected = project_point_on_line(vectors, (centers, axes))
+    assert np.allclose(projected, [project_point_on_line(v, (c, a)) for v, c, a in zip(vectors, centers, axes)])
+    assert np.allclose(np.sum((projected - vectors) * axes, axis=1), 0.0)
@@ -0,0 +1,55 @@
+import numpy as np
+
+from linen.grasping.candidates import (
+    GraspScoring,
+    approach_conflicts,
+    best_grasps,
+    shirt_grasp_candidates,
+    towel_grasp_candidates,
+)
+from linen.grasping.shirt.shirt_grasps import shirt_sleeve_and_waist_grasps
+from linen.grasping.towel.towel_grasps import towel_aligned_grasps
+
+TOWEL = np.array([[0.5, 0.25, 0.0], [-0.5, 0.25, 0.0], [-0.5, -0.25, 0.0], [0.5, -0.25, 0.0]])
+SHIRT = {
+    "neck_left": np.array([-0.05, 0.3, 0.0]),
+    "neck_right": np.array([0.05, 0.3, 0.0]),
+    "shoulder_left": np.array([-0.2, 0.25, 0.0]),
+    "shoulder_right": np.array([0.2, 0.25, 0.0]),
+    "armpit_left": np.array([-0.2, 0.1, 0.0]),
+    "armpit_right": np.array([0.2, 0.1, 0.0]),
+    "waist_left": np.array([-0.2, -0.3, 0.0]),
+    "waist_right": np.array([0.2, -0.3, 0.0]),
+    "sleeve_left_top": np.array([-0.4, 0.15, 0.0]),
+    "sleeve_right_top": np.array([0.4, 0.15, 0.0]),
+}
+
+
+def test_towel_candidates_and_ranking():
+    candidates = towel_grasp_candidates(TOWEL, insets=[0.05, 0.1], depths=[0.05])
+    assert len(candidates) == 12
+    assert np.allclose(approach_conflicts(candidates)[candidates.variants == "aligned"], 0.0)
+
+    # The candidates are the grasps of the builders with the same arguments.
+    index = np.flatnonzero((candidates.parameters["edge"] == 1) & (candidates.parameters["inset"] == 0.1))[0]
+    (location0, direction0), (location1, _) = towel_aligned_grasps(TOWEL, 0.05, 0.1, 1)
+    assert np.allclose(candidates.locations[index], [location0, location1])
+    assert np.allclose(candidates.approach_directions[index, 0], direction0)
+
+    best = best_grasps(candidates, k=3)
+    assert len(best) == 3
+    assert np.all(np.diff(best.scores) <= 0)
+    assert best.scores[0] == np.max(best_grasps(candidates, k=len(candidates)).scores)
+
+    assert len(best_grasps(candidates, k=3, scoring=GraspScoring(min_separation=2.0))) == 0
+
+
+def test_shirt_candidates():
+    candidates = shirt_grasp_candidates(SHIRT, sleeve_insets=[0.05], waist_insets=[0.1, 0.2], depths=[0.03])
+    assert len(candidates) == 4
+    for i in range(4):
+        sleeve_grasp, waist_grasp = shirt_sleeve_and_waist_grasps(
+            SHIRT, 0.05, candidates.parameters["waist_inset"][i], 0.03, candidates.parameters["left"][i]
+        )
+        assert np.allclose(candidates.locations[i], [sleeve_grasp[0], waist_grasp[0]])
+    assert np.all(np.isfinite(best_grasps(candidates, k=4).scores))
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from linen.path.reparametrization.motion_profile import double_s_profiles, trapezoidal_profiles
+from linen.path.reparametrization.s_curve import s_position_path
+from linen.path.reparametrization.trapezoidal import trapezoidal_profile_path
+from linen.path.transformation.differentation import differentiated
+
+
+def test_double_s_examples():
+    # Examples 3.9, 3.10 and 3.12 of Trajectory Planning for Automatic Machines and Robots: with and without cruise
+    # phase, and a profile that only decelerates.
+    profiles = double_s_profiles(10.0, [5.0, 10.0, 10.0], 10.0, 30.0, start_velocity=[1.0, 1.0, 7.5])
+    assert np.allclose(profiles.durations, [2.71, 2.2494, 2.6667], atol=1e-4)
+    phase_durations = np.diff(np.append(profiles.phase_start_times[0], profiles.durations[0]))
+    assert np.allclose(phase_durations, [1 / 3, 0.0667, 1 / 3, 1.1433, 1 / 3, 0.1667, 1 / 3], atol=1e-4)
+
+
+def test_double_s_batch_respects_limits():
+    rng = np.random.default_rng(0)
+    num_profiles = 1000
+    displacements = rng.choice([-1.0, 1.0], num_profiles) * rng.uniform(0.5, 2.0, num_profiles)
+    max_velocity = rng.uniform(0.2, 2.0, num_profiles)
+    max_acceleration = rng.uniform(0.2, 5.0, num_profiles)
+    max_jerk = rng.uniform(1.0, 50.0, num_profiles)
+    start_velocity = np.sign(displacements) * rng.uniform(0.0, 0.1, num_profiles) * max_velocity
+    profiles = double_s_profiles(displacements, max_velocity, max_acceleration, max_jerk, start_velocity)
+
+    times = np.linspace(0.0, 1.0, 501) * profiles.durations[:, np.newaxis]
+    positions = profiles.sample(times)
+    assert np.allclose(positions[:, 0], 0.0)
+    assert np.allclose(positions[:, -1], displacements)
+    assert np.allclose(
+        profiles.sample(times, 1)[:, [0, -1]], np.column_stack([start_velocity, np.zeros(num_profiles)])
+    )
+    for order, limit in enumerate([max_velocity, max_acceleration, max_jerk], start=1):
+        assert np.all(np.abs(profiles.sample(times, order)) <= limit[:, np.newaxis] * (1 + 1e-9))
+
+    # Without a jerk limit the profiles are trapezoidal, which is never slower.
+    trapezoidal = trapezoidal_profiles(displacements, max_velocity, max_acceleration, start_velocity)
+    assert np.all(trapezoidal.durations <= profiles.durations + 1e-12)
+
+    with pytest.raises(ValueError):
+        double_s_profiles(0.01, 1.0, 1.0, 10.0, start_velocity=1.0)
+
+
+def test_profile_paths():
+    path = s_position_path(displacement=2.0, max_velocity=1.0, max_acceleration=2.0, max_jerk=10.0)
+    times = np.linspace(0.0, path.end_time, 11)
+    profiles = double_s_profiles(2.0, 1.0, 2.0, 10.0)
+    for order in range(4):
+        assert np.allclose(differentiated(path, order).sample(times), profiles.sample(times, order)[0])
+    with pytest.raises(TypeError):
+        s_position_path(0.5)
+
+    # At rest to rest with a cruise phase, the trapezoid takes distance / velocity + velocity / acceleration.
+    path = trapezoidal_profile_path(-2.0, max_velocity=1.0, max_acceleration=2.0)
+    assert np.isclose(path.duration, 2.0 + 0.5)
+    assert np.isclose(path.end, -2.0)
+
+
+@pytest.mark.parametrize("max_jerk", [np.inf, 5.0])
+def test_profiles_at_the_velocity_limit(max_jerk):
+    # Start or end at the maximal velocity, so the acceleration or deceleration phase is empty.
+    start_velocity, end_velocity = np.array([1.0, 0.0, 1.0]), np.array([0.0, 1.0, 1.0])
+    profiles = double_s_profiles(2.0, 1.0, 1.0, max_jerk, start_velocity, end_velocity)
+    times = np.linspace(0.0, 1.0, 101) * profiles.durations[:, np.newaxis]
+
+    # Cruise for 1 s, then brake or accelerate in 1 s (trapezoidal) or 1.2 s (jerk limited) over the rest.
+    assert np.allclose(profiles.durations, [2.5, 2.5, 2.0] if np.isinf(max_jerk) else [2.6, 2.6, 2.0])
+    positions = profiles.sample(times)
+    assert np.all(np.isfinite(positions))
+    assert np.allclose(positions[:, -1], 2.0)
+    assert np.allclose(profiles.sample(times, 1)[:, [0, -1]], np.column_stack([start_velocity, end_velocity]))
@@ -0,0 +1,20 @@
+import numpy as np
+
+from linen.folding.ordered_keypoints import (
+    angle_2D,
+    get_counterclockwise_ordered_keypoints,
+    get_counterclockwise_ordered_keypoints_batch,
+)
+
+
+def test_batched_ordering_matches_single_ordering():
+    keypoints = np.random.default_rng(0).uniform(-1, 1, (100, 4, 3))
+    ordered, permutations = get_counterclockwise_ordered_keypoints_batch(keypoints)
+    assert ordered.shape == (100, 4, 3)
+    assert np.array_equal(ordered, keypoints[np.arange(100)[:, np.newaxis], permutations])
+
+    for towel_keypoints, towel_ordered in zip(keypoints, ordered):
+        center = np.mean(towel_keypoints, axis=0)
+        angles = [angle_2D(np.array([1, 0]), keypoint - center) % (2 * np.pi) for keypoint in towel_keypoints]
+        assert np.array_equal(towel_ordered, towel_keypoints[np.argsort(angles)])
+        assert np.array_equal(np.array(get_counterclockwise_ordered_keypoints(list(towel_keypoints))), towel_ordered)
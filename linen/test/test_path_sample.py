@@ -0,0 +1,168 @@
+import sys
+import threading
+
+import numpy as np
+
+from linen.folding.trajectories.circular_fold import circular_fold_trajectory
+from linen.grasping.slide_grasp import slide_grasp_trajectory
+from linen.path.circular_arc import circular_arc_path, circular_arc_position_trajectory
+from linen.path.linear import linear_path, linear_slerp_trajectory
+from linen.path.path import Path
+from linen.path.polynomial.bezier import (
+    cubic_bezier_function,
+    cubic_bezier_path,
+    quadratic_bezier_function,
+    quadratic_bezier_path,
+)
+from linen.path.polynomial.bspline import bspline_function, bspline_path
+from linen.path.polynomial.catmull_rom import catmull_rom_path
+from linen.path.polynomial.hermite import hermite_function, hermite_path
+from linen.path.reparametrization.minimum_jerk import minimum_jerk_path
+from linen.path.split import split_pose_path
+
+
+def assert_sample_matches_call(path: Path, num: int = 23):
+    # Also sample slightly outside of the domain to check the clamping.
+    times = np.linspace(path.start_time - 0.1, path.end_time + 0.1, num)
+    samples = path.sample(times)
+    expected = np.array([path(t) for t in times])
+    assert samples.shape == expected.shape
+    assert np.allclose(samples, expected)
+
+
+def test_sample_polynomials():
+    p0, p1, p2, p3 = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 0.0], [2.0, -1.0, 1.0], [3.0, 0.0, 0.5]])
+    assert_sample_matches_call(linear_path(p0, p1))
+    assert_sample_matches_call(quadratic_bezier_path(p0, p1, p2))
+    assert_sample_matches_call(cubic_bezier_path(p0, p1, p2, p3))
+    assert_sample_matches_call(hermite_path(p0, p1, p2, p3))
+    assert_sample_matches_call(bspline_path(p0, p1, p2, p3))
+    assert_sample_matches_call(catmull_rom_path([p0, p1, p2, p3]))
+    assert_sample_matches_call(minimum_jerk_path())
+
+
+def test_polynomials_match_their_closed_forms():
+    p0, p1, p2, p3 = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 0.0], [2.0, -1.0, 1.0], [3.0, 0.0, 0.5]])
+    times = np.linspace(0.0, 1.0, 11)
+    for path, function in [
+        (quadratic_bezier_path(p0, p1, p2), quadratic_bezier_function(p0, p1, p2)),
+        (cubic_bezier_path(p0, p1, p2, p3), cubic_bezier_function(p0, p1, p2, p3)),
+        (hermite_path(p0, p1, p2, p3), hermite_function(p0, p1, p2, p3)),
+        (bspline_path(p0, p1, p2, p3), bspline_function(p0, p1, p2, p3)),
+    ]:
+        assert np.allclose(path.sample(times), [function(t) for t in times])
+
+
+def test_sample_rotations():
+    pose = np.identity(4)
+    pose[:3, 3] = [0.3, 0.0, 0.1]
+    center, axis = np.zeros(3), np.array([0.0, 1.0, 1.0])
+    assert_sample_matches_call(circular_arc_path(pose, center, axis, np.pi / 2))
+    assert_sample_matches_call(circular_arc_position_trajectory(pose[:3, 3], center, axis, np.pi / 2, 0.2))
+
+    pose1 = np.identity(4)
+    pose1[:3, :3] = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    pose1[:3, 3] = [0.1, 0.2, 0.3]
+    assert_sample_matches_call(linear_slerp_trajectory(pose, pose1, 0.1))
+
+
+def test_sample_planners():
+    grasp_location = np.array([0.2, 0.0, 0.0])
+    approach_direction = np.array([1.0, 0.0, 0.0])
+    fold_line = (np.zeros(3), np.array([0.0, 1.0, 0.0]))
+    assert_sample_matches_call(slide_grasp_trajectory(grasp_location.copy(), approach_direction.copy()))
+    assert_sample_matches_call(circular_fold_trajectory(grasp_location, approach_direction, fold_line))
+
+
+def test_sample_fallback():
+    path = Path(lambda t: np.array([t, t**2]), 0.0, 2.0)
+    assert path.sample(np.array([0.0, 1.0, 3.0])).shape == (3, 2)
+    assert_sample_matches_call(path)
+
+
+def test_sample_into_buffer():
+    grasp_location = np.array([0.2, 0.0, 0.0])
+    trajectory = slide_grasp_trajectory(grasp_location, np.array([1.0, 0.0, 0.0]))
+    times = np.linspace(0, trajectory.duration, 50)
+
+    buffer = np.full((2, 50, 4, 4), np.nan)
+    result = trajectory.sample(times, out=buffer[1])
+    assert result is not None
+    assert np.shares_memory(result, buffer)
+    assert np.allclose(buffer[1], trajectory.sample(times))
+    assert np.all(np.isnan(buffer[0]))
+
+
+def test_split_shares_evaluation():
+    calls = []
+
+    def pose(t):
+        calls.append(t)
+        pose = np.identity(4)
+        pose[:3, 3] = t
+        return pose
+
+    orientation_path, position_path = split_pose_path(Path(pose, 0.0, 1.0))
+    assert np.allclose(position_path(0.5), 0.5)
+    assert np.allclose(orientation_path(0.5), np.identity(3))
+    assert calls == [0.5]
+
+    times = np.linspace(0, 1, 5)
+    assert np.allclose(position_path.sample(times)[:, 0], times)
+    orientation_path.sample(times)
+    assert len(calls) == 1 + len(times)
+
+
+def run_interleaved(target, arguments):
+    # Run the target in one thread per argument, switching threads as often as possible so that they interleave.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=target, args=(argument,)) for argument in arguments]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_split_from_two_threads():
+    end_pose = np.identity(4)
+    end_pose[:3, :3] = [[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+    end_pose[:3, 3] = [1.0, 0.0, 0.0]
+    pose_path = linear_slerp_trajectory(np.identity(4), end_pose, speed=1.0)
+    orientation_path, position_path = split_pose_path(pose_path)
+    failures = []
+
+    def sample(times):
+        expected = pose_path.sample(times)
+        try:
+            for _ in range(300):
+                for t, pose in zip(times.tolist(), expected):
+                    position, orientation = position_path(t), orientation_path(t)
+                    if not (np.allclose(position, pose[:3, 3]) and np.allclose(orientation, pose[:3, :3])):
+                        failures.append(t)
+                positions, orientations = position_path.sample(times), orientation_path.sample(times)
+                if not (np.allclose(positions, expected[:, :3, 3]) and np.allclose(orientations, expected[:, :3, :3])):
+                    failures.append(times)
+        except Exception as exception:
+            failures.append(exception)
+
+    run_interleaved(sample, [np.linspace(0.0, 0.4, 5), np.linspace(0.5, 0.9, 5)])
+    assert failures == []
+
+
+def test_split_results_can_be_modified():
+    end_pose = np.identity(4)
+    end_pose[:3, 3] = [1.0, 0.0, 0.0]
+    orientation_path, position_path = split_pose_path(linear_slerp_trajectory(np.identity(4), end_pose, speed=1.0))
+    times = np.linspace(0, 1, 5)
+
+    positions = position_path.sample(times)
+    positions[:] = np.nan
+    position = position_path(0.5)
+    position[:] = np.nan
+    assert np.allclose(orientation_path.sample(times), np.identity(3))
+    assert np.allclose(orientation_path(0.5), np.identity(3))
+    assert np.allclose(position_path(0.5), [0.5, 0.0, 0.0])
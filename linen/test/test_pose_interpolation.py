@@ -0,0 +1,47 @@
+import numpy as np
+from scipy.linalg import expm, logm
+from scipy.spatial.transform import Rotation
+
+from linen.path.fusion import fuse
+from linen.path.pose_interpolation import pose_interpolation_trajectory
+from linen.path.reparametrization.speed import scale_speed
+
+
+def random_poses(amount):
+    poses = np.tile(np.identity(4), (amount, 1, 1))
+    poses[:, :3, :3] = Rotation.random(amount, random_state=0).as_matrix()
+    poses[:, :3, 3] = np.random.default_rng(0).uniform(-1, 1, (amount, 3))
+    poses[2, :3, :3] = poses[1, :3, :3]  # An interval that is a pure translation.
+    return poses
+
+
+def test_screw_interpolation_follows_the_twist():
+    poses = random_poses(5)
+    times = np.arange(5.0)
+    path = pose_interpolation_trajectory(times, poses, mode="screw")
+
+    sample_times = np.linspace(0.0, 3.999, 50)
+    values = path.sample(sample_times)
+    for t, value in zip(sample_times, values):
+        i = int(t)
+        twist = np.real(logm(np.linalg.inv(poses[i]) @ poses[i + 1]))
+        assert np.allclose(value, poses[i] @ expm((t - i) * twist))
+    assert np.allclose(path(sample_times[7]), values[7])
+    assert np.allclose(path.sample(times), poses)
+
+
+def test_decoupled_interpolation_in_position_quaternion_form():
+    poses = random_poses(3)
+    path = pose_interpolation_trajectory([0.0, 1.0, 3.0], poses, representation="position_quaternion")
+    assert path(2.0).shape == (7,)
+    assert np.allclose(path(2.0)[:3], (poses[1, :3, 3] + poses[2, :3, 3]) / 2)
+
+    expected = pose_interpolation_trajectory([0.0, 1.0, 3.0], poses).sample(np.array([0.5]))[0]
+    position_quaternion = path.sample(np.array([0.5]))[0]
+    assert np.allclose(position_quaternion[:3], expected[:3, 3])
+    assert np.allclose(Rotation.from_quat(position_quaternion[3:]).as_matrix(), expected[:3, :3])
+
+    scaled = scale_speed(path, 2.0)
+    fused = fuse(scaled)
+    assert fused.node.kind == "pose_interpolation"
+    assert np.allclose(fused.sample(np.linspace(0, 1.5, 7)), scaled.sample(np.linspace(0, 1.5, 7)))
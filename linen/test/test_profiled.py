@@ -0,0 +1,37 @@
+import numpy as np
+
+from linen.path.circular_arc import circular_arc_position_path
+from linen.path.reparametrization.arc_length import arc_length_table
+from linen.path.reparametrization.minimum_jerk import minimum_jerk_path
+from linen.path.reparametrization.profiled import profiled_path
+from linen.path.reparametrization.s_curve import s_position_path
+from linen.path.transformation.differentation import differentiated, finite_difference_derivative
+
+
+def test_profiled_arc_follows_minimum_jerk_profile():
+    radius = 0.3
+    arc = circular_arc_position_path(np.array([radius, 0, 0]), np.zeros(3), np.array([0, 0, 1.0]), np.pi)
+    path = profiled_path(arc, minimum_jerk_path())
+
+    times = np.linspace(0, 1, 101)
+    positions = path.sample(times)
+    angles = np.unwrap(np.arctan2(positions[:, 1], positions[:, 0]))
+    assert np.allclose(angles / np.pi, minimum_jerk_path().sample(times), atol=1e-6)
+    assert np.allclose(np.linalg.norm(positions, axis=1), radius)
+
+    # At the ends of the domain the finite difference stencil is one-sided and less accurate.
+    for n in [1, 2]:
+        exact = differentiated(path, n).sample(times[1:-1])
+        approximate = finite_difference_derivative(path, n).sample(times[1:-1])
+        assert np.allclose(exact, approximate, atol=1e-5 * 10**n)
+
+
+def test_profiled_arc_with_arc_length_profile():
+    arc = circular_arc_position_path(np.array([0.3, 0, 0]), np.zeros(3), np.array([0, 0, 1.0]), np.pi / 2)
+    table = arc_length_table(arc)
+    profile = s_position_path(displacement=table.length, max_velocity=0.5, max_acceleration=1.0, max_jerk=5.0)
+    path = profiled_path(arc, profile, normalized=False, table=table)
+
+    assert np.allclose(path(path.end_time), arc(arc.end_time))
+    speeds = np.linalg.norm(differentiated(path, 1).sample(np.linspace(0, path.end_time, 1001)), axis=1)
+    assert np.isclose(speeds.max(), 0.5)
@@ -0,0 +1,56 @@
+import threading
+
+import numpy as np
+import pytest
+
+from linen.path.concatenate import concatenate_trajectories
+from linen.path.linear import linear_trajectory
+from linen.path.path import Path
+from linen.path.profiling import PathProfiler
+from linen.path.reparametrization.speed import scale_speed
+
+
+def test_profiler_counts_evaluations_per_builder():
+    segments = [linear_trajectory(np.zeros(3), np.ones(3), speed=1.0) for _ in range(3)]
+    trajectory = scale_speed(concatenate_trajectories(segments), 2.0)
+    original_call, original_sample = Path.__call__, Path.sample
+
+    with PathProfiler() as profiler:
+        trajectory.sample(np.linspace(0.0, trajectory.duration, 30))
+        trajectory(0.1)
+        with pytest.raises(RuntimeError):
+            with PathProfiler():
+                pass
+
+    # Profiling is only active inside the context.
+    assert Path.__call__ is original_call and Path.sample is original_sample
+
+    entries = profiler.by_builder()
+    assert entries["scale_speed"].calls == 2
+    assert entries["scale_speed"].samples == 31
+    # Named after the public builder, not linear_duration_trajectory which linear_trajectory delegates to.
+    assert entries["linear_trajectory"].samples == 31
+    assert entries["scale_speed"].total_time >= entries["concatenate_trajectories"].total_time
+
+    stack = "scale_speed;concatenate_trajectories;linear_trajectory"
+    assert any(line.startswith(stack + " ") for line in profiler.folded_stacks().splitlines())
+    assert "linear_trajectory" in profiler.table()
+
+
+def test_profiler_separates_threads():
+    barrier = threading.Barrier(2)
+
+    def slow(t):
+        # Both threads are inside an evaluation at the same time.
+        barrier.wait()
+        return np.zeros(3)
+
+    paths = [Path(slow, 0.0, 1.0, name="first"), Path(slow, 0.0, 1.0, name="second")]
+    with PathProfiler() as profiler:
+        threads = [threading.Thread(target=path, args=(0.5,)) for path in paths]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert set(profiler.entries) == {("first",), ("second",)}
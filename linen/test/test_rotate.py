@@ -0,0 +1,25 @@
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from linen.geometry.rotate import rotate_orientation_batch, rotate_point, rotate_point_batch, rotate_pose_batch
+
+
+def test_batched_rotations_match_scipy():
+    rng = np.random.default_rng(0)
+    axis, center, point = rng.normal(size=(3, 3))
+    orientation = Rotation.random(random_state=1).as_matrix()
+    pose = np.identity(4)
+    pose[:3, :3], pose[:3, 3] = orientation, point
+    angles = rng.uniform(-2 * np.pi, 2 * np.pi, 50)
+    rotations = Rotation.from_rotvec(np.outer(angles, axis / np.linalg.norm(axis))).as_matrix()
+
+    points = rotate_point_batch(point, center, axis, angles)
+    assert np.allclose(points, center + rotations @ (point - center))
+    assert np.allclose(rotate_point(point, center, axis, angles[0]), points[0])
+    assert np.allclose(rotate_orientation_batch(orientation, axis, angles), rotations @ orientation)
+
+    poses = rotate_pose_batch(pose, center, axis, angles)
+    assert poses.shape == (50, 4, 4)
+    assert np.allclose(poses[:, :3, :3], rotations @ orientation)
+    assert np.allclose(poses[:, :3, 3], points)
+    assert np.allclose(poses[:, 3], [0, 0, 0, 1])
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation, Slerp
+
+from linen.path.slerp import quaternion_slerp_trajectory, slerp_trajectory
+
+
+def test_slerp_matches_scipy():
+    rotations = Rotation.random(50, random_state=0)
+    times = np.cumsum(np.random.default_rng(0).uniform(0.1, 1.0, 50)) - 0.1
+    reference = Slerp(times, rotations)
+    sample_times = np.random.default_rng(1).uniform(times[0], times[-1], 1000)
+    expected = reference(sample_times).as_matrix()
+
+    path = slerp_trajectory(list(times), rotations.as_matrix())
+    assert np.allclose(path.sample(sample_times), expected)
+    assert np.allclose(path(sample_times[0]), expected[0])
+
+    rotation_vectors = quaternion_slerp_trajectory(times, rotations.as_quat(), "rotation_vector").sample(sample_times)
+    assert np.allclose(Rotation.from_rotvec(rotation_vectors).as_matrix(), expected)
+
+    quaternion_path = quaternion_slerp_trajectory(times, rotations.as_quat(), "quaternion")
+    assert quaternion_path(sample_times[0]).shape == (4,)
+    assert np.allclose(Rotation.from_quat(quaternion_path.sample(sample_times)).as_matrix(), expected)
+
+    with pytest.raises(ValueError):
+        quaternion_slerp_trajectory(times, rotations.as_quat(), "euler")
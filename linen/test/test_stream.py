@@ -0,0 +1,39 @@
+import asyncio
+
+import numpy as np
+
+from linen.path.linear import linear_trajectory
+from linen.path.stream import StreamStatistics, stream_setpoints_async, stream_times
+
+
+def test_stream_chunks():
+    trajectory = linear_trajectory(np.zeros(3), np.array([1.0, 0.0, 0.0]), speed=1.0)
+    chunks = list(trajectory.stream(rate_hz=100, chunk_size=32))
+
+    assert [len(chunk) for chunk in chunks] == [32, 32, 32, 5]
+    setpoints = np.concatenate(chunks)
+    assert np.allclose(setpoints, trajectory.sample(np.arange(101) / 100))
+
+
+def test_stream_ends_at_end_of_path():
+    # 1.005 s is not a multiple of the 10 ms period, the end is streamed as an extra setpoint after t = 1.0.
+    trajectory = linear_trajectory(np.zeros(3), np.array([1.005, 0.0, 0.0]), speed=1.0)
+    times = np.concatenate(list(stream_times(trajectory, rate_hz=100, chunk_size=32)))
+
+    assert len(times) == 102
+    assert np.allclose(times[:-1], np.arange(101) / 100)
+    assert times[-1] == trajectory.end_time
+    assert np.allclose(np.concatenate(list(trajectory.stream(rate_hz=100, chunk_size=32)))[-1], trajectory.end)
+
+
+def test_stream_async_pacing():
+    trajectory = linear_trajectory(np.zeros(3), np.array([0.1, 0.0, 0.0]), speed=1.0)
+    statistics = StreamStatistics()
+
+    async def consume():
+        return [chunk async for chunk in stream_setpoints_async(trajectory, 200, 5, statistics)]
+
+    chunks = asyncio.run(consume())
+    assert len(np.concatenate(chunks)) == 21
+    assert statistics.chunks == len(chunks)
+    assert statistics.mean_jitter <= statistics.max_jitter
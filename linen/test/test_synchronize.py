@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from linen.path.constant import constant_trajectory
+from linen.path.linear import linear_trajectory
+from linen.path.reparametrization.synchronize import synchronize_phases
+
+
+def test_synchronize_phases():
+    points = [np.array([0.1 * i, 0.0, 0.0]) for i in range(4)]
+    phases = [
+        [linear_trajectory(points[0], points[1], 0.1), linear_trajectory(points[1], points[3], 0.1)],
+        [linear_trajectory(points[0], points[2], 0.1), linear_trajectory(points[2], points[3], 0.1)],
+        [linear_trajectory(points[0], points[3], 0.1), constant_trajectory(points[3], 0.0)],
+    ]
+    synchronized = synchronize_phases(phases)
+
+    # Each phase lasts as long as its slowest arm, the third arm waits during the instantaneous second phase.
+    assert np.allclose(synchronized.phase_end_times, [3.0, 5.0])
+    assert np.allclose(synchronized(3.0), np.stack([points[1], points[2], points[3]]))
+
+    times = np.linspace(0.0, synchronized.duration, 101)
+    values = synchronized.sample(times)
+    assert values.shape == (3, 101, 3)
+    for arm in range(3):
+        assert np.allclose(values[arm], [synchronized.trajectories[arm](t) for t in times])
+    assert np.allclose(np.concatenate(list(synchronized.stream(rate_hz=20, chunk_size=32)), axis=1), values)
+
+    # At 3 Hz, the 5 s duration is not a multiple of the period, but the last setpoints are still the end poses.
+    streamed = np.concatenate(list(synchronized.stream(rate_hz=3, chunk_size=4)), axis=1)
+    assert np.allclose(streamed[:, -1], np.stack([points[3]] * 3))
+
+    with pytest.raises(ValueError):
+        synchronize_phases([phases[0], phases[1][:1]])
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from linen.path.circular_arc import circular_arc_position_path
+from linen.path.concatenate import concatenate_trajectories
+from linen.path.linear import linear_trajectory
+from linen.path.polynomial.bspline import bspline_path
+from linen.path.polynomial.catmull_rom import catmull_rom_path
+from linen.path.reparametrization.arc_length import integrate_arc_length
+from linen.path.reparametrization.time_optimal import (
+    CartesianLimits,
+    limit_groups,
+    segment_jerks,
+    time_optimal_parametrization,
+    time_optimal_trajectory,
+)
+
+
+def sampled_speeds_and_accelerations(trajectory, num_samples=20001):
+    times = np.linspace(0, trajectory.end_time, num_samples)
+    step = times[1]
+    velocities = np.gradient(trajectory.sample(times), step, axis=0)
+    accelerations = np.gradient(velocities, step, axis=0)
+    return np.linalg.norm(velocities, axis=-1), np.linalg.norm(accelerations, axis=-1)
+
+
+def test_time_optimal_catmull_rom_respects_limits():
+    points = list(np.random.default_rng(0).uniform(-0.3, 0.3, (10, 3)))
+    path = catmull_rom_path(points)
+    limits = CartesianLimits(linear_velocity=0.5, linear_acceleration=2.0)
+    trajectory = time_optimal_trajectory(path, limits)
+
+    speeds, accelerations = sampled_speeds_and_accelerations(trajectory)
+    assert speeds.max() <= limits.linear_velocity * 1.001
+    assert accelerations[2:-2].max() <= limits.linear_acceleration * 1.01
+    assert np.allclose(trajectory(0.0), path(path.start_time))
+    assert np.allclose(trajectory(trajectory.end_time), path(path.end_time))
+
+    # Faster than traversing the same path at the maximal constant speed, which isn't even feasible.
+    assert trajectory.duration < 1.2 * integrate_arc_length(path) / limits.linear_velocity
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("spline", ["catmull_rom", "bspline"])
+def test_time_optimal_random_splines(seed, spline):
+    # The knots of these splines are smooth joints of concatenations, where only the curvature jumps. They must not
+    # stop the motion, and the acceleration limit must hold on both sides of them.
+    points = np.random.default_rng(seed).uniform(-0.5, 0.5, (20, 3))
+    if spline == "catmull_rom":
+        path = catmull_rom_path(list(points))
+    else:
+        path = concatenate_trajectories([bspline_path(*points[i : i + 4]) for i in range(len(points) - 3)])
+    limits = CartesianLimits(linear_velocity=0.5, linear_acceleration=1.0)
+
+    parametrization = time_optimal_parametrization(path, limits)
+    assert np.all(np.diff(parametrization.times) > 0.0)
+    assert np.all(parametrization.parameter_speeds[1:-1] > 0.0)
+
+    # The limits are met at the grid points, between them the speed of the path itself varies a little.
+    speeds, accelerations = sampled_speeds_and_accelerations(time_optimal_trajectory(path, limits))
+    assert speeds.max() <= limits.linear_velocity * 1.005
+    assert accelerations[2:-2].max() <= limits.linear_acceleration * 1.01
+
+
+def test_time_optimal_stops_at_corners():
+    pose0, pose1, pose2 = np.identity(4), np.identity(4), np.identity(4)
+    pose1[:3, 3] = [0.2, 0.0, 0.0]
+    pose2[:3, 3] = [0.2, 0.2, 0.0]
+    path = concatenate_trajectories([linear_trajectory(pose0, pose1, 0.1), linear_trajectory(pose1, pose2, 0.1)])
+    parametrization = time_optimal_parametrization(path, CartesianLimits(linear_velocity=1.0, linear_acceleration=1.0))
+
+    # Each straight segment is a bang-bang motion, accelerating for half of it and braking for the other half.
+    assert np.isclose(parametrization.duration, 4 * np.sqrt(0.2 / 1.0), rtol=1e-3)
+    assert parametrization.parameter_speeds[np.searchsorted(parametrization.parameters, 2.0)] == 0.0
+
+
+def test_time_optimal_jerk_limit():
+    path = circular_arc_position_path(np.array([0.3, 0, 0]), np.zeros(3), np.array([0, 0, 1.0]), np.pi)
+    limits = CartesianLimits(linear_velocity=0.5, linear_acceleration=1.0, linear_jerk=5.0)
+    parametrization = time_optimal_parametrization(path, limits)
+
+    group = limit_groups(path, parametrization.parameters, limits)[0]
+    x = parametrization.parameter_speeds**2
+    durations = np.diff(parametrization.times)
+    jerks = segment_jerks(group, x, parametrization.parameter_accelerations, durations)
+    assert jerks.max() <= limits.linear_jerk * 1.01
+
+    unlimited = time_optimal_parametrization(path, CartesianLimits(linear_velocity=0.5, linear_acceleration=1.0))
+    assert unlimited.duration < parametrization.duration < 2 * unlimited.duration
+
+    with pytest.raises(ValueError):
+        time_optimal_parametrization(path, CartesianLimits(linear_velocity=0.5, linear_jerk=5.0))
+
+
+def test_time_optimal_short_segment_between_corners():
+    # The middle segment is shorter than the grid spacing, and both of its ends are corners where the motion stops.
+    points = [np.array(point, dtype=np.float64) for point in [[0, 0, 0], [1, 0, 0], [1, 0.0005, 0], [2, 0.0005, 0]]]
+    path = concatenate_trajectories([linear_trajectory(a, b, 1.0) for a, b in zip(points[:-1], points[1:])])
+    limits = CartesianLimits(linear_velocity=0.5, linear_acceleration=2.0)
+    parametrization = time_optimal_parametrization(path, limits)
+
+    # Accelerating from rest over half of the segment and braking over the other half.
+    start, end = np.searchsorted(parametrization.parameters, [1.0, 1.0005])
+    duration = parametrization.times[end] - parametrization.times[start]
+    assert np.isclose(duration, 2 * np.sqrt(0.0005 / limits.linear_acceleration), rtol=0.02)
+
+    trajectory = time_optimal_trajectory(path, limits)
+    assert np.isfinite(trajectory.duration)
+    assert np.allclose(trajectory(trajectory.end_time), points[-1])
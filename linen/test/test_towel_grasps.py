@@ -0,0 +1,49 @@
+import numpy as np
+
+from linen.folding.ordered_keypoints import get_counterclockwise_ordered_keypoints_batch
+from linen.grasping.towel.towel_grasps import (
+    towel_aligned_grasps,
+    towel_aligned_grasps_batch,
+    towel_twisted_grasps,
+    towel_twisted_grasps_batch,
+)
+
+# A 1 x 0.5 towel, ordered counterclockwise starting from the top right corner.
+SQUARE_TOWEL = np.array([[0.5, 0.25, 0.0], [-0.5, 0.25, 0.0], [-0.5, -0.25, 0.0], [0.5, -0.25, 0.0]])
+
+
+def random_towels(amount):
+    rng = np.random.default_rng(0)
+    towels = SQUARE_TOWEL + rng.uniform(-0.05, 0.05, (amount, 4, 3))
+    ordered, _ = get_counterclockwise_ordered_keypoints_batch(towels)
+    return ordered
+
+
+def test_aligned_grasps_batch():
+    towels = random_towels(50)
+    edges = np.arange(50) % 4
+    insets, depths = np.linspace(0.02, 0.1, 50), np.linspace(0.1, 0.03, 50)
+    locations, directions = towel_aligned_grasps_batch(towels, depths, insets, edges)
+    assert locations.shape == directions.shape == (50, 2, 3)
+    for i in range(50):
+        (location0, direction0), (location1, direction1) = towel_aligned_grasps(
+            towels[i], depths[i], insets[i], edges[i]
+        )
+        assert np.allclose(locations[i], [location0, location1])
+        assert np.allclose(directions[i], [direction0, direction1])
+
+
+def test_twisted_grasps_batch():
+    (top, top_direction), (bottom, bottom_direction) = towel_twisted_grasps(list(SQUARE_TOWEL), 0.05, 0.1)
+    assert np.allclose(top, [0.4, 0.2, 0.0]) and np.allclose(top_direction, [0, -1, 0])
+    assert np.allclose(bottom, [-0.4, -0.2, 0.0]) and np.allclose(bottom_direction, [0, 1, 0])
+
+    towels = random_towels(50)
+    near0 = np.arange(50) % 2 == 0
+    locations, directions = towel_twisted_grasps_batch(towels, 0.05, 0.1, near0)
+    for i in range(50):
+        (top, top_direction), (bottom, bottom_direction) = towel_twisted_grasps(towels[i], 0.05, 0.1, near0[i])
+        assert np.array_equal(locations[i], [top, bottom])
+        assert np.array_equal(directions[i], [top_direction, bottom_direction])
+    assert np.allclose(directions[:, :, 2], 0.0)
+    assert np.allclose(np.linalg.norm(directions, axis=-1), 1.0)
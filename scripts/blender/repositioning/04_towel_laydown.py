@@ -14,7 +14,7 @@ from linen.grasping.slide_grasp import slide_grasp_trajectory
 from linen.grasping.towel.towel_grasps import towel_aligned_grasps, towel_edges_adjacent_to_edge
 from linen.path.concatenate import concatenate_trajectories
 from linen.path.linear import linear_slerp_trajectory
-from linen.path.reparametrization.synchronize import synchronize
+from linen.path.reparametrization.synchronize import synchronize_phases
 
 bpy.ops.object.delete()
 
@@ -146,21 +146,22 @@ laydown_pose_right[:3, 3] = laydown_location_right
 
 lift_trajectory_left = linear_slerp_trajectory(grasp_trajectory_left.end, lift_pose_left, 0.2)
 lift_trajectory_right = linear_slerp_trajectory(grasp_trajectory_right.end, lift_pose_right, 0.2)
-lift_trajectory_left, lift_trajectory_right = synchronize(lift_trajectory_left, lift_trajectory_right)
 
 laydown_trajectory_left = linear_slerp_trajectory(lift_trajectory_left.end, laydown_pose_left, 0.2)
 laydown_trajectory_right = linear_slerp_trajectory(lift_trajectory_right.end, laydown_pose_right, 0.2)
-laydown_trajectory_left, laydown_trajectory_right = synchronize(laydown_trajectory_left, laydown_trajectory_right)
 
 retreat_trajectory_left = move_gripper_backwards_trajectory(laydown_trajectory_left.end, grasp_depth, 0.1)
 retreat_trajectory_right = move_gripper_backwards_trajectory(laydown_trajectory_right.end, grasp_depth, 0.1)
 
-trajectory_left = concatenate_trajectories(
-    [grasp_trajectory_left, lift_trajectory_left, laydown_trajectory_left, retreat_trajectory_left]
-)
-trajectory_right = concatenate_trajectories(
-    [grasp_trajectory_right, lift_trajectory_right, laydown_trajectory_right, retreat_trajectory_right]
+# Only the lift and laydown phases are synchronized, in which both arms hold the towel. Each lasts as long as the
+# slowest arm needs for it. The arms grasp and retreat independently.
+synchronized = synchronize_phases(
+    [[lift_trajectory_left, laydown_trajectory_left], [lift_trajectory_right, laydown_trajectory_right]]
 )
+held_trajectory_left, held_trajectory_right = synchronized.trajectories
+
+trajectory_left = concatenate_trajectories([grasp_trajectory_left, held_trajectory_left, retreat_trajectory_left])
+trajectory_right = concatenate_trajectories([grasp_trajectory_right, held_trajectory_right, retreat_trajectory_right])
 
 
 # Visualization